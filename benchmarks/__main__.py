@@ -0,0 +1,67 @@
+"""
+Run the benchmark suite, from the root of the repository, and store the
+results as JSON.
+
+    python -m benchmarks --output benchmarks/results/3.2.0.json
+    python -m benchmarks --quick --compare benchmarks/results/3.2.0.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from benchmarks import suite  # noqa: F401
+from benchmarks.harness import BENCHMARKS, compare, run_benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "names",
+        nargs="*",
+        help="Only run these benchmarks: {}.".format(
+            ", ".join(spec["name"] for spec in BENCHMARKS)
+        ),
+    )
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument(
+        "--compare", help="Compare the results with those of this JSON file."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Slowdown flagged as a regression (default: 0.1, i.e. 10%%).",
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only run the first value of every parameter.",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        names=args.names, rounds=args.rounds, quick=args.quick, log=print
+    )
+
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2)
+
+    if args.compare:
+        with open(args.compare) as previous:
+            comparison = compare(json.load(previous), results, args.threshold)
+        print(comparison.to_string(index=False))
+        if comparison["regression"].any():
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import requests
+
+import canvasapi
+
+# Every registered benchmark, in the order it was registered.
+BENCHMARKS = []
+
+
+def benchmark(name, number=1, **params):
+    """
+    Register a benchmark, run once for every combination of the given
+    parameter values.
+
+    The decorated function is a generator. It receives one value of each
+    parameter as keyword arguments, prepares what it needs, yields the
+    function to time (called without arguments) and cleans up after the
+    `yield`. It may yield a `(function, info)` tuple instead, where `info`
+    is a dict of measurements other than time, such as the size of a
+    payload, stored with the results.
+
+    :param name: The name the results are stored under.
+    :type name: str
+    :param number: How many times the timed function is called per round.
+        Results are reported per call.
+    :type number: int
+    :param params: The values of every parameter, as lists.
+    """
+
+    def register(func):
+        BENCHMARKS.append(
+            {"name": name, "func": func, "number": number, "params": params}
+        )
+        return func
+
+    return register
+
+
+def compare(previous, current, threshold=0.1):
+    """
+    Compare two result files and return one row per benchmark present in
+    both.
+
+    :param previous: The results of the baseline run.
+    :type previous: dict
+    :param current: The results of the new run.
+    :type current: dict
+    :param threshold: How much slower (0.1 for 10%) the median of a
+        benchmark may get before it is flagged as a regression.
+    :type threshold: float
+
+    :rtype: :class:`pandas.DataFrame`
+    """
+    baseline = {_get_key(result): result for result in previous["benchmarks"]}
+
+    rows = []
+    for result in current["benchmarks"]:
+        before = baseline.get(_get_key(result))
+        if before is None:
+            continue
+
+        ratio = result["median"] / before["median"] if before["median"] else None
+        rows.append(
+            {
+                "name": result["name"],
+                "params": json.dumps(result["params"], sort_keys=True),
+                "previous_median": before["median"],
+                "median": result["median"],
+                "ratio": ratio,
+                "regression": ratio is not None and ratio > 1 + threshold,
+            }
+        )
+
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "name",
+            "params",
+            "previous_median",
+            "median",
+            "ratio",
+            "regression",
+        ],
+    )
+
+
+def get_environment():
+    """
+    Describe the interpreter, libraries and machine the benchmarks run on.
+
+    :rtype: dict
+    """
+    return {
+        "canvasapi": canvasapi.__version__,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "pandas": pd.__version__,
+        "requests": requests.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def run_benchmarks(names=None, rounds=5, quick=False, log=None):
+    """
+    Run the registered benchmarks.
+
+    :param names: Only run the benchmarks with these names.
+    :type names: list of str
+    :param rounds: How many times every benchmark is timed. The first call
+        is a warm-up and is not timed.
+    :type rounds: int
+    :param quick: Only run the first value of every parameter, e.g. to
+        check the suite works.
+    :type quick: bool
+    :param log: Called with a line of text after every benchmark.
+    :type log: callable
+
+    :returns: The results, ready to be written as JSON.
+    :rtype: dict
+    """
+    results = []
+    for spec in BENCHMARKS:
+        if names and spec["name"] not in names:
+            continue
+
+        keys = list(spec["params"])
+        values = [spec["params"][key] for key in keys]
+        if quick:
+            values = [value[:1] for value in values]
+
+        for combination in itertools.product(*values):
+            params = dict(zip(keys, combination))
+            result = _run(spec, params, rounds)
+            results.append(result)
+
+            if log:
+                line = "{} {}: median {:.6f}s per call".format(
+                    spec["name"], params, result["median"]
+                ).replace(" {}:", ":")
+                if "info" in result:
+                    line += " {}".format(result["info"])
+                log(line)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": get_environment(),
+        "rounds": rounds,
+        "benchmarks": results,
+    }
+
+
+def _get_key(result):
+    return result["name"], json.dumps(result["params"], sort_keys=True)
+
+
+def _run(spec, params, rounds):
+    steps = spec["func"](**params)
+    func = next(steps)
+    info = None
+    if isinstance(func, tuple):
+        func, info = func
+    number = spec["number"]
+
+    try:
+        func()
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter() - start) / number)
+    finally:
+        # Run the cleanup that follows the `yield`.
+        next(steps, None)
+
+    result = {
+        "name": spec["name"],
+        "params": params,
+        "number": number,
+        "rounds": rounds,
+        "min": min(timings),
+        "max": max(timings),
+        "mean": statistics.mean(timings),
+        "median": statistics.median(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+    if info is not None:
+        result["info"] = info
+    return result
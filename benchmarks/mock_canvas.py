@@ -0,0 +1,105 @@
+import re
+from urllib.parse import parse_qsl, urlsplit
+
+import requests_mock
+
+from canvasapi import Canvas
+
+BASE_URL = "https://canvas.benchmark"
+API_URL = BASE_URL + "/api/v1/"
+
+
+def make_user(user_id):
+    """
+    Return the JSON of a user, the size of what Canvas sends for a roster.
+
+    :param user_id: The ID of the user.
+    :type user_id: int
+
+    :rtype: dict
+    """
+    return {
+        "id": user_id,
+        "name": "User {}".format(user_id),
+        "sortable_name": "{}, User".format(user_id),
+        "short_name": "User {}".format(user_id),
+        "sis_user_id": "SIS{:07d}".format(user_id),
+        "login_id": "user{}@example.edu".format(user_id),
+        "email": "user{}@example.edu".format(user_id),
+        "created_at": "2024-01-01T00:00:00Z",
+        "locale": None,
+        "enrollments": [{"type": "StudentEnrollment", "enrollment_state": "active"}],
+    }
+
+
+class MockCanvas(object):
+    """
+    Answers the requests of a :class:`canvasapi.canvas.Canvas` in process,
+    with `requests_mock`, so benchmarks measure the library rather than the
+    network.
+
+    `GET users` returns `pages` pages of `per_page` users with `next` and
+    `last` Link headers, `GET users/:id` returns a single user and
+    `PUT courses/:id/custom_gradebook_column_data` a queued progress.
+
+    >>> with MockCanvas(pages=10) as canvas:
+    ...     canvas.get_course(1)
+    """
+
+    def __init__(self, pages=1, per_page=100):
+        """
+        :param pages: How many pages listings have.
+        :type pages: int
+        :param per_page: How many rows every page has.
+        :type per_page: int
+        """
+        self.pages = pages
+        self.per_page = per_page
+        self.mocker = requests_mock.Mocker()
+        self._page_data = {}
+
+    def __enter__(self):
+        self.mocker.start()
+        self.mocker.get(re.compile(re.escape(API_URL) + r"users/\d+$"), json=self._user)
+        self.mocker.get(
+            re.compile(re.escape(API_URL) + r"users(\?.*)?$"), json=self._users
+        )
+        self.mocker.post(re.compile(re.escape(API_URL) + r"echo"), json={})
+        self.mocker.put(
+            re.compile(
+                re.escape(API_URL) + r"courses/\d+/custom_gradebook_column_data"
+            ),
+            json={"id": 1, "workflow_state": "queued"},
+        )
+        return Canvas(BASE_URL, "benchmark-token")
+
+    def __exit__(self, *exc_info):
+        self.mocker.stop()
+
+    def _user(self, request, context):
+        return make_user(int(urlsplit(request.url).path.rsplit("/", 1)[1]))
+
+    def _users(self, request, context):
+        page = int(dict(parse_qsl(urlsplit(request.url).query)).get("page", 1))
+
+        links = []
+        if page < self.pages:
+            links.append(
+                '<{}users?page={}&per_page={}>; rel="next"'.format(
+                    API_URL, page + 1, self.per_page
+                )
+            )
+        links.append(
+            '<{}users?page={}&per_page={}>; rel="last"'.format(
+                API_URL, self.pages, self.per_page
+            )
+        )
+        context.headers["Link"] = ", ".join(links)
+
+        # Pages are built once; the benchmarks measure the client.
+        if page not in self._page_data:
+            start = (page - 1) * self.per_page
+            self._page_data[page] = [
+                make_user(user_id) for user_id in range(start, start + self.per_page)
+            ]
+        return self._page_data[page]
@@ -0,0 +1,609 @@
+"""
+A local stand-in for Canvas to load-test clients against.
+
+It serves synthetic accounts, courses, users, enrollments, assignments and
+submissions over real HTTP, with Canvas' pagination `Link` headers, a
+leaky-bucket rate limit reported through `X-Rate-Limit-Remaining` and
+`X-Request-Cost`, and optional latency and server errors.
+
+In process:
+
+>>> with CanvasSimulator(courses=3, users=500, latency=0.05) as simulator:
+...     canvas = Canvas(simulator.url, "any-token")
+...     canvas.get_course(1).get_users().to_dataframe(max_workers=8)
+
+As a subprocess, from the root of the repository:
+
+    python -m benchmarks.simulator --port 8000 --users 10000 --error-rate 0.01
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class RateLimiter(object):
+    """
+    Canvas' rate limit: a bucket that fills with the cost of every request
+    and leaks at a constant rate. Requests are refused while the bucket is
+    full. Every request in flight holds an up-front penalty, so many
+    concurrent requests are throttled sooner than the same number in a row.
+    """
+
+    def __init__(self, capacity=700.0, leak_rate=10.0, penalty=50.0):
+        """
+        :param capacity: How much the bucket holds.
+        :type capacity: float
+        :param leak_rate: How much leaks out of the bucket every second.
+        :type leak_rate: float
+        :param penalty: What a request holds while it is in flight.
+        :type penalty: float
+        """
+        self.capacity = capacity
+        self.leak_rate = leak_rate
+        self.penalty = penalty
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def _leak(self, token):
+        now = time.monotonic()
+        level, updated = self._buckets.get(token, (0.0, now))
+        level = max(0.0, level - (now - updated) * self.leak_rate)
+        self._buckets[token] = (level, now)
+        return level
+
+    def acquire(self, token):
+        """
+        Reserve the up-front penalty of a request.
+
+        :returns: The remaining allowance, negative if the request must be
+            refused.
+        :rtype: float
+        """
+        with self._lock:
+            level = self._leak(token)
+            remaining = self.capacity - level - self.penalty
+            if remaining >= 0:
+                self._buckets[token] = (level + self.penalty, time.monotonic())
+            return remaining
+
+    def release(self, token, cost):
+        """
+        Replace the penalty of a finished request by its actual cost.
+
+        :returns: The remaining allowance.
+        :rtype: float
+        """
+        with self._lock:
+            level = max(0.0, self._leak(token) - self.penalty + cost)
+            self._buckets[token] = (level, time.monotonic())
+            return self.capacity - level
+
+
+class CanvasSimulator(object):
+    """
+    Serves synthetic Canvas data on a local port from a background thread.
+
+    Supported endpoints (all under `/api/v1/`):
+
+    - `accounts/:id/courses`, `courses`, `courses/:id`
+    - `courses/:id/users`, `courses/:id/search_users`,
+      `courses/:id/enrollments`, `users/:id`
+    - `courses/:id/assignments`, `courses/:id/assignments/:id`
+    - `courses/:id/assignments/:id/submissions`,
+      `courses/:id/students/submissions`
+    """
+
+    def __init__(
+        self,
+        courses=10,
+        users=1000,
+        students_per_course=100,
+        assignments_per_course=10,
+        host="127.0.0.1",
+        port=0,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        rate_limiter=None,
+        cost_per_row=0.1,
+        seed=0,
+    ):
+        """
+        :param courses: How many courses there are.
+        :type courses: int
+        :param users: How many users there are.
+        :type users: int
+        :param students_per_course: How many users are enrolled in each
+            course.
+        :type students_per_course: int
+        :param assignments_per_course: How many assignments each course has.
+        :type assignments_per_course: int
+        :param host: The address to listen on.
+        :type host: str
+        :param port: The port to listen on, or 0 for any free port.
+        :type port: int
+        :param latency: Seconds every response is delayed by.
+        :type latency: float
+        :param jitter: Up to how many seconds are randomly added to the
+            latency.
+        :type jitter: float
+        :param error_rate: The probability that a request fails with a
+            500, 502 or 503 response.
+        :type error_rate: float
+        :param rate_limiter: The rate limit of every access token, or None
+            for no limit.
+        :type rate_limiter: :class:`RateLimiter`
+        :param cost_per_row: The rate limit cost of every row returned, on
+            top of a base cost of 1 per request.
+        :type cost_per_row: float
+        :param seed: Seeds the random latency and errors.
+        :type seed: int
+        """
+        self.courses = courses
+        self.users = users
+        self.students_per_course = min(students_per_course, users)
+        self.assignments_per_course = assignments_per_course
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limiter = rate_limiter
+        self.cost_per_row = cost_per_row
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._injected_errors = []
+        self._in_flight = 0
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "throttled": 0,
+            "max_concurrency": 0,
+            "connections": 0,
+        }
+
+        self._routes = [
+            (r"accounts/\d+/courses", self._list_courses),
+            (r"courses", self._list_courses),
+            (r"courses/(\d+)", self._get_course),
+            (r"courses/(\d+)/(?:search_)?users", self._list_course_users),
+            (r"courses/(\d+)/enrollments", self._list_enrollments),
+            (r"courses/(\d+)/assignments", self._list_assignments),
+            (r"courses/(\d+)/assignments/(\d+)", self._get_assignment),
+            (r"courses/(\d+)/assignments/(\d+)/submissions", self._list_submissions),
+            (r"courses/(\d+)/students/submissions", self._list_course_submissions),
+            (r"users/(\d+)", self._get_user),
+        ]
+        self._routes = [
+            (re.compile("^/api/v1/{}/?$".format(pattern)), handler)
+            for pattern, handler in self._routes
+        ]
+
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def url(self):
+        """
+        The base URL to create a :class:`canvasapi.canvas.Canvas` with.
+
+        :rtype: str
+        """
+        host, port = self._server.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def _get_assignment(self, course_id, assignment_id):
+        course_id, assignment_id = int(course_id), int(assignment_id)
+        if assignment_id not in self._get_assignment_ids(course_id):
+            return None
+        return self._make_assignment(course_id, assignment_id)
+
+    def _get_assignment_ids(self, course_id):
+        if not 1 <= course_id <= self.courses:
+            return []
+        first = (course_id - 1) * self.assignments_per_course + 1
+        return range(first, first + self.assignments_per_course)
+
+    def _get_course(self, course_id):
+        course_id = int(course_id)
+        if not 1 <= course_id <= self.courses:
+            return None
+        return self._make_course(course_id)
+
+    def _get_student_ids(self, course_id):
+        if not 1 <= course_id <= self.courses:
+            return []
+        first = (course_id - 1) * self.students_per_course
+        return [
+            (first + index) % self.users + 1
+            for index in range(self.students_per_course)
+        ]
+
+    def _get_user(self, user_id):
+        user_id = int(user_id)
+        if not 1 <= user_id <= self.users:
+            return None
+        return self._make_user(user_id)
+
+    def _list_assignments(self, course_id, params):
+        course_id = int(course_id)
+        return [
+            self._make_assignment(course_id, assignment_id)
+            for assignment_id in self._get_assignment_ids(course_id)
+        ]
+
+    def _list_course_submissions(self, course_id, params):
+        course_id = int(course_id)
+        assignment_ids = [
+            int(value) for key, value in params if key == "assignment_ids[]"
+        ] or list(self._get_assignment_ids(course_id))
+        student_ids = [value for key, value in params if key == "student_ids[]"]
+        user_ids = self._get_student_ids(course_id)
+        if student_ids and "all" not in student_ids:
+            user_ids = [user_id for user_id in user_ids if str(user_id) in student_ids]
+
+        return _LazyRows(
+            len(assignment_ids) * len(user_ids),
+            lambda index: self._make_submission(
+                assignment_ids[index // len(user_ids)],
+                user_ids[index % len(user_ids)],
+            ),
+        )
+
+    def _list_course_users(self, course_id, params):
+        student_ids = self._get_student_ids(int(course_id))
+        return _LazyRows(
+            len(student_ids), lambda index: self._make_user(student_ids[index])
+        )
+
+    def _list_courses(self, params):
+        return _LazyRows(self.courses, lambda index: self._make_course(index + 1))
+
+    def _list_enrollments(self, course_id, params):
+        course_id = int(course_id)
+        student_ids = self._get_student_ids(course_id)
+        return _LazyRows(
+            len(student_ids),
+            lambda index: {
+                "id": course_id * self.users + student_ids[index],
+                "course_id": course_id,
+                "user_id": student_ids[index],
+                "type": "StudentEnrollment",
+                "enrollment_state": "active",
+                "user": self._make_user(student_ids[index]),
+            },
+        )
+
+    def _list_submissions(self, course_id, assignment_id, params):
+        course_id, assignment_id = int(course_id), int(assignment_id)
+        if assignment_id not in self._get_assignment_ids(course_id):
+            return None
+        user_ids = self._get_student_ids(course_id)
+        return _LazyRows(
+            len(user_ids),
+            lambda index: self._make_submission(assignment_id, user_ids[index]),
+        )
+
+    def _make_assignment(self, course_id, assignment_id):
+        return {
+            "id": assignment_id,
+            "course_id": course_id,
+            "name": "Assignment {}".format(assignment_id),
+            "points_possible": 10.0,
+            "due_at": _timestamp(days=assignment_id % 120),
+            "published": True,
+            "submission_types": ["online_upload"],
+        }
+
+    def _make_course(self, course_id):
+        return {
+            "id": course_id,
+            "name": "Course {}".format(course_id),
+            "course_code": "C{:05d}".format(course_id),
+            "account_id": 1,
+            "enrollment_term_id": 1,
+            "workflow_state": "available",
+            "total_students": self.students_per_course,
+            "start_at": _timestamp(),
+        }
+
+    def _make_submission(self, assignment_id, user_id):
+        return {
+            "id": assignment_id * self.users + user_id,
+            "assignment_id": assignment_id,
+            "user_id": user_id,
+            "score": float((user_id * 7 + assignment_id) % 11),
+            "grade": str((user_id * 7 + assignment_id) % 11),
+            "workflow_state": "graded",
+            "submitted_at": _timestamp(days=assignment_id % 120, hours=user_id % 24),
+            "late": user_id % 13 == 0,
+            "missing": False,
+        }
+
+    def _make_user(self, user_id):
+        return {
+            "id": user_id,
+            "name": "User {}".format(user_id),
+            "sortable_name": "{}, User".format(user_id),
+            "short_name": "User {}".format(user_id),
+            "sis_user_id": "SIS{:07d}".format(user_id),
+            "login_id": "user{}@example.edu".format(user_id),
+            "created_at": _timestamp(days=user_id % 365),
+        }
+
+    def dispatch(self, method, url, token):
+        """
+        Answer a request.
+
+        :param method: The HTTP method.
+        :type method: str
+        :param url: The path and query of the request.
+        :type url: str
+        :param token: The access token the request was sent with.
+        :type token: str
+
+        :returns: The status code, headers and JSON body of the response.
+        :rtype: tuple
+        """
+        with self._lock:
+            self.stats["requests"] += 1
+            self._in_flight += 1
+            self.stats["max_concurrency"] = max(
+                self.stats["max_concurrency"], self._in_flight
+            )
+            injected = self._injected_errors.pop(0) if self._injected_errors else None
+            if injected is None and self._random.random() < self.error_rate:
+                injected = self._random.choice([500, 502, 503])
+            delay = self.latency + self._random.uniform(0, self.jitter)
+
+        try:
+            return self._respond(method, url, token, injected, delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def inject_errors(self, *status_codes):
+        """
+        Make the next requests fail with these status codes, in order.
+
+        :param status_codes: The status codes, e.g. 503.
+        :type status_codes: int
+        """
+        with self._lock:
+            self._injected_errors.extend(status_codes)
+
+    def reset_stats(self):
+        """
+        Set the request counters back to zero.
+        """
+        with self._lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def _respond(self, method, url, token, injected, delay):
+        if token is None:
+            return (
+                401,
+                {"WWW-Authenticate": 'Bearer realm="canvas-lms"'},
+                {"errors": [{"message": "Invalid access token."}]},
+            )
+
+        headers = {}
+        if self.rate_limiter is not None:
+            remaining = self.rate_limiter.acquire(token)
+            if remaining < 0:
+                with self._lock:
+                    self.stats["throttled"] += 1
+                headers["X-Rate-Limit-Remaining"] = "{:.3f}".format(0)
+                return 403, headers, "403 Forbidden (Rate Limit Exceeded)"
+
+        if delay:
+            time.sleep(delay)
+
+        cost = 1.0
+        try:
+            if injected is not None:
+                with self._lock:
+                    self.stats["errors"] += 1
+                return injected, headers, {"errors": [{"message": "Simulated error"}]}
+            if method != "GET":
+                return 405, headers, {"errors": [{"message": "Not supported"}]}
+
+            status, body = self._route(url, headers)
+            if isinstance(body, list):
+                cost += self.cost_per_row * len(body)
+            return status, headers, body
+        finally:
+            if self.rate_limiter is not None:
+                remaining = self.rate_limiter.release(token, cost)
+                headers["X-Request-Cost"] = "{:.3f}".format(cost)
+                headers["X-Rate-Limit-Remaining"] = "{:.3f}".format(remaining)
+
+    def _route(self, url, headers):
+        parts = urlsplit(url)
+        params = parse_qsl(parts.query, keep_blank_values=True)
+
+        for pattern, handler in self._routes:
+            match = pattern.match(parts.path)
+            if not match:
+                continue
+
+            if handler.__name__.startswith("_list"):
+                rows = handler(*match.groups(), params)
+                if rows is None:
+                    break
+                page_rows, links = _paginate(rows, params, self.url + parts.path)
+                headers["Link"] = links
+                return 200, page_rows
+
+            body = handler(*match.groups())
+            if body is None:
+                break
+            return 200, body
+
+        return 404, {"errors": [{"message": "The specified resource does not exist."}]}
+
+    def start(self):
+        """
+        Start serving from a background thread.
+
+        :rtype: :class:`CanvasSimulator`
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving and close the port.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+class _LazyRows(object):
+    # Rows built on demand, so large simulated listings cost nothing until
+    # a page of them is requested.
+
+    def __init__(self, length, make_row):
+        self.length = length
+        self.make_row = make_row
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, page):
+        return [self.make_row(index) for index in range(*page.indices(self.length))]
+
+
+def _make_handler(simulator):
+    class Handler(BaseHTTPRequestHandler):
+        # Keep connections open so clients can pool them.
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with simulator._lock:
+                simulator.stats["connections"] += 1
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            if length:
+                self.rfile.read(length)
+
+            authorization = self.headers.get("Authorization", "")
+            token = authorization[7:] if authorization.startswith("Bearer ") else None
+
+            status, headers, body = simulator.dispatch(self.command, self.path, token)
+            content = json.dumps(body).encode("utf-8")
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_DELETE = do_GET = do_PATCH = do_POST = do_PUT = _handle
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _paginate(rows, params, url):
+    query = dict(params)
+    try:
+        per_page = min(max(int(query.get("per_page", 10)), 1), 100)
+        page = max(int(query.get("page", 1)), 1)
+    except ValueError:
+        per_page, page = 10, 1
+    last_page = max((len(rows) + per_page - 1) // per_page, 1)
+
+    def link(number, rel):
+        link_params = [
+            (key, value) for key, value in params if key not in ("page", "per_page")
+        ]
+        link_params += [("page", number), ("per_page", per_page)]
+        return '<{}?{}>; rel="{}"'.format(url, urlencode(link_params), rel)
+
+    links = [link(page, "current")]
+    if page < last_page:
+        links.append(link(page + 1, "next"))
+    if page > 1:
+        links.append(link(page - 1, "prev"))
+    links += [link(1, "first"), link(last_page, "last")]
+
+    start = (page - 1) * per_page
+    return rows[start : start + per_page], ",".join(links)
+
+
+def _timestamp(days=0, hours=0):
+    return (EPOCH + timedelta(days=days, hours=hours)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--courses", type=int, default=10)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--students-per-course", type=int, default=100)
+    parser.add_argument("--assignments-per-course", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        help="The capacity of the rate limit bucket. No limit if omitted.",
+    )
+    parser.add_argument("--leak-rate", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    rate_limiter = None
+    if args.rate_limit:
+        rate_limiter = RateLimiter(capacity=args.rate_limit, leak_rate=args.leak_rate)
+
+    simulator = CanvasSimulator(
+        courses=args.courses,
+        users=args.users,
+        students_per_course=args.students_per_course,
+        assignments_per_course=args.assignments_per_course,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limiter=rate_limiter,
+    )
+    print("Simulating Canvas at {}".format(simulator.url))
+    try:
+        simulator._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
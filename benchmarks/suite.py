@@ -0,0 +1,192 @@
+import os
+import subprocess
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.harness import benchmark
+from benchmarks.mock_canvas import MockCanvas, make_user
+from benchmarks.simulator import CanvasSimulator
+from canvasapi import Canvas
+from canvasapi.paginated_list import PaginatedList
+from canvasapi.user import User
+from canvasapi.util import combine_kwargs
+
+
+@benchmark(
+    "import_time",
+    statement=[
+        "import canvasapi",
+        "from canvasapi import Canvas",
+        "from canvasapi.course import Course",
+    ],
+)
+def import_time(statement):
+    """
+    Start a new interpreter that runs `statement`, which includes the
+    startup of Python itself.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    yield lambda: subprocess.run(
+        [sys.executable, "-c", statement], cwd=root, check=True
+    )
+
+
+@benchmark("paginated_list_growth", pages=[1, 10, 100, 1000])
+def paginated_list_growth(pages):
+    """
+    Fetch every page of a listing of `pages` pages of 100 users.
+    """
+    with MockCanvas(pages=pages) as canvas:
+        requester = canvas._Canvas__requester
+
+        yield lambda: PaginatedList(User, requester, "GET", "users").to_dataframe()
+
+
+@benchmark("apply_filters", rows=[100000])
+def apply_filters(rows):
+    """
+    Filter `rows` rows on a numeric comparison and a wildcard pattern.
+    """
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "score": rng.uniform(0, 100, rows),
+            "name": ["User {}".format(i) for i in range(rows)],
+            "workflow_state": rng.choice(["active", "completed", "deleted"], rows),
+        }
+    )
+    filters = {
+        "score": [">50"],
+        "name": ["User 1*"],
+        "workflow_state": ["!=deleted"],
+    }
+    paginated_list = PaginatedList.__new__(PaginatedList)
+
+    yield lambda: paginated_list.apply_filters(df, filters)
+
+
+@benchmark("canvas_object_construction", number=1000)
+def canvas_object_construction():
+    """
+    Build a user object from its JSON.
+    """
+    attributes = make_user(1)
+
+    yield lambda: User(None, attributes)
+
+
+@benchmark("canvas_object_attribute_access", number=10000)
+def canvas_object_attribute_access():
+    """
+    Read an attribute of a user object.
+    """
+    user = User(None, make_user(1))
+
+    yield lambda: user.sortable_name
+
+
+@benchmark("combine_kwargs", items=[10, 1000])
+def combine_kwargs_nested(items):
+    """
+    Flatten a rubric-like payload with `items` criteria of nested ratings.
+    """
+    payload = {
+        "rubric": {
+            "title": "Benchmark rubric",
+            "criteria": {
+                str(i): {
+                    "description": "Criterion {}".format(i),
+                    "points": 10,
+                    "ratings": {
+                        str(j): {"description": "Rating {}".format(j), "points": j}
+                        for j in range(5)
+                    },
+                }
+                for i in range(items)
+            },
+        },
+        "rubric_association": {
+            "association_type": "Assignment",
+            "association_id": 1,
+            "use_for_grading": True,
+        },
+        "include": ["rubric", "assessments"] * items,
+    }
+
+    yield lambda: combine_kwargs(**payload)
+
+
+@benchmark("combine_kwargs_grade_data", entries=[1000, 50000])
+def combine_kwargs_grade_data(entries):
+    """
+    Flatten the `grade_data` of a bulk grade update for `entries` students.
+    """
+    grade_data = {
+        str(user_id): {"posted_grade": "A", "text_comment": "Well done"}
+        for user_id in range(entries)
+    }
+
+    yield lambda: combine_kwargs(grade_data=grade_data)
+
+
+@benchmark("bulk_update_payload", encoding=["form", "json", "json_gzip"], cells=[10000])
+def bulk_update_payload(encoding, cells):
+    """
+    Send a custom column update of `cells` cells as form data, as json or
+    as gzipped json, and report the size of the request body.
+    """
+    column_data = [
+        {"column_id": 1, "user_id": user_id, "content": "Note {}".format(user_id)}
+        for user_id in range(cells)
+    ]
+
+    with MockCanvas() as canvas:
+        requester = canvas._Canvas__requester
+        if encoding == "json_gzip":
+            requester.gzip_min_size = 1024
+
+        def send():
+            if encoding != "form":
+                kwargs = {"_kwargs": [("column_data", column_data)], "json": True}
+            else:
+                kwargs = {"_kwargs": combine_kwargs(column_data=column_data)}
+
+            return requester.request(
+                "PUT", "courses/1/custom_gradebook_column_data", **kwargs
+            )
+
+        yield send, {"bytes": len(send().request.body)}
+
+
+@benchmark("requester_request", number=200)
+def requester_request():
+    """
+    Send a GET request through the requester and read its JSON.
+    """
+    with MockCanvas() as canvas:
+        requester = canvas._Canvas__requester
+
+        yield lambda: requester.request("GET", "users/1").json()
+
+
+@benchmark("simulated_paging", max_workers=[1, 8])
+def simulated_paging(max_workers):
+    """
+    Fetch the 2000 users of a course, 50 per page, from the simulator with
+    5ms of latency per request, with `max_workers` concurrent requests.
+    """
+    with CanvasSimulator(
+        courses=1, users=2000, students_per_course=2000, latency=0.005
+    ) as simulator:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            course = Canvas(simulator.url, "benchmark-token").get_course(1)
+
+        yield lambda: course.get_users(per_page=50).to_dataframe(
+            max_workers=max_workers
+        )
@@ -1,7 +1,45 @@
 # -*- coding: utf-8 -*-
 
-from canvasapi.canvas import Canvas
-
-__all__ = ["Canvas"]
+__all__ = ["Canvas", "CanvasFactory", "DeltaSync", "RequestMetrics", "SnapshotStore"]
 
 __version__ = "3.2.0"
+
+# The public classes are imported from their modules the first time they
+# are used, so `import canvasapi` stays fast.
+_LAZY_ATTRIBUTES = {
+    "Canvas": "canvasapi.canvas",
+    "CanvasFactory": "canvasapi.factory",
+    "DeltaSync": "canvasapi.sync",
+    "RequestMetrics": "canvasapi.metrics",
+    "SnapshotStore": "canvasapi.snapshot",
+}
+
+_submodules = None
+
+
+def _get_submodules():
+    global _submodules
+
+    if _submodules is None:
+        import pkgutil
+
+        _submodules = {module.name for module in pkgutil.iter_modules(__path__)}
+    return _submodules
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _get_submodules())
+
+
+def __getattr__(name):
+    import importlib
+
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _get_submodules():
+        value = importlib.import_module("{}.{}".format(__name__, name))
+    else:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    globals()[name] = value
+    return value
@@ -1,27 +1,20 @@
-from canvasapi.account_calendar import AccountCalendar
-from canvasapi.authentication_event import AuthenticationEvent
-from canvasapi.authentication_provider import AuthenticationProvider
+import tempfile
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+
 from canvasapi.canvas_object import CanvasObject
-from canvasapi.content_migration import ContentMigration, Migrator
-from canvasapi.course import Course
-from canvasapi.course_event import CourseEvent
-from canvasapi.enrollment import Enrollment
-from canvasapi.enrollment_term import EnrollmentTerm
 from canvasapi.exceptions import CanvasException, RequiredFieldMissing
-from canvasapi.external_tool import ExternalTool
-from canvasapi.feature import Feature, FeatureFlag
-from canvasapi.grading_period import GradingPeriod
-from canvasapi.grading_standard import GradingStandard
-from canvasapi.group import Group, GroupCategory
-from canvasapi.login import Login
-from canvasapi.outcome import OutcomeGroup, OutcomeLink
-from canvasapi.outcome_import import OutcomeImport
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.rubric import Rubric
-from canvasapi.scope import Scope
-from canvasapi.sis_import import SisImport
-from canvasapi.user import User
-from canvasapi.util import combine_kwargs, file_or_path, obj_or_id, obj_or_str
+from canvasapi.util import (
+    combine_kwargs,
+    file_or_path,
+    obj_or_id,
+    obj_or_str,
+    run_concurrently,
+    stream_csv,
+)
 
 
 class Account(CanvasObject):
@@ -76,6 +69,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.authentication_provider.AuthenticationProvider`
         """
+        from canvasapi.authentication_provider import AuthenticationProvider
+
         response = self._requester.request(
             "POST",
             "accounts/{}/authentication_providers".format(self.id),
@@ -99,6 +94,8 @@ class Account(CanvasObject):
         :type grading_scheme: list[dict]
         :rtype: :class:`canvasapi.grading_standards.GradingStandard`
         """
+        from canvasapi.grading_standard import GradingStandard
+
         if not isinstance(grading_scheme_entry, list) or len(grading_scheme_entry) <= 0:
             raise ValueError("Param `grading_scheme_entry` must be a non-empty list.")
 
@@ -135,6 +132,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.account.AccountNotification`
         """
+        from canvasapi.user import User
+
         user_id = obj_or_id(user, "user", (User,))
         notif_id = obj_or_id(notification, "notification", (AccountNotification,))
 
@@ -175,6 +174,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.account.Admin`
         """
+        from canvasapi.user import User
+
         user_id = obj_or_id(user, "user", (User,))
         kwargs["user_id"] = user_id
 
@@ -197,6 +198,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.content_migration.ContentMigration`
         """
+        from canvasapi.content_migration import ContentMigration, Migrator
+
         if isinstance(migration_type, Migrator):
             kwargs["migration_type"] = migration_type.type
         elif isinstance(migration_type, str):
@@ -224,6 +227,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.course.Course`
         """
+        from canvasapi.course import Course
+
         response = self._requester.request(
             "POST",
             "accounts/{}/courses".format(self.id),
@@ -241,6 +246,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.enrollment_term.EnrollmentTerm`
         """
+        from canvasapi.enrollment_term import EnrollmentTerm
+
         response = self._requester.request(
             "POST",
             "accounts/{}/terms".format(self.id),
@@ -271,6 +278,8 @@ class Account(CanvasObject):
         :type shared_secret: str
         :rtype: :class:`canvasapi.external_tool.ExternalTool`
         """
+        from canvasapi.external_tool import ExternalTool
+
         response = self._requester.request(
             "POST",
             "accounts/{}/external_tools".format(self.id),
@@ -296,6 +305,8 @@ class Account(CanvasObject):
         :type name: str
         :rtype: :class:`canvasapi.group.GroupCategory`
         """
+        from canvasapi.group import GroupCategory
+
         response = self._requester.request(
             "POST",
             "accounts/{}/group_categories".format(self.id),
@@ -393,6 +404,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.sis_import.SisImport`
         """
+        from canvasapi.sis_import import SisImport
+
         attachment, is_path = file_or_path(attachment)
 
         try:
@@ -411,6 +424,72 @@ class Account(CanvasObject):
             if is_path:
                 attachment.close()
 
+    def create_sis_import_batches(self, builder, max_workers=4, **kwargs):
+        """
+        Create one SIS import per batch written by a
+        :class:`canvasapi.sis_import.SisImportBuilder`.
+
+        Batches of the same CSV type are uploaded concurrently, but a type is
+        only submitted once every batch of the types it depends on has been
+        created, so Canvas processes users and courses before enrollments.
+        Keyword arguments are sent with every import.
+
+        If `diffing_data_set_identifier` is given, the CSV type and batch
+        number are appended to it so that each batch is diffed against the
+        same batch of the previous run. Sort the rows by a stable key so
+        batches line up between runs. `batch_mode` cannot be used when the
+        data spans several batches, since each batch would delete the rows
+        of the others.
+
+        :calls: `POST /api/v1/accounts/:account_id/sis_imports \
+        <https://canvas.instructure.com/doc/api/sis_imports.html#method.sis_imports_api.create>`_
+
+        :param builder: The builder holding the DataFrames to import.
+        :type builder: :class:`canvasapi.sis_import.SisImportBuilder`
+        :param max_workers: The maximum number of concurrent uploads.
+        :type max_workers: int
+
+        :rtype: list of :class:`canvasapi.sis_import.SisImport`
+
+        Example Usage:
+
+        >>> builder = SisImportBuilder(max_rows=200000)
+        >>> builder.add("users", users_df).add("enrollments", enrollments_df)
+        >>> sis_imports = account.create_sis_import_batches(builder)
+        >>> sis_imports = account.wait_for_sis_imports(sis_imports)
+        """
+        identifier = kwargs.pop("diffing_data_set_identifier", None)
+
+        with tempfile.TemporaryDirectory() as directory:
+            batches = list(builder.build(directory))
+
+            if kwargs.get("batch_mode") and len(batches) > 1:
+                raise ValueError(
+                    "Parameter `batch_mode` cannot be used with more than one batch."
+                )
+
+            def submit(batch):
+                csv_type, path, number = batch
+                batch_kwargs = dict(kwargs)
+                batch_kwargs.setdefault("import_type", "instructure_csv")
+                if identifier:
+                    batch_kwargs["diffing_data_set_identifier"] = "{}-{}-{}".format(
+                        identifier, csv_type, number
+                    )
+                return self.create_sis_import(path, **batch_kwargs)
+
+            sis_imports = []
+            for csv_type, group in groupby(batches, key=itemgetter(0)):
+                group = [
+                    (csv_type, path, number)
+                    for number, (_, path) in enumerate(group, 1)
+                ]
+                sis_imports.extend(
+                    run_concurrently(submit, group, max_workers=max_workers)
+                )
+
+        return sis_imports
+
     def create_subaccount(self, account, **kwargs):
         """
         Add a new sub-account to a given account.
@@ -446,6 +525,8 @@ class Account(CanvasObject):
         :type pseudonym: dict
         :rtype: :class:`canvasapi.user.User`
         """
+        from canvasapi.user import User
+
         if isinstance(pseudonym, dict) and "unique_id" in pseudonym:
             kwargs["pseudonym"] = pseudonym
         else:
@@ -471,6 +552,8 @@ class Account(CanvasObject):
         :type login: `dict`
         :rtype: :class:`canvasapi.login.Login`
         """
+        from canvasapi.login import Login
+
         if isinstance(user, dict) and "id" in user:
             kwargs["user"] = user
         else:
@@ -547,6 +630,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.account.Admin`
         """
+        from canvasapi.user import User
+
         user_id = obj_or_id(user, "user", (User,))
         kwargs["user_id"] = user_id
 
@@ -571,6 +656,7 @@ class Account(CanvasObject):
         :returns: True if the grading period was deleted, False otherwise.
         :rtype: bool
         """
+        from canvasapi.grading_period import GradingPeriod
 
         grading_period_id = obj_or_id(
             grading_period, "grading_period", (GradingPeriod,)
@@ -604,6 +690,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.user.User`
         """
+        from canvasapi.user import User
+
         user_id = obj_or_id(user, "user", (User,))
 
         response = self._requester.request(
@@ -622,6 +710,7 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.account_calendar.AccountCalendar`
         """
+        from canvasapi.account_calendar import AccountCalendar
 
         response = self._requester.request(
             "GET",
@@ -631,6 +720,71 @@ class Account(CanvasObject):
 
         return AccountCalendar(self._requester, response.json())
 
+    def get_account_tree(self, max_workers=8, **kwargs):
+        """
+        Crawl the hierarchy of sub-accounts below this account, listing the
+        sub-accounts of every account of a level concurrently.
+
+        :calls: `GET /api/v1/accounts/:account_id/sub_accounts \
+        <https://canvas.instructure.com/doc/api/accounts.html#method.accounts.sub_accounts>`_
+
+        :param max_workers: The maximum number of accounts expanded at the
+            same time.
+        :type max_workers: int
+
+        :returns: One row per account, this one included, indexed by account
+            id. `depth` is 0 for this account, `path` joins the ids from this
+            account down with "/" and `is_leaf` tells accounts without
+            sub-accounts apart.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        kwargs["recursive"] = False
+
+        def get_children(account_id):
+            return PaginatedList(
+                Account,
+                self._requester,
+                "GET",
+                "accounts/{}/sub_accounts".format(account_id),
+                _kwargs=combine_kwargs(**kwargs),
+            ).to_dataframe()
+
+        root = self.dataframe.iloc[0].to_dict()
+        root.update(depth=0, path=str(root["id"]))
+
+        rows = [root]
+        seen = {root["id"]}
+        level = [root]
+        while level:
+            children = run_concurrently(
+                get_children, [account["id"] for account in level], max_workers
+            )
+
+            next_level = []
+            for parent, accounts in zip(level, children):
+                parent["is_leaf"] = True
+                for account in accounts.to_dict("records"):
+                    if account["id"] in seen:
+                        continue
+                    seen.add(account["id"])
+                    parent["is_leaf"] = False
+                    account.update(
+                        parent_account_id=parent["id"],
+                        depth=parent["depth"] + 1,
+                        path="{}/{}".format(parent["path"], account["id"]),
+                    )
+                    next_level.append(account)
+
+            rows.extend(next_level)
+            level = next_level
+
+        columns = ["id", "name", "parent_account_id", "depth", "path", "is_leaf"]
+        tree = pd.DataFrame(rows)
+        tree = tree.reindex(columns=list(dict.fromkeys(columns + list(tree))))
+        tree["parent_account_id"] = tree["parent_account_id"].astype("Int64")
+
+        return tree.set_index("id")
+
     def get_admins(self, **kwargs):
         """
         Get the paginated list of admins for the current account.
@@ -660,6 +814,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account_calendar.AccountCalendar`
         """
+        from canvasapi.account_calendar import AccountCalendar
+
         return PaginatedList(
             AccountCalendar,
             self._requester,
@@ -679,6 +835,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.outcome.OutcomeLink`
         """
+        from canvasapi.outcome import OutcomeLink
+
         return PaginatedList(
             OutcomeLink,
             self._requester,
@@ -697,6 +855,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
                 :class:`canvasapi.authentication_event.AuthenticationEvent`
         """
+        from canvasapi.authentication_event import AuthenticationEvent
+
         return PaginatedList(
             AuthenticationEvent,
             self._requester,
@@ -718,6 +878,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.authentication_provider.AuthenticationProvider`
         """
+        from canvasapi.authentication_provider import AuthenticationProvider
+
         authentication_providers_id = obj_or_id(
             authentication_provider,
             "authentication provider",
@@ -744,6 +906,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.authentication_provider.AuthenticationProvider`
         """
+        from canvasapi.authentication_provider import AuthenticationProvider
+
         return PaginatedList(
             AuthenticationProvider,
             self._requester,
@@ -765,6 +929,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.content_migration.ContentMigration`
         """
+        from canvasapi.content_migration import ContentMigration
+
         migration_id = obj_or_id(
             content_migration, "content_migration", (ContentMigration,)
         )
@@ -790,6 +956,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.content_migration.ContentMigration`
         """
+        from canvasapi.content_migration import ContentMigration
+
         return PaginatedList(
             ContentMigration,
             self._requester,
@@ -809,6 +977,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course.Course`
         """
+        from canvasapi.course import Course
+
         return PaginatedList(
             Course,
             self._requester,
@@ -1001,6 +1171,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.enrollment.Enrollment`
         """
+        from canvasapi.enrollment import Enrollment
+
         enrollment_id = obj_or_id(enrollment, "enrollment", (Enrollment,))
 
         response = self._requester.request(
@@ -1022,6 +1194,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.enrollment_term.EnrollmentTerm`
         """
+        from canvasapi.enrollment_term import EnrollmentTerm
+
         term_id = obj_or_id(term, "term", (EnrollmentTerm,))
 
         response = self._requester.request(
@@ -1039,6 +1213,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.enrollment_term.EnrollmentTerm`
         """
+        from canvasapi.enrollment_term import EnrollmentTerm
+
         return PaginatedList(
             EnrollmentTerm,
             self._requester,
@@ -1059,6 +1235,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.external_tool.ExternalTool`
         """
+        from canvasapi.external_tool import ExternalTool
+
         tool_id = obj_or_id(tool, "tool", (ExternalTool,))
 
         response = self._requester.request(
@@ -1079,6 +1257,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.external_tool.ExternalTool`
         """
+        from canvasapi.external_tool import ExternalTool
+
         return PaginatedList(
             ExternalTool,
             self._requester,
@@ -1100,6 +1280,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.feature.FeatureFlag`
         """
+        from canvasapi.feature import Feature, FeatureFlag
+
         feature_name = obj_or_str(feature, "name", (Feature,))
 
         response = self._requester.request(
@@ -1119,6 +1301,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.feature.Feature`
         """
+        from canvasapi.feature import Feature
+
         return PaginatedList(
             Feature,
             self._requester,
@@ -1161,6 +1345,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.grading_period.GradingPeriod`
         """
+        from canvasapi.grading_period import GradingPeriod
+
         return PaginatedList(
             GradingPeriod,
             self._requester,
@@ -1181,6 +1367,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.grading_standards.GradingStandard`
         """
+        from canvasapi.grading_standard import GradingStandard
+
         return PaginatedList(
             GradingStandard,
             self._requester,
@@ -1199,6 +1387,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.group.GroupCategory`
         """
+        from canvasapi.group import GroupCategory
+
         return PaginatedList(
             GroupCategory,
             self._requester,
@@ -1216,6 +1406,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.group.Group`
         """
+        from canvasapi.group import Group
+
         return PaginatedList(
             Group,
             self._requester,
@@ -1255,6 +1447,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.content_migration.Migrator`
         """
+        from canvasapi.content_migration import Migrator
+
         return PaginatedList(
             Migrator,
             self._requester,
@@ -1277,6 +1471,8 @@ class Account(CanvasObject):
         :returns: An outcome group object.
         :rtype: :class:`canvasapi.outcome.OutcomeGroup`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         outcome_group_id = obj_or_id(group, "outcome group", (OutcomeGroup,))
         response = self._requester.request(
             "GET",
@@ -1297,6 +1493,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.outcome.OutcomeGroups`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         return PaginatedList(
             OutcomeGroup,
             self._requester,
@@ -1319,6 +1517,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.outcome_import.OutcomeImport`
         """
+        from canvasapi.outcome_import import OutcomeImport
+
         if outcome_import == "latest":
             outcome_import_id = "latest"
         else:
@@ -1431,6 +1631,8 @@ class Account(CanvasObject):
         :returns: The OutcomeGroup of the context.
         :rtype: :class:`canvasapi.outcome.OutcomeGroup`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         response = self._requester.request(
             "GET",
             "accounts/{}/root_outcome_group".format(self.id),
@@ -1449,6 +1651,8 @@ class Account(CanvasObject):
         :type rubric_id: int
         :rtype: :class:`canvasapi.rubric.Rubric`
         """
+        from canvasapi.rubric import Rubric
+
         response = self._requester.request(
             "GET",
             "accounts/%s/rubrics/%s" % (self.id, rubric_id),
@@ -1467,6 +1671,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.rubric.Rubric`
         """
+        from canvasapi.rubric import Rubric
+
         return PaginatedList(
             Rubric,
             self._requester,
@@ -1484,6 +1690,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.scope.Scope`
         """
+        from canvasapi.scope import Scope
+
         return PaginatedList(
             Scope,
             self._requester,
@@ -1503,6 +1711,8 @@ class Account(CanvasObject):
         :type grading_standard_id: int
         :rtype: :class:`canvasapi.grading_standards.GradingStandard`
         """
+        from canvasapi.grading_standard import GradingStandard
+
         response = self._requester.request(
             "GET",
             "accounts/%s/grading_standards/%d" % (self.id, grading_standard_id),
@@ -1522,6 +1732,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.sis_import.SisImport`
         """
+        from canvasapi.sis_import import SisImport
+
         sis_import_id = obj_or_id(sis_import, "sis_import", (SisImport,))
 
         response = self._requester.request(
@@ -1545,6 +1757,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.sis_import.SisImport`
         """
+        from canvasapi.sis_import import SisImport
+
         return PaginatedList(
             SisImport,
             self._requester,
@@ -1565,6 +1779,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList`
             of :class:`canvasapi.sis_import.SisImport`
         """
+        from canvasapi.sis_import import SisImport
+
         return PaginatedList(
             SisImport,
             self._requester,
@@ -1597,6 +1813,71 @@ class Account(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def get_tree_courses(
+        self, tree=None, max_workers=8, include_parents=False, **kwargs
+    ):
+        """
+        List the courses of every account of an account tree, listing up to
+        `max_workers` accounts at the same time. Keyword arguments, such as
+        `enrollment_term_id`, are sent with every request so Canvas does the
+        filtering.
+
+        Canvas includes the courses of sub-accounts when listing the courses
+        of an account, so only the leaves of the tree are listed by default.
+        This misses courses placed directly in an account that has
+        sub-accounts; pass `include_parents` to list those accounts too and
+        keep only their own courses.
+
+        :calls: `GET /api/v1/accounts/:account_id/courses \
+        <https://canvas.instructure.com/doc/api/accounts.html#method.accounts.courses_api>`_
+
+        :param tree: The tree returned by :func:`get_account_tree`. It is
+            crawled if omitted.
+        :type tree: :class:`pandas.DataFrame`
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+        :param include_parents: Whether accounts with sub-accounts are listed
+            as well.
+        :type include_parents: bool
+
+        :returns: One row per course, with the `account_path` and
+            `account_depth` of the account it was found in.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.course import Course
+
+        if tree is None:
+            tree = self.get_account_tree(max_workers=max_workers)
+
+        accounts = tree if include_parents else tree[tree["is_leaf"]]
+        # Looked up from plain dicts: pandas indexes are not safe to build
+        # from several threads.
+        paths = tree["path"].to_dict()
+        depths = tree["depth"].to_dict()
+        leaves = tree["is_leaf"].to_dict()
+
+        def get_courses(account_id):
+            courses = PaginatedList(
+                Course,
+                self._requester,
+                "GET",
+                "accounts/{}/courses".format(account_id),
+                _kwargs=combine_kwargs(**kwargs),
+            ).to_dataframe()
+            if not courses.empty and not leaves[account_id]:
+                courses = courses[courses["account_id"] == account_id]
+            return courses.assign(
+                account_path=paths[account_id], account_depth=depths[account_id]
+            )
+
+        frames = run_concurrently(get_courses, list(accounts.index), max_workers)
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=["id", "account_path", "account_depth"])
+
+        courses = pd.concat(frames, ignore_index=True)
+        return courses.drop_duplicates(subset="id").reset_index(drop=True)
+
     def get_user_logins(self, **kwargs):
         """
         Given a user ID, return that user's logins for the given account.
@@ -1607,6 +1888,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.login.Login`
         """
+        from canvasapi.login import Login
+
         return PaginatedList(
             Login,
             self._requester,
@@ -1630,6 +1913,8 @@ class Account(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account.AccountNotification`
         """
+        from canvasapi.user import User
+
         user_id = obj_or_id(user, "user", (User,))
 
         return PaginatedList(
@@ -1649,6 +1934,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.user.User`
         """
+        from canvasapi.user import User
+
         return PaginatedList(
             User,
             self._requester,
@@ -1669,6 +1956,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.outcome_import.OutcomeImport`
         """
+        from canvasapi.outcome_import import OutcomeImport
+
         attachment, is_path = file_or_path(attachment)
 
         try:
@@ -1696,6 +1985,7 @@ class Account(CanvasObject):
 
         :rtype: list of :class:`canvasapi.course_event.CourseEvent`
         """
+        from canvasapi.course_event import CourseEvent
 
         return PaginatedList(
             CourseEvent,
@@ -1705,6 +1995,49 @@ class Account(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def run_report(
+        self,
+        report_type,
+        interval=1,
+        max_interval=30,
+        backoff=2,
+        timeout=None,
+        **kwargs
+    ):
+        """
+        Generate a report and wait until Canvas has finished building it.
+
+        The report is polled with exponential backoff, see
+        :class:`canvasapi.poller.Poller` for the meaning of the polling
+        parameters. Keyword arguments are passed to :func:`create_report`.
+
+        :calls: `POST /api/v1/accounts/:account_id/reports/:report \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.create>`_
+            `GET /api/v1/accounts/:account_id/reports/:report/:id \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.show>`_
+
+        :param report_type: The type of report.
+        :type report_type: str
+
+        :rtype: :class:`canvasapi.account.AccountReport`
+
+        Example Usage:
+
+        >>> report = account.run_report(
+        ...     "provisioning_csv", parameters={"users": True}, timeout=3600
+        ... )
+        >>> for chunk in report.get_csv_chunks(chunksize=50000):
+        ...     load(chunk)
+        """
+        report = self.create_report(report_type, **kwargs)
+
+        return report.wait(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+        )
+
     def show_account_auth_settings(self, **kwargs):
         """
         Return the current state of each account level setting
@@ -1768,6 +2101,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.account_calendar.AccountCalendar`
         """
+        from canvasapi.account_calendar import AccountCalendar
+
         response = self._requester.request(
             "PUT",
             "account_calendars/{}".format(self.id),
@@ -1785,6 +2120,8 @@ class Account(CanvasObject):
 
         :rtype: :class:`canvasapi.account_calendar.AccountCalendar`
         """
+        from canvasapi.account_calendar import AccountCalendar
+
         response = self._requester.request(
             "PUT",
             "accounts/{}/account_calendars".format(self.id),
@@ -1814,6 +2151,60 @@ class Account(CanvasObject):
         )
         return Role(self._requester, response.json())
 
+    def wait_for_sis_imports(
+        self,
+        sis_imports,
+        interval=1,
+        max_interval=30,
+        backoff=2,
+        timeout=None,
+        max_workers=4,
+        **kwargs
+    ):
+        """
+        Poll several SIS imports until all of them have finished, sharing a
+        single :class:`canvasapi.poller.Poller` between them. `interval`,
+        `max_interval`, `backoff` and `timeout` are described there.
+
+        :calls: `GET /api/v1/accounts/:account_id/sis_imports/:id \
+        <https://canvas.instructure.com/doc/api/sis_imports.html#method.sis_imports_api.show>`_
+
+        :param sis_imports: The objects or IDs of the SIS imports.
+        :type sis_imports: list of :class:`canvasapi.sis_import.SisImport` or int
+        :param max_workers: The maximum number of imports polled at the same
+            time.
+        :type max_workers: int
+
+        :returns: The SIS imports in their final state, in the order given.
+            Check `workflow_state` for failures.
+        :rtype: list of :class:`canvasapi.sis_import.SisImport`
+        """
+        from canvasapi.poller import Poller
+        from canvasapi.sis_import import SisImport
+
+        poller = Poller(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+            max_workers=max_workers,
+        )
+
+        refresh = partial(self.get_sis_import, **kwargs)
+
+        keys = []
+        for sis_import in sis_imports:
+            sis_import_id = obj_or_id(sis_import, "sis_import", (SisImport,))
+            if not isinstance(sis_import, SisImport):
+                sis_import = refresh(sis_import_id)
+
+            keys.append(sis_import_id)
+            poller.add(sis_import_id, sis_import, refresh, SisImport._is_finished)
+
+        results = poller.wait()
+
+        return [results[key] for key in keys]
+
 
 class AccountNotification(CanvasObject):
     def __str__(self):
@@ -1861,6 +2252,21 @@ class AccountReport(CanvasObject):
             # Print params if not a report instance
             return "{} ({})".format(self.report, self.parameters)
 
+    def _is_finished(self):
+        return self.status in ("complete", "error", "aborted", "deleted")
+
+    def _refresh(self, **kwargs):
+        response = self._requester.request(
+            "GET",
+            "accounts/{}/reports/{}/{}".format(self.account_id, self.report, self.id),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
+        response_json = response.json()
+        response_json.update({"account_id": self.account_id})
+
+        return AccountReport(self._requester, response_json)
+
     def delete_report(self, **kwargs):
         """
         Delete this report.
@@ -1878,6 +2284,76 @@ class AccountReport(CanvasObject):
 
         return AccountReport(self._requester, response.json())
 
+    def get_csv_chunks(self, chunksize=100000, **kwargs):
+        """
+        Stream the file attached to this finished report and parse it in
+        chunks, so reports far larger than memory can be processed.
+
+        :param chunksize: The number of rows in each yielded DataFrame.
+        :type chunksize: int
+        :param kwargs: Passed on to :func:`pandas.read_csv`, e.g. `dtype`,
+            `parse_dates` or `usecols`.
+
+        :returns: A generator of DataFrames holding consecutive rows of the
+            report.
+        :rtype: generator of :class:`pandas.DataFrame`
+        """
+        try:
+            url = self.attachment["url"]
+        except (AttributeError, KeyError, TypeError):
+            raise CanvasException(
+                "Report {} has no attachment to download (status: {}).".format(
+                    self.id, getattr(self, "status", "unknown")
+                )
+            )
+
+        return stream_csv(self._requester, url, chunksize=chunksize, **kwargs)
+
+    def get_dataframe(self, chunksize=100000, **kwargs):
+        """
+        Download the file attached to this finished report into a single
+        DataFrame. The file is streamed and parsed chunk by chunk, so only
+        the parsed rows are held in memory.
+
+        :param chunksize: The number of rows parsed at a time.
+        :type chunksize: int
+        :param kwargs: Passed on to :func:`pandas.read_csv`, e.g. `dtype`,
+            `parse_dates` or `usecols`.
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        chunks = list(self.get_csv_chunks(chunksize=chunksize, **kwargs))
+        if not chunks:
+            return pd.DataFrame()
+
+        return pd.concat(chunks, ignore_index=True)
+
+    def wait(self, interval=1, max_interval=30, backoff=2, timeout=None, **kwargs):
+        """
+        Poll this report until Canvas has finished running it. `interval`,
+        `max_interval`, `backoff` and `timeout` are described in
+        :class:`canvasapi.poller.Poller`.
+
+        :calls: `GET /api/v1/accounts/:account_id/reports/:report/:id \
+        <https://canvas.instructure.com/doc/api/account_reports.html#method.account_reports.show>`_
+
+        :returns: The report in its final state. Check `status` to tell a
+            complete report from one that errored or was aborted.
+        :rtype: :class:`canvasapi.account.AccountReport`
+        """
+        from canvasapi.poller import Poller
+
+        poller = Poller(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+        )
+
+        return poller.wait_for(
+            self, partial(AccountReport._refresh, **kwargs), AccountReport._is_finished
+        )
+
 
 class Role(CanvasObject):
     def __str__(self):  # pragma: no cover
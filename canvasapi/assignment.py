@@ -4,7 +4,7 @@ from canvasapi.grade_change_log import GradeChangeEvent
 from canvasapi.paginated_list import PaginatedList
 from canvasapi.peer_review import PeerReview
 from canvasapi.progress import Progress
-from canvasapi.submission import Submission
+from canvasapi.submission import Submission, bulk_update_grades
 from canvasapi.upload import FileOrPathLike, Uploader
 from canvasapi.user import User, UserDisplay
 from canvasapi.util import combine_kwargs, obj_or_id
@@ -23,6 +23,65 @@ class Assignment(CanvasObject):
     def __str__(self):
         return "{} ({})".format(self.name, self.id)
 
+    def bulk_update_grades(
+        self,
+        grades,
+        chunk_size=500,
+        max_workers=4,
+        interval=1,
+        max_interval=30,
+        backoff=2,
+        timeout=None,
+        **kwargs
+    ):
+        """
+        Update the grades and comments of many submissions of the assignment.
+        The rows are split into several :func:`submissions_bulk_update` jobs
+        that are posted concurrently and waited for together. `interval`,
+        `max_interval`, `backoff` and `timeout` are described in
+        :class:`canvasapi.poller.Poller`.
+
+        :calls: `POST /api/v1/courses/:course_id/assignments/:assignment_id/ \
+            submissions/update_grades \
+        <https://canvas.instructure.com/doc/api/submissions.html#method.submissions_api.bulk_update>`_,
+            `GET /api/v1/progress/:id \
+        <https://canvas.instructure.com/doc/api/progress.html#method.progress.show>`_
+
+        :param grades: One row per submission, with `user_id` and
+            `grade` and/or `comment` columns. An `assignment_id` column, if
+            present, must only contain the id of this assignment.
+        :type grades: :class:`pandas.DataFrame`
+        :param chunk_size: The maximum number of rows sent per job.
+        :type chunk_size: int
+        :param max_workers: The maximum number of jobs posted, and polled,
+            at the same time.
+        :type max_workers: int
+
+        :returns: A copy of `grades` with the `progress_id`,
+            `workflow_state` and `message` of the job each row was sent in.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if (
+            "assignment_id" in grades.columns
+            and (grades["assignment_id"] != self.id).any()
+        ):
+            raise ValueError(
+                "Column `assignment_id` contains ids of other assignments."
+            )
+
+        return bulk_update_grades(
+            self.submissions_bulk_update,
+            grades,
+            by_assignment=False,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+            **kwargs
+        )
+
     def create_override(self, **kwargs):
         """
         Create an override for this assignment.
@@ -431,7 +490,8 @@ class Assignment(CanvasObject):
             "courses/{}/assignments/{}/submissions/update_grades".format(
                 self.course_id, self.id
             ),
-            _kwargs=combine_kwargs(**kwargs),
+            _kwargs=list(kwargs.items()),
+            json=True,
         )
         return Progress(self._requester, response.json())
 
@@ -1,6 +1,10 @@
+from functools import partial
+
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.util import combine_kwargs, obj_or_id
+from canvasapi.poller import Poller
+from canvasapi.util import combine_kwargs, obj_or_id, run_concurrently
 
 
 class BlueprintTemplate(CanvasObject):
@@ -181,6 +185,23 @@ class BlueprintMigration(CanvasObject):
     def __str__(self):
         return "{} {}".format(self.id, self.template_id)
 
+    def _is_finished(self):
+        return self.workflow_state in ("completed", "exports_failed", "imports_failed")
+
+    def _refresh(self, **kwargs):
+        response = self._requester.request(
+            "GET",
+            "courses/{}/blueprint_templates/{}/migrations/{}".format(
+                self.course_id, self.template_id, self.id
+            ),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
+        response_json = response.json()
+        response_json.update({"course_id": self.course_id})
+
+        return BlueprintMigration(self._requester, response_json)
+
     def get_details(self, **kwargs):
         """
         Return the changes that were made in a blueprint migration.
@@ -227,6 +248,34 @@ class BlueprintMigration(CanvasObject):
             kwargs=combine_kwargs(**kwargs),
         )
 
+    def wait(self, interval=1, max_interval=30, backoff=2, timeout=None, **kwargs):
+        """
+        Poll this migration until Canvas has finished syncing the associated
+        courses. `interval`, `max_interval`, `backoff` and `timeout` are
+        described in :class:`canvasapi.poller.Poller`.
+
+        :calls: `GET /api/v1/courses/:course_id/blueprint_templates/:template_id\
+        /migrations/:id\
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/\
+        master_templates.migrations_show>`_
+
+        :returns: The migration in its final state. Check `workflow_state`
+            to tell a completed migration from a failed one.
+        :rtype: :class:`canvasapi.blueprint.BlueprintMigration`
+        """
+        poller = Poller(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+        )
+
+        return poller.wait_for(
+            self,
+            partial(BlueprintMigration._refresh, **kwargs),
+            BlueprintMigration._is_finished,
+        )
+
 
 class ChangeRecord(CanvasObject):
     def __str__(self):
@@ -287,3 +336,164 @@ class BlueprintSubscription(CanvasObject):
         response_json = response.json()
         response_json.update({"course_id": self.course_id})
         return BlueprintMigration(self._requester, response_json)
+
+
+def get_blueprint_changes(templates, max_workers=8, **kwargs):
+    """
+    List the unsynced changes and the associated courses of many blueprint
+    templates, running up to `max_workers` listings at the same time.
+    Keyword arguments are sent with every listing.
+
+    :calls: `GET /api/v1/courses/:course_id/blueprint_templates/:template_id/unsynced_changes \
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses\
+        /master_templates.unsynced_changes>`_
+        and `GET /api/v1/courses/:course_id/blueprint_templates/:template_id/associated_courses \
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/master_templates.associated_courses>`_
+
+    :param templates: The blueprint templates.
+    :type templates: list of :class:`canvasapi.blueprint.BlueprintTemplate`
+    :param max_workers: The maximum number of concurrent requests.
+    :type max_workers: int
+
+    :returns: The DataFrames `unsynced_changes`, one row per changed asset,
+        and `associated_courses`, one row per associated course. Both start
+        with the `blueprint_course_id` and `template_id` of the template.
+    :rtype: dict of :class:`pandas.DataFrame`
+    """
+    from canvasapi.course import Course
+
+    templates = list(templates)
+    endpoints = {"unsynced_changes": ChangeRecord, "associated_courses": Course}
+
+    def get_rows(task):
+        endpoint, template = task
+        rows = PaginatedList(
+            endpoints[endpoint],
+            template._requester,
+            "GET",
+            "courses/{}/blueprint_templates/{}/{}".format(
+                template.course_id, template.id, endpoint
+            ),
+            _kwargs=combine_kwargs(**kwargs),
+        ).to_dataframe()
+        return _insert_template_columns(rows, template.course_id, template.id)
+
+    tasks = [(endpoint, template) for template in templates for endpoint in endpoints]
+    listings = run_concurrently(get_rows, tasks, max_workers)
+
+    return {
+        endpoint: _concat_rows(
+            [rows for (name, _), rows in zip(tasks, listings) if name == endpoint]
+        )
+        for endpoint in endpoints
+    }
+
+
+def sync_blueprints(
+    templates,
+    max_workers=8,
+    details=False,
+    interval=1,
+    max_interval=30,
+    backoff=2,
+    timeout=None,
+    **kwargs
+):
+    """
+    Start a migration of every blueprint template to its associated courses
+    and wait for all of them with a single shared
+    :class:`canvasapi.poller.Poller`.
+
+    :calls: `POST /api/v1/courses/:course_id/blueprint_templates/:template_id/migrations\
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.\
+        master_courses/master_templates.queue_migration>`_
+        and `GET /api/v1/courses/:course_id/blueprint_templates/:template_id\
+        /migrations/:id\
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/\
+        master_templates.migrations_show>`_
+
+    :param templates: The blueprint templates to sync.
+    :type templates: list of :class:`canvasapi.blueprint.BlueprintTemplate`
+    :param max_workers: The maximum number of concurrent requests.
+    :type max_workers: int
+    :param details: Whether to also list the changes made by every completed
+        migration.
+    :type details: bool
+    :param kwargs: Sent with every migration, e.g. `comment` or
+        `send_notification`.
+
+    See :class:`canvasapi.poller.Poller` for `interval`, `max_interval`,
+    `backoff` and `timeout`.
+
+    :returns: The DataFrames `migrations`, one row per migration in its
+        final state, and when requested `details`, one row per changed asset
+        with the `migration_id`. Both start with the `blueprint_course_id`
+        and `template_id` of the template.
+    :rtype: dict of :class:`pandas.DataFrame`
+    """
+    templates = list(templates)
+
+    def start(template):
+        return template.associated_course_migration(**kwargs)
+
+    poller = Poller(
+        interval=interval,
+        max_interval=max_interval,
+        backoff=backoff,
+        timeout=timeout,
+        max_workers=max_workers,
+    )
+    for key, migration in enumerate(run_concurrently(start, templates, max_workers)):
+        poller.add(
+            key, migration, BlueprintMigration._refresh, BlueprintMigration._is_finished
+        )
+    migrations = list(poller.wait().values())
+
+    rows = [
+        _insert_template_columns(
+            migration.dataframe.drop(columns=["course_id", "template_id"]),
+            migration.course_id,
+            migration.template_id,
+        )
+        for migration in migrations
+    ]
+    result = {"migrations": _concat_rows(rows)}
+
+    if details:
+
+        def get_details(migration):
+            rows = PaginatedList(
+                ChangeRecord,
+                migration._requester,
+                "GET",
+                "courses/{}/blueprint_templates/{}/migrations/{}/details".format(
+                    migration.course_id, migration.template_id, migration.id
+                ),
+            ).to_dataframe()
+            rows.insert(0, "migration_id", migration.id)
+            return _insert_template_columns(
+                rows, migration.course_id, migration.template_id
+            )
+
+        completed = [
+            migration
+            for migration in migrations
+            if migration.workflow_state == "completed"
+        ]
+        result["details"] = _concat_rows(
+            run_concurrently(get_details, completed, max_workers)
+        )
+
+    return result
+
+
+def _concat_rows(frames):
+    if not frames:
+        return pd.DataFrame(columns=["blueprint_course_id", "template_id"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def _insert_template_columns(rows, course_id, template_id):
+    rows.insert(0, "template_id", template_id)
+    rows.insert(0, "blueprint_course_id", course_id)
+    return rows
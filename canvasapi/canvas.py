@@ -1,31 +1,16 @@
 import warnings
 
-from canvasapi.account import Account
-from canvasapi.account_calendar import AccountCalendar
-from canvasapi.appointment_group import AppointmentGroup
-from canvasapi.calendar_event import CalendarEvent
-from canvasapi.comm_message import CommMessage
-from canvasapi.conversation import Conversation
-from canvasapi.course import Course, CourseNickname
-from canvasapi.course_epub_export import CourseEpubExport
-from canvasapi.current_user import CurrentUser
-from canvasapi.discussion_topic import DiscussionTopic
-from canvasapi.eportfolio import EPortfolio
 from canvasapi.exceptions import RequiredFieldMissing
-from canvasapi.file import File
-from canvasapi.folder import Folder
-from canvasapi.group import Group, GroupCategory
 from canvasapi.jwt import JWT
-from canvasapi.outcome import Outcome, OutcomeGroup
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.planner import PlannerNote, PlannerOverride
-from canvasapi.poll import Poll
-from canvasapi.progress import Progress
 from canvasapi.requester import Requester
-from canvasapi.section import Section
-from canvasapi.todo import Todo
-from canvasapi.user import User
-from canvasapi.util import combine_kwargs, get_institution_url, obj_or_id
+from canvasapi.util import (
+    combine_kwargs,
+    get_institution_url,
+    obj_or_id,
+    run_concurrently,
+)
 
 
 class Canvas(object):
@@ -33,12 +18,33 @@ class Canvas(object):
     The main class to be instantiated to provide access to Canvas's API.
     """
 
-    def __init__(self, base_url, access_token):
+    def __init__(
+        self,
+        base_url,
+        access_token,
+        snapshot_store=None,
+        metrics=None,
+        gzip_min_size=None,
+        session=None,
+    ):
         """
         :param base_url: The base URL of the Canvas instance's API.
         :type base_url: str
         :param access_token: The API key to authenticate requests with.
         :type access_token: str
+        :param snapshot_store: Optional store that paginated GET listings are
+            saved to, and reloaded from instead of calling the API.
+        :type snapshot_store: :class:`canvasapi.snapshot.SnapshotStore`
+        :param metrics: Optional collector of the timing, size and cost of
+            every request.
+        :type metrics: :class:`canvasapi.metrics.RequestMetrics`
+        :param gzip_min_size: Optional size, in bytes, from which request
+            bodies are sent gzipped. Only set it if the Canvas instance, or a
+            proxy in front of it, accepts `Content-Encoding: gzip` requests.
+        :type gzip_min_size: int
+        :param session: Optional session to send requests through, shared
+            with other clients. See :class:`canvasapi.factory.CanvasFactory`.
+        :type session: :class:`requests.Session`
         """
         if "api/v1" in base_url:
             raise ValueError(
@@ -70,7 +76,9 @@ class Canvas(object):
         access_token = access_token.strip()
         base_url = get_institution_url(base_url)
 
-        self.__requester = Requester(base_url, access_token)
+        self.__requester = Requester(
+            base_url, access_token, snapshot_store, metrics, gzip_min_size, session
+        )
 
     # GET Methods
     # need to revisit
@@ -110,6 +118,39 @@ class Canvas(object):
 
     #     return response.json()
 
+    def _get_blueprint_templates(self, blueprints):
+        from canvasapi.blueprint import BlueprintTemplate
+        from canvasapi.course import Course
+
+        return [
+            (
+                blueprint
+                if isinstance(blueprint, BlueprintTemplate)
+                else BlueprintTemplate(
+                    self.__requester,
+                    {
+                        "id": "default",
+                        "course_id": obj_or_id(blueprint, "course", (Course,)),
+                    },
+                )
+            )
+            for blueprint in blueprints
+        ]
+
+    def add_request_hook(self, event, callback):
+        """
+        Call a function before or after every request sent to Canvas.
+
+        See :func:`canvasapi.requester.Requester.add_hook` for the arguments
+        the function is called with.
+
+        :param event: "pre_request" or "post_request".
+        :type event: str
+        :param callback: The function to call.
+        :type callback: callable
+        """
+        self.__requester.add_hook(event, callback)
+
     def get_account(self, account, use_sis_id=False, **kwargs):
         """
         Retrieve information on an individual account.
@@ -125,6 +166,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         if use_sis_id:
             account_id = account
             uri_str = "accounts/sis_account_id:{}"
@@ -147,6 +190,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account_calendar.AccountCalendar`
         """
+        from canvasapi.account_calendar import AccountCalendar
+
         return PaginatedList(
             AccountCalendar,
             self.__requester,
@@ -170,6 +215,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         return PaginatedList(
             Account,
             self.__requester,
@@ -209,6 +256,9 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
                 :class:`canvasapi.discussion_topic.DiscussionTopic`
         """
+        from canvasapi.course import Course
+        from canvasapi.discussion_topic import DiscussionTopic
+
         if type(context_codes) is not list or len(context_codes) == 0:
             raise RequiredFieldMissing("context_codes need to be passed as a list")
 
@@ -249,6 +299,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.appointment_group.AppointmentGroup`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+
         appointment_group_id = obj_or_id(
             appointment_group, "appointment_group", (AppointmentGroup,)
         )
@@ -270,6 +322,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.appointment_group.AppointmentGroup`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+
         return PaginatedList(
             AppointmentGroup,
             self.__requester,
@@ -295,6 +349,33 @@ class Canvas(object):
     #     )
     #     return response.json()
 
+    def get_blueprint_changes(self, blueprints, max_workers=8, **kwargs):
+        """
+        List the unsynced changes and the associated courses of many
+        blueprint courses concurrently.
+
+        See :func:`canvasapi.blueprint.get_blueprint_changes`.
+
+        :calls: `GET /api/v1/courses/:course_id/blueprint_templates/:template_id/unsynced_changes \
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/master_templates.unsynced_changes>`_,
+            `GET /api/v1/courses/:course_id/blueprint_templates/:template_id/associated_courses \
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/master_templates.associated_courses>`_
+
+        :param blueprints: The blueprint templates, or the objects or IDs of
+            blueprint courses to use the default template of.
+        :type blueprints: list of :class:`canvasapi.blueprint.BlueprintTemplate`,
+            :class:`canvasapi.course.Course` or int
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+
+        :rtype: dict of :class:`pandas.DataFrame`
+        """
+        from canvasapi.blueprint import get_blueprint_changes
+
+        return get_blueprint_changes(
+            self._get_blueprint_templates(blueprints), max_workers=max_workers, **kwargs
+        )
+
     def get_calendar_event(self, calendar_event, **kwargs):
         """
         Return single Calendar Event by id
@@ -307,6 +388,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.calendar_event.CalendarEvent`
         """
+        from canvasapi.calendar_event import CalendarEvent
+
         calendar_event_id = obj_or_id(
             calendar_event, "calendar_event", (CalendarEvent,)
         )
@@ -328,6 +411,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.calendar_event.CalendarEvent`
         """
+        from canvasapi.calendar_event import CalendarEvent
+
         return PaginatedList(
             CalendarEvent,
             self.__requester,
@@ -352,6 +437,8 @@ class Canvas(object):
             :class:`canvasapi.comm_message.CommMessage`
 
         """
+        from canvasapi.comm_message import CommMessage
+        from canvasapi.user import User
 
         kwargs["user_id"] = obj_or_id(user, "user", (User,))
 
@@ -376,6 +463,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.conversation.Conversation`
         """
+        from canvasapi.conversation import Conversation
+
         conversation_id = obj_or_id(conversation, "conversation", (Conversation,))
 
         response = self.__requester.request(
@@ -395,6 +484,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of \
         :class:`canvasapi.conversation.Conversation`
         """
+        from canvasapi.conversation import Conversation
+
         return PaginatedList(
             Conversation,
             self.__requester,
@@ -419,6 +510,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.course.Course`
         """
+        from canvasapi.course import Course
+
         if use_sis_id:
             course_id = course
             uri_str = "courses/sis_course_id:{}"
@@ -445,6 +538,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.account.Account`
         """
+        from canvasapi.account import Account
+
         return PaginatedList(
             Account,
             self.__requester,
@@ -466,6 +561,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.course.CourseNickname`
         """
+        from canvasapi.course import Course, CourseNickname
+
         course_id = obj_or_id(course, "course", (Course,))
 
         response = self.__requester.request(
@@ -485,6 +582,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course.CourseNickname`
         """
+        from canvasapi.course import CourseNickname
+
         return PaginatedList(
             CourseNickname,
             self.__requester,
@@ -504,13 +603,15 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course.Course`
         """
+        from canvasapi.course import Course
+
         return PaginatedList(
-            Course, 
-            self.__requester, 
-            "GET", 
-            "courses", 
-            filters=filters, 
-            _kwargs=combine_kwargs(**kwargs)
+            Course,
+            self.__requester,
+            "GET",
+            "courses",
+            filters=filters,
+            _kwargs=combine_kwargs(**kwargs),
         )
 
     def get_current_user(self):
@@ -522,6 +623,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.current_user.CurrentUser`
         """
+        from canvasapi.current_user import CurrentUser
+
         return CurrentUser(self.__requester)
 
     def get_eportfolio(self, eportfolio, **kwargs):
@@ -536,6 +639,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.eportfolio.EPortfolio`
         """
+        from canvasapi.eportfolio import EPortfolio
+
         eportfolio_id = obj_or_id(eportfolio, "eportfolio", (EPortfolio,))
         response = self.__requester.request(
             "GET",
@@ -555,6 +660,7 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.course_epub_export.CourseEpubExport`
         """
+        from canvasapi.course_epub_export import CourseEpubExport
 
         return PaginatedList(
             CourseEpubExport,
@@ -577,6 +683,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.file.File`
         """
+        from canvasapi.file import File
+
         file_id = obj_or_id(file, "file", (File,))
 
         response = self.__requester.request(
@@ -596,6 +704,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.folder.Folder`
         """
+        from canvasapi.folder import Folder
+
         folder_id = obj_or_id(folder, "folder", (Folder,))
 
         response = self.__requester.request(
@@ -603,6 +713,37 @@ class Canvas(object):
         )
         return Folder(self.__requester, response.json())
 
+    def get_graphql_connection(
+        self, query, path, variables=None, cursor_variable="cursor", **kwargs
+    ):
+        """
+        Run a GraphQL query over every page of a connection, following its
+        `pageInfo.endCursor`, and return the nodes as rows.
+
+        See :func:`canvasapi.graphql.GraphQL.get_connection` for how the
+        query must select the connection.
+
+        :calls: `POST /api/graphql \
+        <https://canvas.instructure.com/doc/api/file.graphql.html>`_
+
+        :param query: The GraphQL query, taking the cursor as a variable.
+        :type query: str
+        :param path: The fields leading to the connection, joined with ".",
+            e.g. `course.submissionsConnection`.
+        :type path: str
+        :param variables: The values of the other variables of the query.
+        :type variables: dict
+        :param cursor_variable: The name of the cursor variable.
+        :type cursor_variable: str
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.graphql import GraphQL
+
+        return GraphQL(self.__requester).get_connection(
+            query, path, variables=variables, cursor_variable=cursor_variable, **kwargs
+        )
+
     def get_group(self, group, use_sis_id=False, **kwargs):
         """
         Return the data for a single group. If the caller does not
@@ -620,6 +761,7 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.group.Group`
         """
+        from canvasapi.group import Group
 
         if use_sis_id:
             group_id = group
@@ -645,6 +787,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.group.GroupCategory`
         """
+        from canvasapi.group import GroupCategory
+
         category_id = obj_or_id(category, "category", (GroupCategory,))
 
         response = self.__requester.request(
@@ -666,6 +810,9 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.group.Group`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+        from canvasapi.group import Group
+
         appointment_group_id = obj_or_id(
             appointment_group, "appointment_group", (AppointmentGroup,)
         )
@@ -678,6 +825,44 @@ class Canvas(object):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def get_module_structures(self, courses, max_workers=4, **kwargs):
+        """
+        Return the modules and module items of many courses as one flat
+        DataFrame, loading up to `max_workers` courses at the same time.
+
+        See :func:`canvasapi.course.Course.get_module_structure`.
+
+        :calls: `GET /api/v1/courses/:course_id/modules \
+        <https://canvas.instructure.com/doc/api/modules.html#method.context_modules_api.index>`_,
+            `GET /api/v1/courses/:course_id/modules/:module_id/items \
+        <https://canvas.instructure.com/doc/api/modules.html#method.context_module_items_api.index>`_
+
+        :param courses: The objects or IDs of the courses.
+        :type courses: list of :class:`canvasapi.course.Course` or int
+        :param max_workers: The maximum number of courses loaded concurrently.
+        :type max_workers: int
+
+        :returns: The rows of every course, with a `course_id` column first.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.course import Course
+
+        course_ids = [obj_or_id(course, "course", (Course,)) for course in courses]
+
+        def get_structure(course_id):
+            course = Course(self.__requester, {"id": course_id})
+            structure = course.get_module_structure(max_workers=1, **kwargs)
+            structure.insert(0, "course_id", course_id)
+            return structure
+
+        structures = run_concurrently(
+            get_structure, course_ids, max_workers=max_workers
+        )
+        if not structures:
+            return pd.DataFrame(columns=["course_id", "module_id", "id", "position"])
+
+        return pd.concat(structures, ignore_index=True)
+
     def get_outcome(self, outcome, **kwargs):
         """
         Returns the details of the outcome with the given id.
@@ -691,6 +876,8 @@ class Canvas(object):
         :returns: An Outcome object.
         :rtype: :class:`canvasapi.outcome.Outcome`
         """
+        from canvasapi.outcome import Outcome
+
         outcome_id = obj_or_id(outcome, "outcome", (Outcome,))
         response = self.__requester.request(
             "GET", "outcomes/{}".format(outcome_id), _kwargs=combine_kwargs(**kwargs)
@@ -710,6 +897,8 @@ class Canvas(object):
         :returns: An outcome group object.
         :rtype: :class:`canvasapi.outcome.OutcomeGroup`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         outcome_group_id = obj_or_id(group, "group", (OutcomeGroup,))
 
         response = self.__requester.request(
@@ -732,6 +921,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.planner.PlannerNote`
         """
+        from canvasapi.planner import PlannerNote
+
         if isinstance(planner_note, int) or isinstance(planner_note, PlannerNote):
             planner_note_id = obj_or_id(planner_note, "planner_note", (PlannerNote,))
         else:
@@ -757,6 +948,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.planner.PlannerNote`
         """
+        from canvasapi.planner import PlannerNote
+
         return PaginatedList(
             PlannerNote,
             self.__requester,
@@ -778,6 +971,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.planner.PlannerOverride`
         """
+        from canvasapi.planner import PlannerOverride
+
         if isinstance(planner_override, int) or isinstance(
             planner_override, PlannerOverride
         ):
@@ -807,6 +1002,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.planner.PlannerOverride`
         """
+        from canvasapi.planner import PlannerOverride
+
         return PaginatedList(
             PlannerOverride,
             self.__requester,
@@ -827,6 +1024,8 @@ class Canvas(object):
         :type poll: int
         :rtype: :class:`canvasapi.poll.Poll`
         """
+        from canvasapi.poll import Poll
+
         poll_id = obj_or_id(poll, "poll", (Poll,))
 
         response = self.__requester.request(
@@ -844,6 +1043,8 @@ class Canvas(object):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.poll.Poll`
         """
+        from canvasapi.poll import Poll
+
         return PaginatedList(
             Poll,
             self.__requester,
@@ -866,6 +1067,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.progress.Progress`
         """
+        from canvasapi.progress import Progress
+
         progress_id = obj_or_id(progress, "progress", (Progress,))
 
         response = self.__requester.request(
@@ -883,6 +1086,8 @@ class Canvas(object):
         :returns: The OutcomeGroup of the context.
         :rtype: :class:`canvasapi.outcome.OutcomeGroup`
         """
+        from canvasapi.outcome import OutcomeGroup
+
         response = self.__requester.request(
             "GET", "global/root_outcome_group", _kwargs=combine_kwargs(**kwargs)
         )
@@ -903,6 +1108,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.section.Section`
         """
+        from canvasapi.section import Section
+
         if use_sis_id:
             section_id = section
             uri_str = "sections/sis_section_id:{}"
@@ -924,6 +1131,8 @@ class Canvas(object):
 
         :rtype: dict
         """
+        from canvasapi.todo import Todo
+
         return PaginatedList(
             Todo,
             self.__requester,
@@ -968,6 +1177,8 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.user.User`
         """
+        from canvasapi.user import User
+
         if id_type:
             uri = "users/{}:{}".format(id_type, user)
         elif user == "self":
@@ -993,6 +1204,9 @@ class Canvas(object):
 
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of :class:`canvasapi.user.User`
         """
+        from canvasapi.appointment_group import AppointmentGroup
+        from canvasapi.user import User
+
         appointment_group_id = obj_or_id(
             appointment_group, "appointment_group", (AppointmentGroup,)
         )
@@ -1006,6 +1220,70 @@ class Canvas(object):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def graphql(self, query, variables=None, **kwargs):
+        """
+        Makes a GraphQL formatted request to Canvas
+
+        :calls: `POST /api/graphql \
+        <https://canvas.instructure.com/doc/api/file.graphql.html>`_
+
+        :param query: The GraphQL query to execute as a String
+        :type query: str
+        :param variables: The variable values as required by the supplied query
+        :type variables: dict
+
+        :rtype: dict
+        """
+        response = self.__requester.request(
+            "POST",
+            "graphql",
+            headers={"Content-Type": "application/json"},
+            _kwargs=combine_kwargs(**kwargs)
+            + [("query", query), ("variables", variables)],
+            # Needs to call special endpoint without api/v1
+            _url=self.__requester.original_url + "/api/graphql",
+            json=True,
+        )
+
+        return response.json()
+
+    def graphql_batch(self, queries, batch_size=20, max_workers=4, **kwargs):
+        """
+        Run many GraphQL queries, several per request.
+
+        Each query is the selection of a single root field, e.g.
+        `course(id: "1") { name }`, and its result is returned under its
+        name.
+
+        :calls: `POST /api/graphql \
+        <https://canvas.instructure.com/doc/api/file.graphql.html>`_
+
+        :param queries: The selection of every query, keyed by name.
+        :type queries: dict
+        :param batch_size: The maximum number of queries sent in one request.
+        :type batch_size: int
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+
+        :rtype: dict
+        """
+        from canvasapi.graphql import GraphQL
+
+        return GraphQL(self.__requester).batch(
+            queries, batch_size=batch_size, max_workers=max_workers, **kwargs
+        )
+
+    def remove_request_hook(self, event, callback):
+        """
+        Stop calling a function added with :func:`add_request_hook`.
+
+        :param event: "pre_request" or "post_request".
+        :type event: str
+        :param callback: The function to remove.
+        :type callback: callable
+        """
+        self.__requester.remove_hook(event, callback)
+
     # need to revisit
     # def search_accounts(self, **kwargs):
     #     """
@@ -1058,6 +1336,34 @@ class Canvas(object):
     #     )
     #     return response.json()
 
+    def sync_blueprints(self, blueprints, max_workers=8, **kwargs):
+        """
+        Sync many blueprint courses to their associated courses and wait for
+        every migration to finish.
+
+        See :func:`canvasapi.blueprint.sync_blueprints` for the other
+        parameters and the returned DataFrames.
+
+        :calls: `POST /api/v1/courses/:course_id/blueprint_templates/:template_id/migrations \
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/master_templates.queue_migration>`_,
+            `GET /api/v1/courses/:course_id/blueprint_templates/:template_id/migrations/:id \
+        <https://canvas.instructure.com/doc/api/blueprint_courses.html#method.master_courses/master_templates.migrations_show>`_
+
+        :param blueprints: The blueprint templates, or the objects or IDs of
+            blueprint courses to use the default template of.
+        :type blueprints: list of :class:`canvasapi.blueprint.BlueprintTemplate`,
+            :class:`canvasapi.course.Course` or int
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+
+        :rtype: dict of :class:`pandas.DataFrame`
+        """
+        from canvasapi.blueprint import sync_blueprints
+
+        return sync_blueprints(
+            self._get_blueprint_templates(blueprints), max_workers=max_workers, **kwargs
+        )
+
     # POST Methods
     # These are commented out to preserve
 
@@ -1273,33 +1579,6 @@ class Canvas(object):
     #     )
     #     return Poll(self.__requester, response.json()["polls"][0])
 
-    # def graphql(self, query, variables=None, **kwargs):
-    #     """
-    #     Makes a GraphQL formatted request to Canvas
-
-    #     :calls: `POST /api/graphql \
-    #     <https://canvas.instructure.com/doc/api/file.graphql.html>`_
-
-    #     :param query: The GraphQL query to execute as a String
-    #     :type query: str
-    #     :param variables: The variable values as required by the supplied query
-    #     :type variables: dict
-
-    #     :rtype: dict
-    #     """
-    #     response = self.__requester.request(
-    #         "POST",
-    #         "graphql",
-    #         headers={"Content-Type": "application/json"},
-    #         _kwargs=combine_kwargs(**kwargs)
-    #         + [("query", query), ("variables", variables)],
-    #         # Needs to call special endpoint without api/v1
-    #         _url=self.__requester.original_url + "/api/graphql",
-    #         json=True,
-    #     )
-
-    #     return response.json()
-
     # def refresh_jwt(self, jwt, **kwargs):
     #     """
     #     Refreshes a JWT for reuse with other canvas services. It generates a
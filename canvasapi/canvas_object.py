@@ -1,4 +1,4 @@
-import pandas as pd
+from canvasapi.lazy import pandas as pd
 
 
 class CanvasObject(object):
@@ -1,48 +1,20 @@
 import warnings
 
-from canvasapi.assignment import Assignment, AssignmentGroup
-from canvasapi.blueprint import BlueprintSubscription
 from canvasapi.canvas_object import CanvasObject
-from canvasapi.collaboration import Collaboration
-from canvasapi.content_export import ContentExport
-from canvasapi.course_epub_export import CourseEpubExport
-from canvasapi.course_event import CourseEvent
-from canvasapi.custom_gradebook_columns import CustomGradebookColumn
-from canvasapi.discussion_topic import DiscussionTopic
 from canvasapi.exceptions import RequiredFieldMissing
-from canvasapi.external_feed import ExternalFeed
-from canvasapi.feature import Feature, FeatureFlag
-from canvasapi.folder import Folder
-from canvasapi.grade_change_log import GradeChangeEvent
-from canvasapi.gradebook_history import (
-    Day,
-    Grader,
-    SubmissionHistory,
-    SubmissionVersion,
-)
-from canvasapi.grading_period import GradingPeriod
-from canvasapi.grading_standard import GradingStandard
-from canvasapi.license import License
-from canvasapi.module import Module
-from canvasapi.new_quiz import NewQuiz
-from canvasapi.outcome_import import OutcomeImport
+from canvasapi.lazy import pandas as pd
 from canvasapi.page import Page
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.progress import Progress
-from canvasapi.quiz import QuizExtension
-from canvasapi.rubric import Rubric, RubricAssociation
-from canvasapi.submission import GroupedSubmission, Submission
-from canvasapi.tab import Tab
-from canvasapi.todo import Todo
-from canvasapi.upload import FileOrPathLike, Uploader
-from canvasapi.usage_rights import UsageRights
+from canvasapi.upload import FileOrPathLike
 from canvasapi.util import (
+    call_with_retries,
     combine_kwargs,
     file_or_path,
     is_multivalued,
     normalize_bool,
     obj_or_id,
     obj_or_str,
+    run_concurrently,
 )
 
 
@@ -63,6 +35,8 @@ class Course(CanvasObject):
         :type grading_scheme: list of dict
         :rtype: :class:`canvasapi.grading_standards.GradingStandard`
         """
+        from canvasapi.grading_standard import GradingStandard
+
         if not isinstance(grading_scheme_entry, list) or len(grading_scheme_entry) <= 0:
             raise ValueError("Param `grading_scheme_entry` must be a non-empty list.")
 
@@ -83,6 +57,284 @@ class Course(CanvasObject):
         )
         return GradingStandard(self._requester, response.json())
 
+    def bulk_enroll_users(
+        self,
+        enrollments,
+        max_workers=4,
+        retries=3,
+        retry_delay=1,
+        sis_account=None,
+        sis_threshold=1000,
+        **kwargs
+    ):
+        """
+        Enroll many users in this course at once. Enrollments that already
+        exist are skipped, the others are created over a pool of threads,
+        retrying transient failures, or with one SIS import when there are
+        many of them.
+
+        See :func:`canvasapi.enrollment.bulk_enroll_users` for the columns
+        `enrollments` may have and the report returned.
+
+        :calls: `GET /api/v1/courses/:course_id/enrollments \
+        <https://canvas.instructure.com/doc/api/enrollments.html#method.enrollments_api.index>`_,
+            `POST /api/v1/courses/:course_id/enrollments \
+        <https://canvas.instructure.com/doc/api/enrollments.html#method.enrollments_api.create>`_
+
+        :param enrollments: One row per enrollment, with a `user_id` column.
+        :type enrollments: :class:`pandas.DataFrame`
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+        :param retries: How many times a failed request may be repeated.
+        :type retries: int
+        :param retry_delay: Seconds to wait before the first retry.
+        :type retry_delay: float
+        :param sis_account: The account to send SIS imports to. The course
+            must have a `sis_course_id`.
+        :type sis_account: :class:`canvasapi.account.Account`
+        :param sis_threshold: The minimum number of new enrollments sent as a
+            SIS import rather than one request each.
+        :type sis_threshold: int
+
+        :returns: A copy of `enrollments` with `status`, `enrollment_id`,
+            `attempts` and `error` columns.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.enrollment import bulk_enroll_users
+
+        return bulk_enroll_users(
+            self,
+            enrollments,
+            max_workers=max_workers,
+            retries=retries,
+            retry_delay=retry_delay,
+            sis_account=sis_account,
+            sis_threshold=sis_threshold,
+            sis_columns={"course_id": getattr(self, "sis_course_id", None)},
+            **kwargs
+        )
+
+    def bulk_set_extensions(
+        self,
+        extensions,
+        chunk_size=100,
+        max_workers=4,
+        retries=3,
+        retry_delay=1,
+        **kwargs
+    ):
+        """
+        Set the extensions of many students on many quizzes and assignments
+        of the course.
+
+        Rows are grouped by their quiz or assignment. The submissions of
+        every target are listed once, and rows asking for the extension a
+        student already has are skipped. The rest are sent `chunk_size`
+        students at a time on a pool of `max_workers` threads, retrying
+        transient failures. Keyword arguments are sent with every extension
+        request.
+
+        :calls: `GET /api/v1/courses/:course_id/quizzes/:quiz_id/submissions \
+            <https://canvas.instructure.com/doc/api/quiz_submissions.html#method.quizzes/quiz_submissions_api.index>`_
+            and `POST /api/v1/courses/:course_id/quizzes/:quiz_id/extensions \
+            <https://canvas.instructure.com/doc/api/quiz_extensions.html#method.quizzes/quiz_extensions.create>`_
+            or `GET /api/v1/courses/:course_id/assignments/:assignment_id/submissions \
+            <https://canvas.instructure.com/doc/api/submissions.html#method.submissions_api.index>`_
+            and `POST /api/v1/courses/:course_id/assignments/:assignment_id/extensions \
+            <https://canvas.instructure.com/doc/api/assignment_extensions.html#method.assignment_extensions.create>`_
+
+        :param extensions: One row per student and target, with a `user_id`
+            column and a `quiz_id` or `assignment_id` column, one of which is
+            set on every row. The other columns are the extension, e.g.
+            `extra_attempts`, `extra_time` or `manually_unlocked`. Missing
+            values are left out of the request.
+        :type extensions: :class:`pandas.DataFrame`
+        :param chunk_size: The maximum number of students sent in one request.
+        :type chunk_size: int
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+        :param retries: How many times a failed request may be repeated.
+        :type retries: int
+        :param retry_delay: Seconds to wait before the first retry.
+        :type retry_delay: float
+
+        :returns: A copy of `extensions` with a `status` column ("extended",
+            "unchanged", "duplicate" or "failed"), the number of `attempts`
+            made to send the row and the `error` of failed rows.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.assignment import Assignment
+        from canvasapi.quiz import Quiz, QuizSubmission
+        from canvasapi.submission import Submission
+
+        if "user_id" not in extensions.columns:
+            raise ValueError("Missing column(s): user_id")
+
+        targets = []
+        for row in extensions.to_dict("records"):
+            if "quiz_id" in row and not pd.isna(row["quiz_id"]):
+                targets.append(("quiz", int(row["quiz_id"])))
+            elif "assignment_id" in row and not pd.isna(row["assignment_id"]):
+                targets.append(("assignment", int(row["assignment_id"])))
+            else:
+                raise ValueError("Every row needs a `quiz_id` or an `assignment_id`.")
+
+        def get_extension(row):
+            extension = {}
+            for column, value in row.items():
+                if column in ("quiz_id", "assignment_id") or pd.isna(value):
+                    continue
+                if isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                extension[column] = value.item() if hasattr(value, "item") else value
+            return extension
+
+        requested = [get_extension(row) for row in extensions.to_dict("records")]
+        for extension in requested:
+            extension["user_id"] = int(extension["user_id"])
+
+        def get_existing(target):
+            kind, target_id = target
+            if kind == "quiz":
+                submissions = PaginatedList(
+                    QuizSubmission,
+                    self._requester,
+                    "GET",
+                    "courses/{}/quizzes/{}/submissions".format(self.id, target_id),
+                    _root="quiz_submissions",
+                )
+            else:
+                submissions = PaginatedList(
+                    Submission,
+                    self._requester,
+                    "GET",
+                    "courses/{}/assignments/{}/submissions".format(self.id, target_id),
+                )
+            return {
+                int(submission["user_id"]): submission
+                for submission in submissions.to_dataframe().to_dict("records")
+                if not pd.isna(submission.get("user_id"))
+            }
+
+        distinct_targets = list(dict.fromkeys(targets))
+        existing = dict(
+            zip(
+                distinct_targets,
+                run_concurrently(get_existing, distinct_targets, max_workers),
+            )
+        )
+
+        report = extensions.copy()
+        report["status"] = None
+        report["attempts"] = 0
+        report["error"] = None
+
+        seen = set()
+        chunks = {}
+        for index, target, extension in zip(report.index, targets, requested):
+            key = (target, extension["user_id"])
+            if key in seen:
+                report.loc[index, "status"] = "duplicate"
+                continue
+            seen.add(key)
+
+            current = existing[target].get(extension["user_id"], {})
+            if all(
+                column in current and current[column] == value
+                for column, value in extension.items()
+            ):
+                report.loc[index, "status"] = "unchanged"
+                continue
+
+            pending = chunks.setdefault(target, [[]])
+            if len(pending[-1]) == chunk_size:
+                pending.append([])
+            pending[-1].append((index, extension))
+
+        tasks = [
+            (target, chunk)
+            for target, target_chunks in chunks.items()
+            for chunk in target_chunks
+        ]
+
+        def send(task):
+            (kind, target_id), chunk = task
+            context = {"id": target_id, "course_id": self.id}
+            if kind == "quiz":
+                set_extensions = Quiz(self._requester, context).set_extensions
+            else:
+                set_extensions = Assignment(self._requester, context).set_extensions
+
+            attempts = []
+
+            def request():
+                attempts.append(1)
+                return set_extensions([extension for _, extension in chunk], **kwargs)
+
+            try:
+                call_with_retries(request, retries=retries, delay=retry_delay)
+            except Exception as e:
+                return "failed", len(attempts), str(e)
+            return "extended", len(attempts), None
+
+        for (_, chunk), outcome in zip(
+            tasks, run_concurrently(send, tasks, max_workers=max_workers)
+        ):
+            for index, _ in chunk:
+                report.loc[index, ["status", "attempts", "error"]] = outcome
+
+        return report
+
+    def bulk_update_grades(
+        self,
+        grades,
+        chunk_size=500,
+        max_workers=4,
+        interval=1,
+        max_interval=30,
+        backoff=2,
+        timeout=None,
+        **kwargs
+    ):
+        """
+        Update the grades and comments of many submissions in the course.
+        The rows are split into several :func:`submissions_bulk_update` jobs
+        that are posted concurrently and waited for together. `interval`,
+        `max_interval`, `backoff` and `timeout` are described in
+        :class:`canvasapi.poller.Poller`.
+
+        :calls: `POST /api/v1/courses/:course_id/submissions/update_grades \
+        <https://canvas.instructure.com/doc/api/submissions.html#method.submissions_api.bulk_update>`_,
+            `GET /api/v1/progress/:id \
+        <https://canvas.instructure.com/doc/api/progress.html#method.progress.show>`_
+
+        :param grades: One row per submission, with `user_id`, `assignment_id` and
+            `grade` and/or `comment` columns.
+        :type grades: :class:`pandas.DataFrame`
+        :param chunk_size: The maximum number of rows sent per job.
+        :type chunk_size: int
+        :param max_workers: The maximum number of jobs posted, and polled,
+            at the same time.
+        :type max_workers: int
+
+        :returns: A copy of `grades` with the `progress_id`,
+            `workflow_state` and `message` of the job each row was sent in.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.submission import bulk_update_grades
+
+        return bulk_update_grades(
+            self.submissions_bulk_update,
+            grades,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+            **kwargs
+        )
+
     def column_data_bulk_update(self, column_data, **kwargs):
         """
         Set the content of custom columns.
@@ -94,13 +346,17 @@ class Course(CanvasObject):
         :type column_data: list
         :rtype: :class:`canvasapi.progress.Progress`
         """
+        from canvasapi.progress import Progress
 
         kwargs["column_data"] = column_data
 
+        # Sent as json: the form-encoded brackets of every cell make large
+        # updates several times bigger.
         response = self._requester.request(
             "PUT",
             "courses/{}/custom_gradebook_column_data".format(self.id),
-            _kwargs=combine_kwargs(**kwargs),
+            _kwargs=list(kwargs.items()),
+            json=True,
         )
 
         return Progress(self._requester, response.json())
@@ -197,7 +453,8 @@ class Course(CanvasObject):
             "POST",
             "courses/{}/assignments/overrides".format(self.id),
             {"course_id": self.id},
-            _kwargs=combine_kwargs(**kwargs),
+            _kwargs=list(kwargs.items()),
+            json=True,
         )
 
     def create_content_migration(self, migration_type, **kwargs):
@@ -264,6 +521,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.custom_gradebook_columns.CustomGradebookColumn`
         """
+        from canvasapi.custom_gradebook_columns import CustomGradebookColumn
+
         if isinstance(column, dict) and "title" in column:
             kwargs["column"] = column
         else:
@@ -291,6 +550,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.discussion_topic.DiscussionTopic`
         """
+        from canvasapi.discussion_topic import DiscussionTopic
+
         if attachment is not None:
             attachment_file, is_path = file_or_path(attachment)
             attachment = {"attachment": attachment_file}
@@ -320,6 +581,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.course_epub_export.CourseEpubExport`
         """
+        from canvasapi.course_epub_export import CourseEpubExport
+
         response = self._requester.request(
             "POST",
             "courses/{}/epub_exports/".format(self.id),
@@ -339,6 +602,8 @@ class Course(CanvasObject):
         :type url: str
         :rtype: :class:`canvasapi.external_feed.ExternalFeed`
         """
+        from canvasapi.external_feed import ExternalFeed
+
         response = self._requester.request(
             "POST",
             "courses/{}/external_feeds".format(self.id),
@@ -389,6 +654,8 @@ class Course(CanvasObject):
         :type name: str
         :rtype: :class:`canvasapi.folder.Folder`
         """
+        from canvasapi.folder import Folder
+
         response = self._requester.request(
             "POST",
             "courses/{}/folders".format(self.id),
@@ -450,6 +717,8 @@ class Course(CanvasObject):
         :returns: The created module.
         :rtype: :class:`canvasapi.module.Module`
         """
+        from canvasapi.module import Module
+
         if isinstance(module, dict) and "name" in module:
             kwargs["module"] = module
         else:
@@ -475,6 +744,8 @@ class Course(CanvasObject):
         :returns: The newly-created New Quiz object
         :rtype: :class:`canvasapi.new_quiz.NewQuiz`
         """
+        from canvasapi.new_quiz import NewQuiz
+
         endpoint = "courses/{}/quizzes".format(self.id)
 
         response = self._requester.request(
@@ -553,6 +824,8 @@ class Course(CanvasObject):
         :returns: Returns a dictionary with rubric and rubric association.
         :rtype: `dict`
         """
+        from canvasapi.rubric import Rubric, RubricAssociation
+
         response = self._requester.request(
             "POST",
             "courses/{}/rubrics".format(self.id),
@@ -632,6 +905,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.external_feed.ExternalFeed`
         """
+        from canvasapi.external_feed import ExternalFeed
+
         feed_id = obj_or_id(feed, "feed", (ExternalFeed,))
 
         response = self._requester.request(
@@ -729,6 +1004,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.content_export.ContentExport`
         """
+        from canvasapi.content_export import ContentExport
+
         kwargs["export_type"] = export_type
 
         response = self._requester.request(
@@ -738,6 +1015,43 @@ class Course(CanvasObject):
         )
         return ContentExport(self._requester, response.json())
 
+    def export_quizzes(self, quizzes=None, max_workers=4, **kwargs):
+        """
+        Export the submissions of quizzes of this course with their answers,
+        events and statistics. See :func:`canvasapi.quiz.export_quizzes` for
+        the other parameters and the returned DataFrames.
+
+        :param quizzes: The quizzes to export, or all quizzes of the course
+            if omitted.
+        :type quizzes: list of :class:`canvasapi.quiz.Quiz` or int
+        :param max_workers: The maximum number of requests sent at the same
+            time.
+        :type max_workers: int
+
+        :rtype: dict of :class:`pandas.DataFrame`
+        """
+        from canvasapi.quiz import Quiz, export_quizzes
+
+        if quizzes is None:
+            listing = PaginatedList(
+                Quiz, self._requester, "GET", "courses/{}/quizzes".format(self.id)
+            ).to_dataframe()
+            # A course without quizzes lists no columns at all.
+            quizzes = listing["id"] if "id" in listing.columns else []
+
+        quizzes = [
+            Quiz(
+                self._requester,
+                {
+                    "id": obj_or_id(quiz, "quiz", (Quiz,)),
+                    "course_id": self.id,
+                },
+            )
+            for quiz in quizzes
+        ]
+
+        return export_quizzes(quizzes, max_workers=max_workers, **kwargs)
+
     def get_all_outcome_links_in_context(self, **kwargs):
         """
         Get all outcome links for context - BETA
@@ -888,6 +1202,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.assignment.Assignment`
         """
+        from canvasapi.assignment import Assignment, AssignmentGroup
 
         assignment_group_id = obj_or_id(
             assignment_group, "assignment_group", (AssignmentGroup,)
@@ -938,6 +1253,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.collaboration.Collaboration`
         """
+        from canvasapi.collaboration import Collaboration
+
         return PaginatedList(
             Collaboration,
             self._requester,
@@ -959,6 +1276,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.content_export.ContentExport`
         """
+        from canvasapi.content_export import ContentExport
+
         export_id = obj_or_id(content_export, "content_export", (ContentExport,))
 
         response = self._requester.request(
@@ -979,6 +1298,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.content_export.ContentExport`
         """
+        from canvasapi.content_export import ContentExport
+
         return PaginatedList(
             ContentExport,
             self._requester,
@@ -1103,6 +1424,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.custom_gradebook_columns.CustomGradebookColumn`
         """
+        from canvasapi.custom_gradebook_columns import CustomGradebookColumn
+
         return PaginatedList(
             CustomGradebookColumn,
             self._requester,
@@ -1124,6 +1447,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.discussion_topic.DiscussionTopic`
         """
+        from canvasapi.discussion_topic import DiscussionTopic
+
         topic_id = obj_or_id(topic, "topic", (DiscussionTopic,))
 
         response = self._requester.request(
@@ -1147,6 +1472,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.discussion_topic.DiscussionTopic`
         """
+        from canvasapi.discussion_topic import DiscussionTopic
+
         return PaginatedList(
             DiscussionTopic,
             self._requester,
@@ -1205,6 +1532,7 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.course_epub_export.CourseEpubExport`
         """
+        from canvasapi.course_epub_export import CourseEpubExport
 
         epub_id = obj_or_id(epub, "epub", (CourseEpubExport,))
 
@@ -1226,6 +1554,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.external_feed.ExternalFeed`
         """
+        from canvasapi.external_feed import ExternalFeed
+
         return PaginatedList(
             ExternalFeed,
             self._requester,
@@ -1289,6 +1619,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.feature.FeatureFlag`
         """
+        from canvasapi.feature import Feature, FeatureFlag
+
         feature_name = obj_or_str(feature, "name", (Feature,))
 
         response = self._requester.request(
@@ -1308,6 +1640,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.feature.Feature`
         """
+        from canvasapi.feature import Feature
+
         return PaginatedList(
             Feature,
             self._requester,
@@ -1390,6 +1724,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.folder.Folder`
         """
+        from canvasapi.folder import Folder
+
         folder_id = obj_or_id(folder, "folder", (Folder,))
 
         response = self._requester.request(
@@ -1410,6 +1746,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.folder.Folder`
         """
+        from canvasapi.folder import Folder
+
         return PaginatedList(
             Folder,
             self._requester,
@@ -1430,6 +1768,8 @@ class Course(CanvasObject):
 
         :rtype: dict
         """
+        from canvasapi.discussion_topic import DiscussionTopic
+
         topic_id = obj_or_id(topic, "topic", (DiscussionTopic,))
 
         response = self._requester.request(
@@ -1449,6 +1789,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.grade_change_log.GradeChangeEvent`
         """
+        from canvasapi.grade_change_log import GradeChangeEvent
 
         return PaginatedList(
             GradeChangeEvent,
@@ -1459,6 +1800,53 @@ class Course(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def get_gradebook(self, max_workers=4, **kwargs):
+        """
+        Export the whole gradebook of the course as a students by
+        assignments matrix.
+
+        Every submission is listed with a single call to
+        :func:`get_multiple_submissions`, whose pages are requested
+        concurrently, and reshaped with one pivot.
+
+        :calls: `GET /api/v1/courses/:course_id/students/submissions \
+        <https://canvas.instructure.com/doc/api/submissions.html#method.submissions_api.for_students>`_
+
+        :param max_workers: How many pages may be requested at the same time.
+        :type max_workers: int
+
+        :returns: One row per user id and one column per (field, assignment
+            id) pair, where field is "score" (float), "late" or "missing"
+            (nullable booleans). Students who have no submission for an
+            assignment get missing values.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        kwargs.setdefault("student_ids", ["all"])
+        kwargs["grouped"] = False
+
+        values = {"score": "float64", "late": "boolean", "missing": "boolean"}
+
+        submissions = self.get_multiple_submissions(**kwargs).to_dataframe(
+            max_workers=max_workers
+        )
+        submissions = submissions.reindex(
+            columns=["user_id", "assignment_id"] + list(values)
+        )
+        submissions = submissions.dropna(subset=["user_id", "assignment_id"])
+        submissions = submissions.astype(
+            dict(values, user_id="int64", assignment_id="int64")
+        )
+        submissions = submissions.drop_duplicates(
+            subset=["user_id", "assignment_id"], keep="last"
+        )
+
+        gradebook = submissions.pivot(
+            index="user_id", columns="assignment_id", values=list(values)
+        )
+        return gradebook.astype(
+            {column: values[column[0]] for column in gradebook.columns}
+        )
+
     def get_gradebook_history_dates(self, **kwargs):
         """
         Returns a map of dates to grader/assignment groups
@@ -1469,6 +1857,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.grading_history.Day`
         """
+        from canvasapi.gradebook_history import Day
 
         return PaginatedList(
             Day,
@@ -1495,6 +1884,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.gradebook_history.Grader`
         """
+        from canvasapi.gradebook_history import Grader
 
         return PaginatedList(
             Grader,
@@ -1515,6 +1905,7 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.grading_period.GradingPeriod`
         """
+        from canvasapi.grading_period import GradingPeriod
 
         response = self._requester.request(
             "GET",
@@ -1537,6 +1928,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.grading_period.GradingPeriod`
         """
+        from canvasapi.grading_period import GradingPeriod
 
         return PaginatedList(
             GradingPeriod,
@@ -1558,6 +1950,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.grading_standards.GradingStandard`
         """
+        from canvasapi.grading_standard import GradingStandard
+
         return PaginatedList(
             GradingStandard,
             self._requester,
@@ -1636,6 +2030,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.license.License`
         """
+        from canvasapi.license import License
 
         return PaginatedList(
             License,
@@ -1677,6 +2072,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.module.Module`
         """
+        from canvasapi.module import Module
+
         module_id = obj_or_id(module, "module", (Module,))
 
         response = self._requester.request(
@@ -1690,6 +2087,89 @@ class Course(CanvasObject):
 
         return Module(self._requester, module_json)
 
+    def get_module_structure(self, max_workers=4, **kwargs):
+        """
+        Return every module of the course with its items as one flat
+        DataFrame, using as few requests as possible.
+
+        Modules are listed with their items inlined. Canvas leaves the items
+        out of a module when there are too many of them; only those modules
+        have their items fetched, `max_workers` at a time.
+
+        :calls: `GET /api/v1/courses/:course_id/modules \
+        <https://canvas.instructure.com/doc/api/modules.html#method.context_modules_api.index>`_,
+            `GET /api/v1/courses/:course_id/modules/:module_id/items \
+        <https://canvas.instructure.com/doc/api/modules.html#method.context_module_items_api.index>`_
+
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+
+        :returns: One row per module item, ordered by module position and item
+            position. Module attributes are prefixed with `module_` and
+            modules without items get a single row with empty item columns.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.module import ModuleItem
+
+        include = [value for value in kwargs.pop("include", []) if value != "items"]
+        item_kwargs = dict(kwargs, include=include) if include else dict(kwargs)
+
+        modules = self.get_modules(include=include + ["items"], **kwargs).to_dataframe(
+            max_workers=max_workers
+        )
+        if modules.empty:
+            return pd.DataFrame(columns=["module_id", "id", "position"])
+
+        if "items" not in modules.columns:
+            modules["items"] = None
+        if "items_count" not in modules.columns:
+            modules["items_count"] = None
+
+        def is_truncated(module):
+            items = module["items"]
+            if not isinstance(items, list):
+                return True
+            return (
+                not pd.isna(module["items_count"])
+                and len(items) < module["items_count"]
+            )
+
+        def get_items(module):
+            return (
+                PaginatedList(
+                    ModuleItem,
+                    self._requester,
+                    "GET",
+                    "courses/{}/modules/{}/items".format(self.id, module["id"]),
+                    _kwargs=combine_kwargs(**item_kwargs),
+                )
+                .to_dataframe()
+                .to_dict("records")
+            )
+
+        records = modules.to_dict("records")
+        truncated = [module for module in records if is_truncated(module)]
+        overflow = run_concurrently(get_items, truncated, max_workers=max_workers)
+        overflow = {module["id"]: items for module, items in zip(truncated, overflow)}
+
+        rows = []
+        for module in records:
+            for item in overflow.get(module["id"], module["items"]):
+                rows.append(dict(item, module_id=module["id"]))
+
+        items = pd.DataFrame(rows)
+        items = items.reindex(
+            columns=list(dict.fromkeys(["module_id", "id", "position"] + list(items)))
+        )
+
+        modules = modules.drop(columns=["items"]).add_prefix("module_")
+        items["module_id"] = items["module_id"].astype(modules["module_id"].dtype)
+
+        structure = modules.merge(items, on="module_id", how="left")
+        return structure.sort_values(
+            ["module_position", "position"], kind="stable"
+        ).reset_index(drop=True)
+
     def get_modules(self, **kwargs):
         """
         Return a list of modules in this course.
@@ -1700,6 +2180,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.module.Module`
         """
+        from canvasapi.module import Module
+
         return PaginatedList(
             Module,
             self._requester,
@@ -1720,6 +2202,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.submission.Submission`
         """
+        from canvasapi.submission import GroupedSubmission, Submission
 
         is_grouped = kwargs.get("grouped", False)
 
@@ -1751,6 +2234,8 @@ class Course(CanvasObject):
         :returns: A New Quiz object.
         :rtype: :class:`canvasapi.new_quiz.NewQuiz`
         """
+        from canvasapi.assignment import Assignment
+        from canvasapi.new_quiz import NewQuiz
 
         assignment_id = obj_or_id(assignment, "assignment", (Assignment, NewQuiz))
         endpoint = "courses/{}/quizzes/{}".format(self.id, assignment_id)
@@ -1777,6 +2262,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList`
             of :class:`canvasapi.new_quiz.NewQuiz`
         """
+        from canvasapi.new_quiz import NewQuiz
+
         endpoint = "courses/{}/quizzes".format(self.id)
         return PaginatedList(
             NewQuiz,
@@ -1847,6 +2334,8 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.outcome_import.OutcomeImport`
         """
+        from canvasapi.outcome_import import OutcomeImport
+
         if outcome_import == "latest":
             outcome_import_id = "latest"
         else:
@@ -1904,6 +2393,71 @@ class Course(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def get_outcome_results_table(self, max_workers=4, **kwargs):
+        """
+        Get every outcome result of the course as one row per result, with
+        the users, outcomes and alignments they link to joined in.
+
+        :calls: `GET /api/v1/courses/:course_id/outcome_results \
+        <https://canvas.instructure.com/doc/api/outcome_results.html#method.outcome_results.index>`_
+
+        :param max_workers: The maximum number of pages requested at the same
+            time.
+        :type max_workers: int
+
+        :returns: The results with typed `user_id`, `outcome_id`,
+            `alignment_id`, `score` and `submitted_or_assessed_at` columns,
+            and the linked objects in columns prefixed with `user_`,
+            `outcome_` and `alignment_`. Only the objects named in `include`
+            are joined, all three by default.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.outcome import get_outcome_pages, get_outcome_table
+
+        kwargs.setdefault("include", ["alignments", "outcomes", "users"])
+
+        results, linked = get_outcome_pages(
+            self._requester,
+            "courses/{}/outcome_results".format(self.id),
+            "outcome_results",
+            max_workers=max_workers,
+            **kwargs
+        )
+
+        return get_outcome_table(results, linked)
+
+    def get_outcome_rollups_table(self, max_workers=4, **kwargs):
+        """
+        Get the outcome rollups of the course as one row per user and
+        outcome, with the users and outcomes joined in.
+
+        :calls: `GET /api/v1/courses/:course_id/outcome_rollups \
+        <https://canvas.instructure.com/doc/api/outcome_results.html#method.outcome_results.rollups>`_
+
+        :param max_workers: The maximum number of pages requested at the same
+            time.
+        :type max_workers: int
+
+        :returns: The scores with typed `user_id`, `section_id`,
+            `outcome_id`, `score` and `count` columns, and the linked objects
+            in columns prefixed with `user_` and `outcome_`. Only the objects
+            named in `include` are joined, both by default.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        from canvasapi.outcome import get_outcome_pages, get_outcome_table
+
+        kwargs.setdefault("include", ["outcomes", "users"])
+
+        rollups, linked = get_outcome_pages(
+            self._requester,
+            "courses/{}/outcome_rollups".format(self.id),
+            "rollups",
+            max_workers=max_workers,
+            **kwargs
+        )
+
+        return get_outcome_table(rollups, linked)
+
     def get_page(self, url, **kwargs):
         """
         Retrieve the contents of a wiki page.
@@ -2067,6 +2621,8 @@ class Course(CanvasObject):
         :type rubric_id: int
         :rtype: :class:`canvasapi.rubric.Rubric`
         """
+        from canvasapi.rubric import Rubric
+
         response = self._requester.request(
             "GET",
             "courses/%s/rubrics/%s" % (self.id, rubric_id),
@@ -2088,6 +2644,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.rubric.Rubric`
         """
+        from canvasapi.rubric import Rubric
+
         return PaginatedList(
             Rubric,
             self._requester,
@@ -2167,6 +2725,7 @@ class Course(CanvasObject):
         :type grading_standard_id: int
         :rtype: :class:`canvasapi.grading_standards.GradingStandard`
         """
+        from canvasapi.grading_standard import GradingStandard
 
         response = self._requester.request(
             "GET",
@@ -2194,6 +2753,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.gradebook_history.SubmissionHistory`
         """
+        from canvasapi.gradebook_history import SubmissionHistory
 
         return PaginatedList(
             SubmissionHistory,
@@ -2216,6 +2776,8 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.tab.Tab`
         """
+        from canvasapi.tab import Tab
+
         return PaginatedList(
             Tab,
             self._requester,
@@ -2235,6 +2797,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.todo.Todo`
         """
+        from canvasapi.todo import Todo
 
         return PaginatedList(
             Todo,
@@ -2258,6 +2821,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.gradebook_history.SubmissionVersion`
         """
+        from canvasapi.gradebook_history import SubmissionVersion
 
         return PaginatedList(
             SubmissionVersion,
@@ -2398,6 +2962,7 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.outcome_import.OutcomeImport`
         """
+        from canvasapi.outcome_import import OutcomeImport
 
         attachment, is_path = file_or_path(attachment)
 
@@ -2428,6 +2993,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.blueprint.BlueprintSubscription`
         """
+        from canvasapi.blueprint import BlueprintSubscription
 
         return PaginatedList(
             BlueprintSubscription,
@@ -2467,6 +3033,7 @@ class Course(CanvasObject):
 
         :rtype: list of :class:`canvasapi.course_event.CourseEvent`
         """
+        from canvasapi.course_event import CourseEvent
 
         return PaginatedList(
             CourseEvent,
@@ -2559,6 +3126,7 @@ class Course(CanvasObject):
         :rtype: :class:`canvasapi.paginated_list.PaginatedList` of
             :class:`canvasapi.folder.Folder`
         """
+        from canvasapi.folder import Folder
 
         if full_path:
             return PaginatedList(
@@ -2607,6 +3175,7 @@ class Course(CanvasObject):
         ...     }
         ... ])
         """
+        from canvasapi.quiz import QuizExtension
 
         if not isinstance(quiz_extensions, list) or not quiz_extensions:
             raise ValueError("Param `quiz_extensions` must be a non-empty list.")
@@ -2640,6 +3209,7 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.usage_rights.UsageRights`
         """
+        from canvasapi.usage_rights import UsageRights
 
         response = self._requester.request(
             "PUT",
@@ -2678,10 +3248,13 @@ class Course(CanvasObject):
 
         :rtype: :class:`canvasapi.progress.Progress`
         """
+        from canvasapi.progress import Progress
+
         response = self._requester.request(
             "POST",
             "courses/{}/submissions/update_grades".format(self.id),
-            _kwargs=combine_kwargs(**kwargs),
+            _kwargs=list(kwargs.items()),
+            json=True,
         )
         return Progress(self._requester, response.json())
 
@@ -2729,7 +3302,8 @@ class Course(CanvasObject):
             "PUT",
             "courses/{}/assignments/overrides".format(self.id),
             {"course_id": self.id},
-            _kwargs=combine_kwargs(**kwargs),
+            _kwargs=list(kwargs.items()),
+            json=True,
         )
 
     def update_settings(self, **kwargs):
@@ -2759,6 +3333,8 @@ class Course(CanvasObject):
                     and the JSON response from the API.
         :rtype: tuple
         """
+        from canvasapi.upload import Uploader
+
         return Uploader(
             self._requester, "courses/{}/files".format(self.id), file, **kwargs
         ).start()
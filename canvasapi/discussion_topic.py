@@ -1,12 +1,61 @@
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.exceptions import CanvasException
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.util import combine_kwargs, obj_or_id
+from canvasapi.util import combine_kwargs, obj_or_id, run_concurrently
 
 
 class DiscussionTopic(CanvasObject):
     def __str__(self):
         return "{} ({})".format(self.title, self.id)
 
+    def _get_thread_entries(self, url, max_workers, **kwargs):
+        """
+        Walk the thread one level at a time, fetching the replies of every
+        entry of a level concurrently.
+        """
+        records = (
+            PaginatedList(
+                DiscussionEntry,
+                self._requester,
+                "GET",
+                url + "/entries",
+                _kwargs=combine_kwargs(**kwargs),
+            )
+            .to_dataframe(max_workers=max_workers)
+            .drop(columns=["recent_replies", "has_more_replies"], errors="ignore")
+            .to_dict("records")
+        )
+        for record in records:
+            record["parent_id"] = None
+
+        def get_replies(entry):
+            return (
+                PaginatedList(
+                    DiscussionEntry,
+                    self._requester,
+                    "GET",
+                    "{}/entries/{}/replies".format(url, entry["id"]),
+                )
+                .to_dataframe()
+                .to_dict("records")
+            )
+
+        level = records
+        while level:
+            replies = run_concurrently(get_replies, level, max_workers=max_workers)
+
+            next_level = []
+            for entry, entry_replies in zip(level, replies):
+                for reply in entry_replies:
+                    reply["parent_id"] = entry["id"]
+                    next_level.append(reply)
+
+            records.extend(next_level)
+            level = next_level
+
+        return records
+
     @property
     def _parent_id(self):
         """
@@ -124,6 +173,57 @@ class DiscussionTopic(CanvasObject):
         elif self._parent_type == "course":
             return Course(self._requester, response.json())
 
+    def get_thread(self, max_workers=4, **kwargs):
+        """
+        Load every entry of the discussion, at any depth, into a single
+        DataFrame in thread order.
+
+        The cached full-topic view is used when Canvas can serve it, which
+        takes one request whatever the size of the discussion. If the view
+        is unavailable (Canvas answers with a server error while it builds
+        it), the top-level entries and then the replies of each level are
+        fetched instead, `max_workers` requests at a time.
+
+        :calls: `GET /api/v1/courses/:course_id/discussion_topics/:topic_id/view \
+            <https://canvas.instructure.com/doc/api/discussion_topics.html#method.discussion_topics_api.view>`_
+
+            or `GET /api/v1/groups/:group_id/discussion_topics/:topic_id/view \
+            <https://canvas.instructure.com/doc/api/discussion_topics.html#method.discussion_topics_api.view>`_
+
+        :param max_workers: The maximum number of concurrent requests when
+            falling back to fetching replies.
+        :type max_workers: int
+
+        :returns: One row per entry with the `parent_id` of the entry it
+            replies to, its `depth` (0 for top-level entries) and its `path`,
+            the ids from the top-level entry down to it joined with "/".
+            Participants listed by the view are joined on `user_id` as
+            `user_display_name`, `user_avatar_image_url`...
+        :rtype: :class:`pandas.DataFrame`
+        """
+        url = "{}s/{}/discussion_topics/{}".format(
+            self._parent_type, self._parent_id, self.id
+        )
+
+        try:
+            response = self._requester.request(
+                "GET", url + "/view", _kwargs=combine_kwargs(**kwargs)
+            )
+        except CanvasException as e:
+            # Client errors have their own subclasses; anything else means
+            # the view could not be built.
+            if type(e) is not CanvasException:
+                raise
+            records = self._get_thread_entries(url, max_workers, **kwargs)
+            participants = []
+        else:
+            view = response.json()
+            records = _flatten_replies(view.get("view", []))
+            records.extend(view.get("new_entries", []))
+            participants = view.get("participants", [])
+
+        return _build_thread(records, participants)
+
     def get_topic_entries(self, **kwargs):
         """
         Retreive the top-level entries in a discussion topic.
@@ -579,3 +679,51 @@ class DiscussionEntry(CanvasObject):
             super(DiscussionEntry, self).set_attributes(response.json())
 
         return "updated_at" in response.json()
+
+
+def _build_thread(records, participants):
+    children = {}
+    for record in records:
+        children.setdefault(record.get("parent_id"), []).append(record)
+
+    ids = {record["id"] for record in records}
+    roots = [record for record in records if record.get("parent_id") not in ids]
+
+    rows = []
+    stack = [(root, 0, str(root["id"])) for root in reversed(roots)]
+    while stack:
+        record, depth, path = stack.pop()
+        rows.append(dict(record, depth=depth, path=path))
+        for child in reversed(children.get(record["id"], [])):
+            stack.append((child, depth + 1, "{}/{}".format(path, child["id"])))
+
+    thread = pd.DataFrame(rows).reindex(
+        columns=list(
+            dict.fromkeys(
+                ["id", "parent_id", "depth", "path", "user_id"]
+                + [column for row in rows for column in row]
+            )
+        )
+    )
+    thread["parent_id"] = thread["parent_id"].astype("Int64")
+
+    if participants:
+        users = pd.DataFrame(participants).add_prefix("user_")
+        users = users.drop_duplicates(subset="user_id")
+        thread = thread.merge(users, on="user_id", how="left")
+
+    return thread
+
+
+def _flatten_replies(entries, parent_id=None):
+    records = []
+    stack = [(entry, parent_id) for entry in reversed(entries)]
+    while stack:
+        entry, parent_id = stack.pop()
+        record = {key: value for key, value in entry.items() if key != "replies"}
+        record["parent_id"] = parent_id
+        records.append(record)
+        for reply in reversed(entry.get("replies", [])):
+            stack.append((reply, entry["id"]))
+
+    return records
@@ -1,5 +1,7 @@
 from canvasapi.canvas_object import CanvasObject
-from canvasapi.util import combine_kwargs
+from canvasapi.lazy import pandas as pd
+from canvasapi.sis_import import SisImportBuilder
+from canvasapi.util import call_with_retries, combine_kwargs, run_concurrently
 
 
 class Enrollment(CanvasObject):
@@ -87,3 +89,200 @@ class Enrollment(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
         return response.json().get("success", False)
+
+
+# Default SIS import roles of the built-in enrollment types.
+SIS_ROLES = {
+    "StudentEnrollment": "student",
+    "TeacherEnrollment": "teacher",
+    "TaEnrollment": "ta",
+    "ObserverEnrollment": "observer",
+    "DesignerEnrollment": "designer",
+}
+
+
+def bulk_enroll_users(
+    context,
+    enrollments,
+    max_workers=4,
+    retries=3,
+    retry_delay=1,
+    sis_account=None,
+    sis_threshold=1000,
+    sis_columns=None,
+    **kwargs
+):
+    """
+    Enroll many users in a course or section, skipping the enrollments that
+    already exist.
+
+    The current enrollments are listed once and compared with the requested
+    ones on `user_id`, `type` and, when given, `course_section_id` and
+    `role_id`. The remaining rows are sent through `context.enroll_user` on a
+    pool of `max_workers` threads, retrying transient failures. When
+    `sis_account` is given and at least `sis_threshold` rows are left, they
+    are sent as a single enrollments SIS import instead.
+
+    :param context: The course or section to enroll users in.
+    :type context: :class:`canvasapi.course.Course` or
+        :class:`canvasapi.section.Section`
+    :param enrollments: One row per enrollment with a `user_id` column. Other
+        columns are sent as `enrollment[<column>]`, e.g. `type`, `role_id`,
+        `course_section_id` or `enrollment_state`. `type` defaults to
+        "StudentEnrollment". The SIS import route also needs a `sis_user_id`
+        column, and uses the `role` and `sis_section_id` columns if present.
+    :type enrollments: :class:`pandas.DataFrame`
+    :param max_workers: The maximum number of concurrent requests.
+    :type max_workers: int
+    :param retries: How many times a failed request may be repeated.
+    :type retries: int
+    :param retry_delay: Seconds to wait before the first retry.
+    :type retry_delay: float
+    :param sis_account: The account to send SIS imports to.
+    :type sis_account: :class:`canvasapi.account.Account`
+    :param sis_threshold: The minimum number of new enrollments sent as a SIS
+        import rather than one request each.
+    :type sis_threshold: int
+    :param sis_columns: Columns added to every row of the SIS import, e.g.
+        `{"course_id": "CS101"}`.
+    :type sis_columns: dict
+
+    :returns: A copy of `enrollments` with a `status` column ("enrolled",
+        "imported", "exists", "duplicate" or "failed"), the `enrollment_id`
+        created, the number of `attempts` made and the `error` of failed rows.
+    :rtype: :class:`pandas.DataFrame`
+    """
+    if "user_id" not in enrollments.columns:
+        raise ValueError("Missing column(s): user_id")
+
+    defaults = kwargs.pop("enrollment", {})
+    requested = enrollments.copy()
+    if "type" not in requested.columns:
+        requested["type"] = defaults.get("type", "StudentEnrollment")
+    requested["type"] = requested["type"].fillna(
+        defaults.get("type", "StudentEnrollment")
+    )
+
+    keys = ["user_id", "type"] + [
+        column
+        for column in ("course_section_id", "role_id")
+        if column in requested.columns
+    ]
+    existing = context.get_enrollments().to_dataframe(max_workers=max_workers)
+    existing = existing.reindex(columns=keys)
+
+    requested_keys = pd.Series(
+        [_normalize_keys(row) for row in requested[keys].itertuples(index=False)],
+        index=requested.index,
+        dtype=object,
+    )
+    existing_keys = {_normalize_keys(row) for row in existing.itertuples(index=False)}
+
+    report = enrollments.copy()
+    report["status"] = None
+    report["enrollment_id"] = None
+    report["attempts"] = 0
+    report["error"] = None
+
+    exists = [key in existing_keys for key in requested_keys]
+    report.loc[exists, "status"] = "exists"
+    duplicated = requested_keys.duplicated().to_numpy()
+    report.loc[duplicated & report["status"].isna().to_numpy(), "status"] = "duplicate"
+
+    pending = requested[report["status"].isna().to_numpy()]
+    if pending.empty:
+        return report
+
+    if sis_account is not None and len(pending) >= sis_threshold:
+        sis_imports = _import_enrollments(sis_account, pending, sis_columns or {})
+        failed = [
+            sis_import
+            for sis_import in sis_imports
+            if sis_import.workflow_state not in ("imported", "imported_with_messages")
+        ]
+        report.loc[pending.index, "status"] = "failed" if failed else "imported"
+        report.loc[pending.index, "attempts"] = 1
+        if failed:
+            report.loc[pending.index, "error"] = ", ".join(
+                "SIS import {} {}".format(sis_import.id, sis_import.workflow_state)
+                for sis_import in failed
+            )
+        return report
+
+    skipped = {"user_id", "sis_user_id", "sis_section_id", "role"}
+
+    def enroll(row):
+        enrollment = dict(defaults)
+        for column, value in row.items():
+            if column in skipped or value is None or pd.isna(value):
+                continue
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            enrollment[column] = value
+
+        attempts = []
+
+        def request():
+            attempts.append(1)
+            return context.enroll_user(row["user_id"], enrollment=enrollment, **kwargs)
+
+        try:
+            result = call_with_retries(request, retries=retries, delay=retry_delay)
+        except Exception as e:
+            return "failed", None, len(attempts), str(e)
+        return "enrolled", result.id, len(attempts), None
+
+    outcomes = run_concurrently(
+        enroll, pending.to_dict("records"), max_workers=max_workers
+    )
+    for index, outcome in zip(pending.index, outcomes):
+        report.loc[index, ["status", "enrollment_id", "attempts", "error"]] = outcome
+
+    return report
+
+
+def _import_enrollments(account, enrollments, sis_columns):
+    if "sis_user_id" not in enrollments.columns:
+        raise ValueError("Column `sis_user_id` is required to import enrollments.")
+
+    rows = pd.DataFrame(
+        {
+            "user_id": enrollments["sis_user_id"],
+            "role": (
+                enrollments["role"]
+                if "role" in enrollments.columns
+                else enrollments["type"].map(SIS_ROLES)
+            ),
+            "status": "active",
+        }
+    )
+    if "sis_section_id" in enrollments.columns:
+        rows["section_id"] = enrollments["sis_section_id"]
+    for column, value in sis_columns.items():
+        if value is None or pd.isna(value):
+            raise ValueError(
+                "Cannot import enrollments without a SIS {}.".format(column)
+            )
+        rows[column] = value
+
+    if rows["role"].isna().any():
+        raise ValueError("Column `role` is required for custom enrollment types.")
+
+    builder = SisImportBuilder(max_rows=len(rows)).add("enrollments", rows)
+    sis_imports = account.create_sis_import_batches(builder)
+
+    return account.wait_for_sis_imports(sis_imports)
+
+
+def _normalize_keys(row):
+    # Ids read from CSV files or columns with gaps are floats or strings;
+    # compare them the way Canvas returns them.
+    keys = []
+    for value in row:
+        if value is None or pd.isna(value):
+            keys.append(None)
+        elif isinstance(value, float) and value.is_integer():
+            keys.append(str(int(value)))
+        else:
+            keys.append(str(value))
+    return tuple(keys)
@@ -0,0 +1,282 @@
+import http.cookiejar
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from canvasapi.canvas import Canvas
+from canvasapi.util import get_institution_url
+
+logger = logging.getLogger(__name__)
+
+
+class CanvasFactory(object):
+    """
+    Builds :class:`canvasapi.canvas.Canvas` clients for many Canvas
+    instances and access tokens. Clients of the same instance share one
+    session, and so its pool of open connections, whatever their token;
+    each request carries the `Authorization` header of its own client.
+    Every token has a :class:`RateLimitBudget` of its own.
+
+    Example Usage:
+
+    >>> factory = CanvasFactory(pool_maxsize=20)
+    >>> canvas = factory.get_canvas("https://school.instructure.com", token)
+    >>> canvas.get_course(1)
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __init__(
+        self,
+        pool_maxsize=10,
+        min_remaining=100,
+        refill_rate=10,
+        max_wait=60,
+        metrics=None,
+        gzip_min_size=None,
+    ):
+        """
+        :param pool_maxsize: How many connections to each instance are kept
+            open for reuse.
+        :type pool_maxsize: int
+        :param min_remaining: Requests of a token are delayed while its
+            `X-Rate-Limit-Remaining` is estimated below this.
+        :type min_remaining: float
+        :param refill_rate: How much of the rate limit Canvas gives back per
+            second, used to estimate the remaining budget between requests.
+        :type refill_rate: float
+        :param max_wait: The longest a request is delayed, in seconds.
+        :type max_wait: float
+        :param metrics: Optional collector of the requests of every client.
+        :type metrics: :class:`canvasapi.metrics.RequestMetrics`
+        :param gzip_min_size: Passed on to every client. See
+            :class:`canvasapi.canvas.Canvas`.
+        :type gzip_min_size: int
+        """
+        self.pool_maxsize = pool_maxsize
+        self.min_remaining = min_remaining
+        self.refill_rate = refill_rate
+        self.max_wait = max_wait
+        self.metrics = metrics
+        self.gzip_min_size = gzip_min_size
+
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._budgets = {}
+
+    def _create_session(self):
+        session = requests.Session()
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # Cookies set in the response to one token would be sent with the
+        # requests of every other token.
+        session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        return session
+
+    def close(self):
+        """
+        Close the connections of every instance. Clients built before can
+        still be used and open new ones.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions = {}
+
+        for session in sessions:
+            session.close()
+
+    def get_budget(self, base_url, access_token):
+        """
+        Return the rate limit budget of an access token on an instance.
+
+        :param base_url: The base URL of the Canvas instance.
+        :type base_url: str
+        :param access_token: The access token.
+        :type access_token: str
+
+        :rtype: :class:`canvasapi.factory.RateLimitBudget`
+        """
+        key = (_get_host(base_url), access_token.strip())
+        with self._lock:
+            budget = self._budgets.get(key)
+            if budget is None:
+                budget = self._budgets[key] = RateLimitBudget(
+                    self.min_remaining, self.refill_rate, self.max_wait
+                )
+        return budget
+
+    def get_canvas(self, base_url, access_token):
+        """
+        Return a client for an instance and access token that shares the
+        connections of the instance and tracks the rate limit of the token.
+
+        :param base_url: The base URL of the Canvas instance.
+        :type base_url: str
+        :param access_token: The API key to authenticate requests with.
+        :type access_token: str
+
+        :rtype: :class:`canvasapi.canvas.Canvas`
+        """
+        canvas = Canvas(
+            base_url,
+            access_token,
+            metrics=self.metrics,
+            gzip_min_size=self.gzip_min_size,
+            session=self.get_session(base_url),
+        )
+
+        budget = self.get_budget(base_url, access_token)
+        canvas.add_request_hook("pre_request", budget.acquire)
+        canvas.add_request_hook("post_request", budget.record)
+        return canvas
+
+    def get_session(self, base_url):
+        """
+        Return the session shared by the clients of an instance.
+
+        :param base_url: The base URL of the Canvas instance.
+        :type base_url: str
+
+        :rtype: :class:`requests.Session`
+        """
+        host = _get_host(base_url)
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = self._sessions[host] = self._create_session()
+        return session
+
+
+class RateLimitBudget(object):
+    """
+    Follows the `X-Rate-Limit-Remaining` of one access token and delays its
+    requests while the estimated remaining budget is below a threshold, so
+    a busy token slows down instead of being throttled with 403 errors.
+
+    Canvas refills the budget over time, so between responses the
+    remaining budget is estimated from the last one received.
+    """
+
+    def __init__(self, min_remaining=100, refill_rate=10, max_wait=60):
+        """
+        :param min_remaining: Requests are delayed while the estimated
+            remaining budget is below this.
+        :type min_remaining: float
+        :param refill_rate: How much of the budget comes back per second.
+        :type refill_rate: float
+        :param max_wait: The longest a request is delayed, in seconds.
+        :type max_wait: float
+        """
+        self.min_remaining = min_remaining
+        self.refill_rate = refill_rate
+        self.max_wait = max_wait
+
+        self._lock = threading.Lock()
+        self._remaining = None
+        self._updated = None
+        # The X-Request-Cost of the last response, reserved by every
+        # request until its own response arrives.
+        self._cost = 1.0
+        # The cost reserved by every request still waiting for its response,
+        # keyed by the id of its request info, which lives until then.
+        self._reserved = {}
+
+    def _estimate(self):
+        if self._remaining is None:
+            return None
+
+        # `acquire` lowers `_remaining` by the cost of every request, waiting
+        # or not, and resets `_updated` to now; the refill counts from there.
+        return self._remaining + (time.monotonic() - self._updated) * self.refill_rate
+
+    def acquire(self, request_info):
+        """
+        Wait until the budget allows another request. Registered as a
+        `pre_request` hook.
+
+        :param request_info: The request, as described in
+            :func:`canvasapi.requester.Requester.add_hook`.
+        :type request_info: dict
+        """
+        with self._lock:
+            remaining = self._estimate()
+            if remaining is None:
+                return
+
+            # Reserve the cost of this request, so requests sent at the
+            # same time queue up one behind the other.
+            self._remaining = remaining - self._cost
+            self._updated = time.monotonic()
+            self._reserved[id(request_info)] = self._cost
+            if remaining >= self.min_remaining:
+                return
+
+            delay = min(
+                (self.min_remaining - remaining) / self.refill_rate, self.max_wait
+            )
+
+        logger.info(
+            "Rate limit budget low ({:.1f}), waiting {:.2f}s".format(remaining, delay)
+        )
+        time.sleep(delay)
+
+    def get_remaining(self):
+        """
+        Return the estimated remaining budget, or None before the first
+        response.
+
+        :rtype: float
+        """
+        with self._lock:
+            return self._estimate()
+
+    def record(self, request_info, response, elapsed):
+        """
+        Update the budget from the headers of a response. Registered as a
+        `post_request` hook.
+
+        :param request_info: The request, as described in
+            :func:`canvasapi.requester.Requester.add_hook`.
+        :type request_info: dict
+        :param response: The response, or None if none was received.
+        :type response: :class:`requests.Response`
+        :param elapsed: How many seconds the request took.
+        :type elapsed: float
+        """
+        with self._lock:
+            self._reserved.pop(id(request_info), None)
+
+            if response is None:
+                return
+
+            try:
+                remaining = float(response.headers["X-Rate-Limit-Remaining"])
+            except (KeyError, TypeError, ValueError):
+                return
+
+            # The header does not count the requests still in flight yet.
+            self._remaining = remaining - sum(self._reserved.values())
+            self._updated = time.monotonic()
+            try:
+                self._cost = float(response.headers["X-Request-Cost"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+
+def _get_host(base_url):
+    parts = urlsplit(get_institution_url(base_url))
+    return "{}://{}".format(parts.scheme, parts.netloc).lower()
@@ -0,0 +1,163 @@
+from canvasapi.exceptions import CanvasException
+from canvasapi.lazy import pandas as pd
+from canvasapi.util import combine_kwargs, run_concurrently
+
+
+class GraphQL(object):
+    """
+    Runs queries against the GraphQL endpoint of Canvas, following the
+    cursors of connections and sending several queries in one request.
+
+    Example Usage:
+
+    >>> graphql = GraphQL(requester)
+    >>> submissions = graphql.get_connection(
+    ...     '''
+    ...     query ($courseId: ID!, $cursor: String) {
+    ...       course(id: $courseId) {
+    ...         submissionsConnection(first: 100, after: $cursor) {
+    ...           nodes { _id score state }
+    ...           pageInfo { hasNextPage endCursor }
+    ...         }
+    ...       }
+    ...     }
+    ...     ''',
+    ...     "course.submissionsConnection",
+    ...     variables={"courseId": 1},
+    ... )
+    """
+
+    def __init__(self, requester):
+        """
+        :param requester: The requester to send the queries with.
+        :type requester: :class:`canvasapi.requester.Requester`
+        """
+        self._requester = requester
+
+    def batch(self, queries, batch_size=20, max_workers=4, **kwargs):
+        """
+        Run many queries, sending `batch_size` of them per request. Each
+        query is the selection of a single root field, e.g.
+        `course(id: "1") { name }`, and is run under its name as an alias,
+        so the selections cannot use variables. Keyword arguments are sent
+        with every request.
+
+        :param queries: The selection of every query, keyed by a name made
+            of letters, digits and underscores.
+        :type queries: dict
+        :param batch_size: The maximum number of queries sent in one request.
+        :type batch_size: int
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+
+        :returns: The result of every query, keyed by its name.
+        :rtype: dict
+        """
+        names = list(queries)
+        batches = [
+            names[start : start + batch_size]
+            for start in range(0, len(names), batch_size)
+        ]
+
+        def execute(batch):
+            query = "query {{\n{}\n}}".format(
+                "\n".join("{}: {}".format(name, queries[name]) for name in batch)
+            )
+            return self.execute(query, **kwargs)
+
+        results = {}
+        for data in run_concurrently(execute, batches, max_workers):
+            results.update(data)
+
+        return {name: results.get(name) for name in names}
+
+    def execute(self, query, variables=None, operation_name=None, **kwargs):
+        """
+        Run a query and return its data.
+
+        :calls: `POST /api/graphql \
+        <https://canvas.instructure.com/doc/api/file.graphql.html>`_
+
+        :param query: The GraphQL document.
+        :type query: str
+        :param variables: The values of the variables of the query.
+        :type variables: dict
+        :param operation_name: The operation to run when the document has
+            several.
+        :type operation_name: str
+
+        :raises: :class:`canvasapi.exceptions.CanvasException` if Canvas
+            reports errors.
+        :rtype: dict
+        """
+        kwargs = combine_kwargs(**kwargs)
+        kwargs += [("query", query), ("variables", variables or {})]
+        if operation_name:
+            kwargs.append(("operationName", operation_name))
+
+        response = self._requester.request(
+            "POST",
+            headers={"Content-Type": "application/json"},
+            _kwargs=kwargs,
+            _url=self._requester.original_url + "/api/graphql",
+            json=True,
+        )
+        result = response.json()
+
+        if result.get("errors"):
+            raise CanvasException(
+                "GraphQL query failed: {}".format(
+                    "; ".join(error.get("message", "") for error in result["errors"])
+                )
+            )
+
+        return result.get("data", result)
+
+    def get_connection(
+        self, query, path, variables=None, cursor_variable="cursor", **kwargs
+    ):
+        """
+        Run a query over every page of a connection and return its nodes.
+
+        The query must take the cursor as a variable, pass it as the `after`
+        argument of the connection and select `pageInfo { hasNextPage
+        endCursor }` next to `nodes` or `edges { node }`. The query is run
+        again with the `endCursor` of every page until there is no next page.
+        Keyword arguments are sent with every request.
+
+        :param query: The GraphQL document.
+        :type query: str
+        :param path: The fields leading from the root of the data to the
+            connection, joined with ".", e.g. `course.submissionsConnection`.
+        :type path: str
+        :param variables: The values of the other variables of the query.
+        :type variables: dict
+        :param cursor_variable: The name of the cursor variable.
+        :type cursor_variable: str
+
+        :returns: One row per node, the same way
+            :class:`canvasapi.paginated_list.PaginatedList` builds its rows.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        variables = dict(variables or {})
+        variables.setdefault(cursor_variable, None)
+
+        nodes = []
+        while True:
+            connection = self.execute(query, variables, **kwargs)
+            for field in path.split("."):
+                connection = (connection or {}).get(field)
+            if connection is None:
+                break
+
+            if "nodes" in connection:
+                nodes.extend(connection["nodes"] or [])
+            else:
+                nodes.extend(edge["node"] for edge in connection.get("edges") or [])
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage") or not page_info.get("endCursor"):
+                break
+            variables[cursor_variable] = page_info["endCursor"]
+
+        return pd.DataFrame([node for node in nodes if node is not None])
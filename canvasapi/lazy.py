@@ -0,0 +1,47 @@
+import importlib
+import threading
+
+
+class LazyModule(object):
+    """
+    Stands in for a module and imports it the first time one of its
+    attributes is used, so importing CanvasAPI does not pay for heavy
+    dependencies until they are needed.
+
+    >>> pd = LazyModule("pandas")  # pandas is not imported yet
+    >>> pd.DataFrame()  # now it is
+    """
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __getattr__(self, name):
+        value = getattr(self._load(), name)
+        # Later lookups find the attribute directly, without calling
+        # __getattr__ again.
+        self.__dict__[name] = value
+        return value
+
+    def __init__(self, name):
+        """
+        :param name: The name of the module to import, e.g. "pandas".
+        :type name: str
+        """
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+        self.__dict__["_lock"] = threading.Lock()
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return "<LazyModule {} ({})>".format(self._name, state)
+
+    def _load(self):
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self.__dict__["_module"] = importlib.import_module(self._name)
+        return self._module
+
+
+# pandas takes longer to import than the rest of CanvasAPI put together.
+pandas = LazyModule("pandas")
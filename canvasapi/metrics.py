@@ -0,0 +1,327 @@
+import re
+import threading
+from urllib.parse import urlsplit
+
+from canvasapi.lazy import pandas as pd
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Path segments that identify a single object: numeric IDs, SIS and other
+# prefixed IDs (`sis_course_id:A1`) and UUIDs.
+ID_PATTERN = re.compile(
+    r"^(\d+|[a-z_]+:.+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$",
+    re.IGNORECASE,
+)
+
+
+class RequestMetrics(object):
+    """
+    Collects the latency, size, retries and `X-Request-Cost` of every
+    request sent through a :class:`canvasapi.requester.Requester`, per HTTP
+    method and endpoint template (`courses/:id/assignments/:id`).
+
+    Example Usage:
+
+    >>> metrics = RequestMetrics()
+    >>> canvas = Canvas(API_URL, API_KEY, metrics=metrics)
+    >>> course = canvas.get_course(1)
+    >>> metrics.get_dataframe().sort_values("request_cost", ascending=False)
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        :param buckets: The upper bounds, in seconds, of the latency
+            histogram buckets.
+        :type buckets: tuple of float
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def get_dataframe(self):
+        """
+        Return the collected metrics, one row per method and endpoint
+        template. The `latency_le_<bound>` columns hold the cumulative
+        number of requests that took at most that many seconds. The
+        `bytes_*` columns count bodies decompressed and the `wire_bytes_*`
+        columns as they went over the network, gzipped or brotli-compressed
+        where the request or response was.
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        with self._lock:
+            rows = [
+                dict(
+                    method=method,
+                    endpoint=endpoint,
+                    **{
+                        key: value
+                        for key, value in stats.items()
+                        if key != "latency_buckets"
+                    },
+                    **{
+                        "latency_le_{}".format(bound): count
+                        for bound, count in zip(
+                            self.buckets, _cumulate(stats["latency_buckets"])
+                        )
+                    },
+                )
+                for (method, endpoint), stats in sorted(self._endpoints.items())
+            ]
+
+        columns = [
+            "method",
+            "endpoint",
+            "requests",
+            "errors",
+            "retries",
+            "latency_total",
+            "latency_max",
+            "bytes_sent",
+            "bytes_received",
+            "wire_bytes_sent",
+            "wire_bytes_received",
+            "request_cost",
+            "rate_limit_remaining",
+        ] + ["latency_le_{}".format(bound) for bound in self.buckets]
+
+        df = pd.DataFrame(rows, columns=columns)
+        df.insert(
+            df.columns.get_loc("latency_max"),
+            "latency_mean",
+            df["latency_total"] / df["requests"],
+        )
+        return df
+
+    def record(self, request_info, response, elapsed):
+        """
+        Add a request to the metrics. Registered as a `post_request` hook
+        of the requester the collector is passed to.
+
+        :param request_info: The request, as described in
+            :func:`canvasapi.requester.Requester.add_hook`.
+        :type request_info: dict
+        :param response: The response, or None if none was received.
+        :type response: :class:`requests.Response`
+        :param elapsed: How many seconds the request took.
+        :type elapsed: float
+        """
+        key = (request_info["method"], get_endpoint_template(request_info["url"]))
+
+        bytes_sent = bytes_received = wire_bytes_sent = wire_bytes_received = 0
+        cost = remaining = None
+        if response is not None:
+            body = getattr(response.request, "body", None) or b""
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            wire_bytes_sent = bytes_sent = len(body) if isinstance(body, bytes) else 0
+            if bytes_sent and request_info["headers"].get("Content-Encoding") == "gzip":
+                # The last 4 bytes of a gzip stream hold its decompressed size.
+                bytes_sent = int.from_bytes(body[-4:], "little")
+            if request_info.get("stream"):
+                # Reading a streamed body here would consume it.
+                bytes_received = int(response.headers.get("Content-Length", 0))
+                wire_bytes_received = bytes_received
+            else:
+                bytes_received = len(response.content or b"")
+                wire_bytes_received = _get_wire_size(response, bytes_received)
+            cost = _to_float(response.headers.get("X-Request-Cost"))
+            remaining = _to_float(response.headers.get("X-Rate-Limit-Remaining"))
+
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = {
+                    "requests": 0,
+                    "errors": 0,
+                    "retries": 0,
+                    "latency_total": 0.0,
+                    "latency_max": 0.0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "wire_bytes_sent": 0,
+                    "wire_bytes_received": 0,
+                    "request_cost": 0.0,
+                    "rate_limit_remaining": None,
+                    "latency_buckets": [0] * len(self.buckets),
+                }
+
+            stats["requests"] += 1
+            if response is None or response.status_code >= 400:
+                stats["errors"] += 1
+            if request_info.get("attempt"):
+                stats["retries"] += 1
+            stats["latency_total"] += elapsed
+            stats["latency_max"] = max(stats["latency_max"], elapsed)
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+            stats["wire_bytes_sent"] += wire_bytes_sent
+            stats["wire_bytes_received"] += wire_bytes_received
+            if cost is not None:
+                stats["request_cost"] += cost
+            if remaining is not None:
+                stats["rate_limit_remaining"] = remaining
+            for index, bound in enumerate(self.buckets):
+                if elapsed <= bound:
+                    stats["latency_buckets"][index] += 1
+                    break
+
+    def reset(self):
+        """
+        Discard everything collected so far.
+        """
+        with self._lock:
+            self._endpoints = {}
+
+    def to_prometheus(self, prefix="canvasapi"):
+        """
+        Return the collected metrics in the Prometheus text exposition
+        format, labelled by `method` and `endpoint`.
+
+        :param prefix: The prefix of every metric name.
+        :type prefix: str
+
+        :rtype: str
+        """
+        with self._lock:
+            endpoints = [
+                (method, endpoint, dict(stats))
+                for (method, endpoint), stats in sorted(self._endpoints.items())
+            ]
+
+        counters = [
+            ("requests_total", "requests", "counter", "Requests sent."),
+            ("request_errors_total", "errors", "counter", "Requests that failed."),
+            (
+                "request_retries_total",
+                "retries",
+                "counter",
+                "Requests repeated after a transient error.",
+            ),
+            ("request_sent_bytes_total", "bytes_sent", "counter", "Bytes sent."),
+            (
+                "response_received_bytes_total",
+                "bytes_received",
+                "counter",
+                "Bytes received.",
+            ),
+            (
+                "request_sent_wire_bytes_total",
+                "wire_bytes_sent",
+                "counter",
+                "Bytes sent over the network, after compression.",
+            ),
+            (
+                "response_received_wire_bytes_total",
+                "wire_bytes_received",
+                "counter",
+                "Bytes received over the network, before decompression.",
+            ),
+            (
+                "request_cost_total",
+                "request_cost",
+                "counter",
+                "Sum of the X-Request-Cost headers.",
+            ),
+            (
+                "rate_limit_remaining",
+                "rate_limit_remaining",
+                "gauge",
+                "Last X-Rate-Limit-Remaining header.",
+            ),
+        ]
+
+        lines = []
+        for name, key, metric_type, description in counters:
+            name = "{}_{}".format(prefix, name)
+            lines.append("# HELP {} {}".format(name, description))
+            lines.append("# TYPE {} {}".format(name, metric_type))
+            for method, endpoint, stats in endpoints:
+                if stats[key] is None:
+                    continue
+                lines.append(
+                    "{}{{{}}} {}".format(
+                        name, _labels(method, endpoint), _format_value(stats[key])
+                    )
+                )
+
+        name = "{}_request_duration_seconds".format(prefix)
+        lines.append("# HELP {} Time taken by requests.".format(name))
+        lines.append("# TYPE {} histogram".format(name))
+        for method, endpoint, stats in endpoints:
+            labels = _labels(method, endpoint)
+            bounds = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+            counts = _cumulate(stats["latency_buckets"]) + [stats["requests"]]
+            for bound, count in zip(bounds, counts):
+                lines.append(
+                    '{}_bucket{{{},le="{}"}} {}'.format(name, labels, bound, count)
+                )
+            lines.append(
+                "{}_sum{{{}}} {}".format(
+                    name, labels, _format_value(stats["latency_total"])
+                )
+            )
+            lines.append("{}_count{{{}}} {}".format(name, labels, stats["requests"]))
+
+        return "\n".join(lines) + "\n"
+
+
+def get_endpoint_template(url):
+    """
+    Return the endpoint a URL points to with the IDs in its path replaced
+    by `:id`, e.g. `courses/:id/assignments/:id` for
+    `https://example.com/api/v1/courses/1/assignments/2?include[]=rubric`.
+
+    :param url: The URL of a request.
+    :type url: str
+
+    :rtype: str
+    """
+    path = urlsplit(url).path
+    for prefix in ("/api/v1/", "/api/"):
+        if path.startswith(prefix):
+            path = path[len(prefix) :]
+            break
+
+    return "/".join(
+        ":id" if ID_PATTERN.match(segment) else segment
+        for segment in path.strip("/").split("/")
+    )
+
+
+def _cumulate(counts):
+    total = 0
+    cumulative = []
+    for count in counts:
+        total += count
+        cumulative.append(total)
+    return cumulative
+
+
+def _format_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _get_wire_size(response, default):
+    # urllib3 counts the bytes it read from the socket, before decoding
+    # gzip, deflate or brotli.
+    try:
+        return response.raw.tell() or default
+    except AttributeError:
+        return default
+
+
+def _labels(method, endpoint):
+    return 'method="{}",endpoint="{}"'.format(
+        method, endpoint.replace("\\", "\\\\").replace('"', '\\"')
+    )
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -1,6 +1,9 @@
+from urllib.parse import parse_qsl, urlsplit
+
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
-from canvasapi.util import combine_kwargs, obj_or_id
+from canvasapi.util import combine_kwargs, obj_or_id, run_concurrently
 
 
 class Outcome(CanvasObject):
@@ -190,6 +193,122 @@ class OutcomeGroup(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
 
+    def get_tree(self, max_workers=8, **kwargs):
+        """
+        Crawl this outcome group and every group below it, listing the
+        subgroups and links of every group of a level concurrently. Each
+        distinct outcome linked anywhere in the tree is then fetched once.
+
+        :calls: `GET /api/v1/global/outcome_groups/:id/subgroups \
+            <https://canvas.instructure.com/doc/api/outcome_groups.html#method.outcome_groups_api.subgroups>`_
+            or `GET /api/v1/accounts/:account_id/outcome_groups/:id/subgroups \
+            <https://canvas.instructure.com/doc/api/outcome_groups.html#method.outcome_groups_api.subgroups>`_
+            or `GET /api/v1/courses/:course_id/outcome_groups/:id/subgroups \
+            <https://canvas.instructure.com/doc/api/outcome_groups.html#method.outcome_groups_api.subgroups>`_
+            and `GET /api/v1/global/outcome_groups/:id/outcomes \
+            <https://canvas.instructure.com/doc/api/outcome_groups.html#method.outcome_groups_api.outcomes>`_
+            or `GET /api/v1/accounts/:account_id/outcome_groups/:id/outcomes \
+            <https://canvas.instructure.com/doc/api/outcome_groups.html#method.outcome_groups_api.outcomes>`_
+            or `GET /api/v1/courses/:course_id/outcome_groups/:id/outcomes \
+            <https://canvas.instructure.com/doc/api/outcome_groups.html#method.outcome_groups_api.outcomes>`_
+            and `GET /api/v1/outcomes/:id \
+            <https://canvas.instructure.com/doc/api/outcomes.html#method.outcomes_api.show>`_
+
+        :param max_workers: The maximum number of requests sent at the same
+            time.
+        :type max_workers: int
+
+        :returns: Three DataFrames. `groups` has one row per group, this one
+            included, indexed by group id, with `parent_outcome_group_id`,
+            `depth` (0 for this group) and `path`, the ids from this group
+            down joined with "/". `links` has one row per link with the
+            `outcome_group_id` and `outcome_id` it connects. `outcomes` has
+            one row per distinct outcome, indexed by outcome id.
+        :rtype: tuple of :class:`pandas.DataFrame`
+        """
+        context_ref = self.context_ref()
+
+        def get_listing(task):
+            endpoint, group_id = task
+            content_class = OutcomeGroup if endpoint == "subgroups" else OutcomeLink
+            return PaginatedList(
+                content_class,
+                self._requester,
+                "GET",
+                "{}/outcome_groups/{}/{}".format(context_ref, group_id, endpoint),
+                _kwargs=combine_kwargs(**kwargs),
+            ).to_dataframe()
+
+        def get_outcome(outcome_id):
+            response = self._requester.request("GET", "outcomes/{}".format(outcome_id))
+            return response.json()
+
+        root = self.dataframe.iloc[0].to_dict()
+        root.update(depth=0, path=str(root["id"]))
+
+        groups = [root]
+        links = []
+        seen = {root["id"]}
+        level = [root]
+        while level:
+            tasks = [
+                (endpoint, group["id"])
+                for group in level
+                for endpoint in ("subgroups", "outcomes")
+            ]
+            listings = iter(run_concurrently(get_listing, tasks, max_workers))
+
+            next_level = []
+            for parent in level:
+                subgroups, group_links = next(listings), next(listings)
+
+                for group in subgroups.to_dict("records"):
+                    if group["id"] in seen:
+                        continue
+                    seen.add(group["id"])
+                    group.update(
+                        parent_outcome_group_id=parent["id"],
+                        depth=parent["depth"] + 1,
+                        path="{}/{}".format(parent["path"], group["id"]),
+                    )
+                    next_level.append(group)
+
+                for link in group_links.to_dict("records"):
+                    outcome = link.pop("outcome", None) or {}
+                    link.pop("outcome_group", None)
+                    link.update(
+                        outcome_group_id=parent["id"], outcome_id=outcome.get("id")
+                    )
+                    links.append(link)
+
+            groups.extend(next_level)
+            level = next_level
+
+        outcome_ids = list(
+            dict.fromkeys(
+                link["outcome_id"] for link in links if link["outcome_id"] is not None
+            )
+        )
+        outcomes = run_concurrently(get_outcome, outcome_ids, max_workers)
+
+        groups = pd.DataFrame(groups)
+        columns = ["id", "title", "parent_outcome_group_id", "depth", "path"]
+        groups = groups.reindex(columns=list(dict.fromkeys(columns + list(groups))))
+        groups["parent_outcome_group_id"] = groups["parent_outcome_group_id"].astype(
+            "Int64"
+        )
+
+        links = pd.DataFrame(links)
+        columns = ["outcome_group_id", "outcome_id"]
+        links = links.reindex(columns=list(dict.fromkeys(columns + list(links))))
+
+        outcomes = pd.DataFrame(outcomes)
+        outcomes = outcomes.reindex(
+            columns=list(dict.fromkeys(["id"] + list(outcomes)))
+        )
+
+        return groups.set_index("id"), links, outcomes.set_index("id")
+
     def import_outcome_group(self, outcome_group, **kwargs):
         """
         Import an outcome group as a subgroup into the current outcome group
@@ -340,3 +459,139 @@ class OutcomeGroup(CanvasObject):
 class OutcomeResult(CanvasObject):
     def __str__(self):
         return "{} ({})".format(self.id, self.score)
+
+
+def get_outcome_pages(requester, endpoint, root, max_workers=4, **kwargs):
+    """
+    Fetch every page of an outcome results or rollups listing. These
+    endpoints nest their rows under `root` and the objects requested through
+    `include[]` under `linked`, which are gathered from every page. Pages are
+    requested concurrently when Canvas reports how many there are.
+
+    :param requester: The requester to send the requests with.
+    :type requester: :class:`canvasapi.requester.Requester`
+    :param endpoint: The listing to fetch, e.g. `courses/1/outcome_results`.
+    :type endpoint: str
+    :param root: The key of the rows in each page, e.g. `outcome_results`.
+    :type root: str
+    :param max_workers: The maximum number of pages requested at the same
+        time.
+    :type max_workers: int
+
+    :returns: The rows of every page, and the linked objects of every page
+        keyed by type.
+    :rtype: tuple of list and dict
+    """
+    kwargs.setdefault("per_page", 100)
+
+    rows = []
+    linked = {}
+
+    def collect(response):
+        data = response.json()
+        rows.extend(data.get(root) or [])
+        for key, objects in (data.get("linked") or {}).items():
+            linked.setdefault(key, []).extend(objects)
+        return (data.get("meta") or {}).get("pagination", {})
+
+    def get_page(page):
+        return requester.request(
+            "GET", endpoint, _kwargs=combine_kwargs(page=page, **kwargs)
+        )
+
+    response = requester.request("GET", endpoint, _kwargs=combine_kwargs(**kwargs))
+    pagination = collect(response)
+
+    page_count = pagination.get("page_count")
+    if page_count is None and "last" in response.links:
+        last = dict(parse_qsl(urlsplit(response.links["last"]["url"]).query))
+        if last.get("page", "").isdigit():
+            page_count = int(last["page"])
+
+    if page_count is not None:
+        pages = range(2, int(page_count) + 1)
+        for response in run_concurrently(get_page, pages, max_workers):
+            collect(response)
+        return rows, linked
+
+    # Without a page count, follow the `next` links one after the other.
+    while True:
+        next_url = response.links.get("next", {}).get("url") or pagination.get("next")
+        if not next_url:
+            return rows, linked
+        response = requester.request("GET", _url=next_url)
+        pagination = collect(response)
+
+
+def get_outcome_table(rows, linked):
+    """
+    Flatten the rows of an outcome results or rollups listing into a typed
+    DataFrame. Rollups are exploded into one row per score. The ids under
+    `links` become `user_id`, `section_id`, `outcome_id` and `alignment_id`
+    columns, and the linked users, outcomes and alignments are joined in
+    with their columns prefixed the same way.
+
+    :param rows: The rows returned by :func:`get_outcome_pages`.
+    :type rows: list of dict
+    :param linked: The linked objects returned by :func:`get_outcome_pages`.
+    :type linked: dict
+
+    :rtype: :class:`pandas.DataFrame`
+    """
+
+    def get_links(row):
+        return {
+            "{}_id".format("outcome" if key == "learning_outcome" else key): value
+            for key, value in (row.get("links") or {}).items()
+        }
+
+    records = []
+    for row in rows:
+        record = {key: value for key, value in row.items() if key != "links"}
+        record.update(get_links(row))
+        if "scores" not in row:
+            records.append(record)
+            continue
+
+        del record["scores"]
+        for score in row["scores"]:
+            records.append(
+                dict(
+                    record,
+                    **{key: value for key, value in score.items() if key != "links"},
+                    **get_links(score)
+                )
+            )
+
+    table = pd.DataFrame(records)
+
+    for column in ("user_id", "section_id", "outcome_id", "count"):
+        if column in table:
+            table[column] = pd.to_numeric(table[column]).astype("Int64")
+    for column in ("score", "percent", "possible", "mastery"):
+        if column in table:
+            table[column] = pd.to_numeric(table[column]).astype("float64")
+    for column in ("submitted_at", "submitted_or_assessed_at"):
+        if column in table:
+            table[column] = pd.to_datetime(table[column], utc=True)
+    if "alignment_id" in table:
+        table["alignment_id"] = table["alignment_id"].astype("string")
+
+    for key, prefix in (
+        ("users", "user_"),
+        ("outcomes", "outcome_"),
+        ("alignments", "alignment_"),
+    ):
+        column = prefix + "id"
+        if column not in table or not linked.get(key):
+            continue
+
+        objects = pd.DataFrame(linked[key]).add_prefix(prefix)
+        objects = objects.drop_duplicates(subset=column)
+        if column == "alignment_id":
+            objects[column] = objects[column].astype("string")
+        else:
+            objects[column] = pd.to_numeric(objects[column]).astype("Int64")
+        table = table.merge(objects, on=column, how="left")
+
+    return table
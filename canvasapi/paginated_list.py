@@ -1,5 +1,11 @@
 import re
-import pandas as pd
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from canvasapi.lazy import pandas as pd
+from canvasapi.metrics import get_endpoint_template
+from canvasapi.tracing import get_tracer
+from canvasapi.util import run_concurrently
 
 
 class PaginatedList(object):
@@ -16,21 +22,26 @@ class PaginatedList(object):
                 results = []
                 return_type = kwargs.pop('return_type', None)  # Extract the return_type argument
 
-                for _, row in self._df.iterrows():
-                    # Pass the current PaginatedList as the context
-                    obj = self._content_class(self._requester, row.to_dict(), context=self)
-                    result = getattr(obj, name)(*args, **kwargs)
-
-                    if return_type:
-                        context_result = obj.get_context(return_type)
-                        if context_result:
-                            results.append(context_result.dataframe)
-                        continue
-
-                    if isinstance(result, PaginatedList):
-                        results.append(result._df)
-                    elif isinstance(result, object):
-                        results.append(result.dataframe)
+                with get_tracer().start_span(
+                    "PaginatedList.{}".format(name),
+                    content_class=self._content_class.__name__,
+                    rows=len(self._df),
+                ):
+                    for _, row in self._df.iterrows():
+                        # Pass the current PaginatedList as the context
+                        obj = self._content_class(self._requester, row.to_dict(), context=self)
+                        result = getattr(obj, name)(*args, **kwargs)
+
+                        if return_type:
+                            context_result = obj.get_context(return_type)
+                            if context_result:
+                                results.append(context_result.dataframe)
+                            continue
+
+                        if isinstance(result, PaginatedList):
+                            results.append(result._df)
+                        elif isinstance(result, object):
+                            results.append(result.dataframe)
 
                 return pd.concat(results, ignore_index=True)
             return method
@@ -72,11 +83,22 @@ class PaginatedList(object):
         self._first_params = kwargs or {}
         self._first_params["per_page"] = kwargs.get("per_page", 100)
         self._next_url = first_url
+        self._last_url = None
         self._next_params = self._first_params
         self._extra_attribs = extra_attribs or {}
         self._request_method = request_method
         self._root = _root
         self._url_override = _url_override
+        self._pages = 0
+
+        self._snapshot_path = None
+        self._snapshot_rows = 0
+        self._snapshot_store = getattr(requester, "snapshot_store", None)
+        if self._snapshot_store is not None:
+            if not self._snapshot_store.is_stored(self):
+                self._snapshot_store = None
+            elif self._snapshot_store.restore(self):
+                return
 
         # Make the initial API call to populate the DataFrame with the first page of data
         self._grow()
@@ -89,20 +111,111 @@ class PaginatedList(object):
         return "<PaginatedList of type {}>".format(self._content_class.__name__)
 
     def _get_next_page(self):
+        self._pages += 1
+        new_df, self._next_url, self._last_url = self._get_page(
+            self._next_url, self._next_params, self._pages
+        )
+        self._next_params = {}
+
+        return new_df
+
+    def _get_page(self, url, params, page=None):
+        with get_tracer().start_span(
+            "PaginatedList page",
+            content_class=self._content_class.__name__,
+            endpoint=get_endpoint_template(url),
+            page=page,
+        ) as span:
+            new_df, next_url, last_url, dataframe_seconds = self._request_page(
+                url, params
+            )
+            span.set_attribute("rows", len(new_df))
+            span.set_attribute("dataframe_seconds", dataframe_seconds)
+
+        return new_df, next_url, last_url
+
+    def _get_remaining_page_urls(self):
+        """
+        Build the URLs of every page not fetched yet from the `next` and
+        `last` links. Returns an empty list when Canvas did not send a
+        `last` link or pages are numbered with opaque bookmarks.
+        """
+        if self._next_url is None or self._last_url is None:
+            return []
+
+        next_url = urlsplit(self._next_url)
+        next_query = parse_qsl(next_url.query)
+        next_page = dict(next_query).get("page", "")
+        last_page = dict(parse_qsl(urlsplit(self._last_url).query)).get("page", "")
+        if not (next_page.isdigit() and last_page.isdigit()):
+            return []
+
+        urls = []
+        for page in range(int(next_page), int(last_page) + 1):
+            query = [(k, str(page) if k == "page" else v) for k, v in next_query]
+            urls.append(urlunsplit(next_url._replace(query=urlencode(query))))
+
+        return urls
+
+    def _get_up_to_index(self, index):
+        while len(self._df) <= index and self._has_next():
+            self._grow()
+
+    def _grow(self):
+        new_elements = self._get_next_page()
+        if self._filters:
+            new_elements = self.apply_filters(new_elements, self._filters)
+        new_df = pd.DataFrame(new_elements)
+        self._df = pd.concat([self._df, new_df], ignore_index=True)
+
+        if self._snapshot_store is not None:
+            self._snapshot_store.save(self)
+
+    def _grow_concurrently(self, max_workers):
+        urls = self._get_remaining_page_urls()
+        if not urls:
+            return
+
+        first_page = self._pages + 1
+        self._pages += len(urls)
+        pages = run_concurrently(
+            lambda page: self._get_page(urls[page - first_page], {}, page),
+            range(first_page, self._pages + 1),
+            max_workers=max_workers,
+        )
+
+        frames = [new_df for new_df, _, _ in pages]
+        if self._filters:
+            frames = [self.apply_filters(frame, self._filters) for frame in frames]
+        self._df = pd.concat([self._df] + frames, ignore_index=True)
+
+        _, self._next_url, self._last_url = pages[-1]
+
+        if self._snapshot_store is not None:
+            self._snapshot_store.save(self)
+
+    def _has_next(self):
+        return self._next_url is not None
+
+    def _is_larger_than(self, index):
+        return len(self._df) > index or self._has_next()
+
+    def _request_page(self, url, params):
         response = self._requester.request(
             self._request_method,
-            self._next_url,
+            url,
             _url=self._url_override,
-            **self._next_params,
+            **params,
         )
         data = response.json()
-        self._next_url = None
         # Check the response headers first. This is the normal Canvas convention
         # for pagination, but there are endpoints which return a `meta` property
         # for pagination instead.
         # See https://github.com/ucfopen/canvasapi/discussions/605
+        last_link = None
         if response.links:
             next_link = response.links.get("next")
+            last_link = response.links.get("last")
         elif isinstance(data, dict) and "meta" in data:
             # requests parses headers into dicts, this returns the same
             # structure so the regex will still work.
@@ -115,11 +228,8 @@ class PaginatedList(object):
 
         regex = r"{}(.*)".format(re.escape(self._requester.base_url))
 
-        self._next_url = (
-            re.search(regex, next_link["url"]).group(1) if next_link else None
-        )
-
-        self._next_params = {}
+        next_url = re.search(regex, next_link["url"]).group(1) if next_link else None
+        last_url = re.search(regex, last_link["url"]).group(1) if last_link else None
 
         content = []
 
@@ -135,6 +245,7 @@ class PaginatedList(object):
             if element is not None:
                 content.append(element)
 
+        start = time.perf_counter()
         new_df = pd.DataFrame(content)
 
         # If there are extra attributes, add them as new columns
@@ -142,24 +253,7 @@ class PaginatedList(object):
             for key, value in self._extra_attribs.items():
                 new_df[key] = value
 
-        return new_df
-
-    def _get_up_to_index(self, index):
-        while len(self._df) <= index and self._has_next():
-            self._grow()
-
-    def _grow(self):
-        new_elements = self._get_next_page()
-        if self._filters:
-            new_elements = self.apply_filters(new_elements, self._filters)
-        new_df = pd.DataFrame(new_elements)
-        self._df = pd.concat([self._df, new_df], ignore_index=True)
-
-    def _has_next(self):
-        return self._next_url is not None
-
-    def _is_larger_than(self, index):
-        return len(self._df) > index or self._has_next()
+        return new_df, next_url, last_url, time.perf_counter() - start
 
     def apply_filters(self, df, filters):
         operators_pattern = re.compile(r'^([><≥≤!=≠<>]+)')
@@ -216,3 +310,23 @@ class PaginatedList(object):
             mask &= column_mask
 
         return df[mask].reset_index(drop=True)
+
+    def to_dataframe(self, max_workers=1):
+        """
+        Fetch every page that has not been requested yet and return all of
+        the rows as a single DataFrame.
+
+        :param max_workers: How many pages may be requested at the same time.
+            Pages are only fetched concurrently when Canvas reports the
+            number of the last page; otherwise they are fetched in order.
+        :type max_workers: int
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        if max_workers > 1:
+            self._grow_concurrently(max_workers)
+
+        while self._has_next():
+            self._grow()
+
+        return self._df
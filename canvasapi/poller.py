@@ -0,0 +1,144 @@
+import logging
+import time
+
+from canvasapi.exceptions import CanvasException
+from canvasapi.util import run_concurrently
+
+logger = logging.getLogger(__name__)
+
+
+class Poller(object):
+    """
+    Tracks asynchronous Canvas jobs (reports, imports, progress objects...)
+    and refreshes them until they are finished, waiting a little longer
+    between each round.
+    """
+
+    def __init__(
+        self, interval=1, max_interval=30, backoff=2, timeout=None, max_workers=1
+    ):
+        """
+        :param interval: Seconds to wait before the first refresh.
+        :type interval: float
+        :param max_interval: Upper bound on the wait between two refreshes.
+        :type max_interval: float
+        :param backoff: Factor the wait is multiplied by after every round.
+        :type backoff: float
+        :param timeout: Seconds after which waiting is abandoned with a
+            :class:`canvasapi.exceptions.CanvasException`, or None to wait
+            forever.
+        :type timeout: float
+        :param max_workers: How many jobs may be refreshed at the same time
+            during a round.
+        :type max_workers: int
+        """
+        if backoff < 1:
+            raise ValueError("Parameter `backoff` must be greater than or equal to 1.")
+
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+        self._jobs = {}
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def _refresh(self, pending):
+        keys = list(pending)
+
+        def refresh(key):
+            job, refresh, _ = pending[key]
+            return refresh(job)
+
+        jobs = run_concurrently(refresh, keys, max_workers=self.max_workers)
+
+        for key, job in zip(keys, jobs):
+            _, refresh, is_done = pending[key]
+            yield key, job, refresh, is_done
+
+    def _wait(self, jobs):
+        results = {}
+        pending = {}
+        for key, (job, refresh, is_done) in jobs.items():
+            if is_done(job):
+                results[key] = job
+            else:
+                pending[key] = (job, refresh, is_done)
+
+        interval = self.interval
+        started = time.monotonic()
+
+        while pending:
+            if self.timeout is not None:
+                remaining = self.timeout - (time.monotonic() - started)
+                if remaining <= 0:
+                    raise CanvasException(
+                        "Timed out waiting for {} job(s) to finish: {}".format(
+                            len(pending), ", ".join(str(key) for key in pending)
+                        )
+                    )
+                interval = min(interval, remaining)
+
+            logger.debug(
+                "Waiting {:.1f}s before polling {} job(s)".format(
+                    interval, len(pending)
+                )
+            )
+            time.sleep(interval)
+
+            for key, job, refresh, is_done in self._refresh(pending):
+                if is_done(job):
+                    results[key] = job
+                    del pending[key]
+                else:
+                    pending[key] = (job, refresh, is_done)
+
+            interval = min(interval * self.backoff, self.max_interval)
+
+        return {key: results[key] for key in jobs}
+
+    def add(self, key, job, refresh, is_done):
+        """
+        Start tracking a job.
+
+        :param key: A hashable identifier for the job.
+        :param job: The current state of the job.
+        :param refresh: Called with the current state of the job, returns the
+            updated state.
+        :type refresh: callable
+        :param is_done: Called with the current state of the job, returns True
+            once the job no longer needs to be polled.
+        :type is_done: callable
+        """
+        self._jobs[key] = (job, refresh, is_done)
+
+    def wait(self):
+        """
+        Refresh every tracked job until all of them are done.
+
+        :returns: The final state of every job, keyed the same way they were
+            added.
+        :rtype: dict
+        """
+        jobs, self._jobs = self._jobs, {}
+        return self._wait(jobs)
+
+    def wait_for(self, job, refresh, is_done):
+        """
+        Refresh a single job until it is done. Jobs added with
+        :func:`add` are left alone.
+
+        :param job: The current state of the job.
+        :param refresh: Called with the current state of the job, returns the
+            updated state.
+        :type refresh: callable
+        :param is_done: Called with the current state of the job, returns True
+            once the job no longer needs to be polled.
+        :type is_done: callable
+
+        :returns: The final state of the job.
+        """
+        return self._wait({None: (job, refresh, is_done)})[None]
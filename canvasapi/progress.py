@@ -1,4 +1,7 @@
+from functools import partial
+
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.poller import Poller
 from canvasapi.util import combine_kwargs
 
 
@@ -6,6 +9,9 @@ class Progress(CanvasObject):
     def __str__(self):
         return "{} - {} ({})".format(self.tag, self.workflow_state, self.id)
 
+    def _is_finished(self):
+        return self.workflow_state in ("completed", "failed")
+
     def query(self, **kwargs):
         """
         Return completion and status information about an asynchronous job.
@@ -25,3 +31,27 @@ class Progress(CanvasObject):
         super(Progress, self).set_attributes(response_json)
 
         return Progress(self._requester, response_json)
+
+    def wait(self, interval=1, max_interval=30, backoff=2, timeout=None, **kwargs):
+        """
+        Poll this job until it has completed or failed. `interval`,
+        `max_interval`, `backoff` and `timeout` are described in
+        :class:`canvasapi.poller.Poller`.
+
+        :calls: `GET /api/v1/progress/:id \
+        <https://canvas.instructure.com/doc/api/progress.html#method.progress.show>`_
+
+        :returns: The job in its final state. Check `workflow_state` for
+            failures.
+        :rtype: :class:`canvasapi.progress.Progress`
+        """
+        poller = Poller(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+        )
+
+        return poller.wait_for(
+            self, partial(Progress.query, **kwargs), Progress._is_finished
+        )
@@ -1,10 +1,20 @@
+from functools import partial
+
 from canvasapi.canvas_object import CanvasObject
-from canvasapi.exceptions import RequiredFieldMissing
+from canvasapi.exceptions import CanvasException, RequiredFieldMissing
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
+from canvasapi.poller import Poller
 from canvasapi.quiz_group import QuizGroup
 from canvasapi.submission import Submission
 from canvasapi.user import User
-from canvasapi.util import combine_kwargs, obj_or_id
+from canvasapi.util import (
+    call_with_retries,
+    combine_kwargs,
+    obj_or_id,
+    run_concurrently,
+    stream_csv,
+)
 
 
 class Quiz(CanvasObject):
@@ -209,6 +219,20 @@ class Quiz(CanvasObject):
 
         return Quiz(self._requester, quiz_json)
 
+    def export(self, max_workers=4, **kwargs):
+        """
+        Export every submission of this quiz with its answers, events and
+        the quiz statistics. See :func:`canvasapi.quiz.export_quizzes` for
+        the parameters and the returned DataFrames.
+
+        :param max_workers: The maximum number of requests sent at the same
+            time.
+        :type max_workers: int
+
+        :rtype: dict of :class:`pandas.DataFrame`
+        """
+        return export_quizzes([self], max_workers=max_workers, **kwargs)
+
     def get_all_quiz_reports(self, **kwargs):
         """
         Get a list of all quiz reports for this quiz
@@ -731,6 +755,32 @@ class QuizReport(CanvasObject):
     def __str__(self):
         return "{} ({})".format(self.report_type, self.id)
 
+    def _is_finished(self):
+        progress = getattr(self, "progress", None)
+        if isinstance(progress, dict) and progress.get("workflow_state") in (
+            "completed",
+            "failed",
+        ):
+            return True
+        return isinstance(getattr(self, "file", None), dict)
+
+    def _refresh(self, **kwargs):
+        # The file and progress are needed to tell when the report is done.
+        kwargs["include"] = ["file", "progress"]
+
+        response = self._requester.request(
+            "GET",
+            "courses/{}/quizzes/{}/reports/{}".format(
+                self.course_id, self.quiz_id, self.id
+            ),
+            _kwargs=combine_kwargs(**kwargs),
+        )
+
+        response_json = response.json()
+        response_json.update({"course_id": self.course_id})
+
+        return QuizReport(self._requester, response_json)
+
     def abort_or_delete(self, **kwargs):
         """
         This API allows you to cancel a previous request you issued for a report to be generated.
@@ -753,6 +803,56 @@ class QuizReport(CanvasObject):
 
         return response.status_code == 204
 
+    def get_dataframe(self, chunksize=100000, **kwargs):
+        """
+        Download the file of this generated report into a single DataFrame.
+        The file is streamed and parsed chunk by chunk, so only the parsed
+        rows are held in memory.
+
+        :param chunksize: The number of rows parsed at a time.
+        :type chunksize: int
+        :param kwargs: Passed on to :func:`pandas.read_csv`, e.g. `dtype`,
+            `parse_dates` or `usecols`.
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        try:
+            url = self.file["url"]
+        except (AttributeError, KeyError, TypeError):
+            raise CanvasException(
+                "Quiz report {} has no file to download.".format(self.id)
+            )
+
+        chunks = list(stream_csv(self._requester, url, chunksize=chunksize, **kwargs))
+        if not chunks:
+            return pd.DataFrame()
+
+        return pd.concat(chunks, ignore_index=True)
+
+    def wait(self, interval=1, max_interval=30, backoff=2, timeout=None, **kwargs):
+        """
+        Poll this report until Canvas has finished generating its file.
+        `interval`, `max_interval`, `backoff` and `timeout` are described in
+        :class:`canvasapi.poller.Poller`.
+
+        :calls: `GET /api/v1/courses/:course_id/quizzes/:quiz_id/reports/:id \
+        <https://canvas.instructure.com/doc/api/quiz_reports.html#method.quizzes/quiz_reports.show>`_
+
+        :returns: The report in its final state. It has a `file` once it was
+            generated successfully.
+        :rtype: :class:`canvasapi.quiz.QuizReport`
+        """
+        poller = Poller(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+        )
+
+        return poller.wait_for(
+            self, partial(QuizReport._refresh, **kwargs), QuizReport._is_finished
+        )
+
 
 class QuizSubmissionEvent(CanvasObject):
     def __str__(self):
@@ -857,3 +957,239 @@ class QuizSubmissionQuestion(CanvasObject):
 class QuizAssignmentOverrideSet(CanvasObject):
     def __str__(self):
         return "Overrides for quiz_id {}".format(self.quiz_id)
+
+
+def export_quizzes(
+    quizzes,
+    max_workers=4,
+    answers=True,
+    events=True,
+    statistics=True,
+    report=False,
+    interval=1,
+    max_interval=30,
+    backoff=2,
+    timeout=None,
+    retries=3,
+    retry_delay=1,
+):
+    """
+    Export the submissions of several quizzes with their answers, events
+    and statistics. Each step, from listing the submissions of every quiz
+    to fetching the answers and events of every submission, sends at most
+    `max_workers` requests at the same time.
+
+    Requests failing with a transient error are retried. Answers, events,
+    statistics and reports that still cannot be fetched are listed in the
+    `errors` DataFrame instead of aborting the export.
+
+    :calls: `GET /api/v1/courses/:course_id/quizzes/:quiz_id/submissions \\
+        <https://canvas.instructure.com/doc/api/quiz_submissions.html#method.quizzes/quiz_submissions_api.index>`_
+        and `GET /api/v1/quiz_submissions/:quiz_submission_id/questions \\
+        <https://canvas.instructure.com/doc/api/quiz_submission_questions.html#method.quizzes/quiz_submission_questions.index>`_
+        and `GET /api/v1/courses/:course_id/quizzes/:quiz_id/submissions/:id/events \\
+        <https://canvas.instructure.com/doc/api/quiz_submission_events.html#method.quizzes/quiz_submission_events_api.index>`_
+        and `GET /api/v1/courses/:course_id/quizzes/:quiz_id/statistics \\
+        <https://canvas.instructure.com/doc/api/quiz_statistics.html#method.quizzes/quiz_statistics.index>`_
+
+    :param quizzes: The quizzes to export.
+    :type quizzes: list of :class:`canvasapi.quiz.Quiz`
+    :param max_workers: The maximum number of requests sent at the same
+        time.
+    :type max_workers: int
+    :param answers: Whether to fetch the answered questions of every
+        submission.
+    :type answers: bool
+    :param events: Whether to fetch the events logged during every
+        submission.
+    :type events: bool
+    :param statistics: Whether to fetch the question statistics of every
+        quiz.
+    :type statistics: bool
+    :param report: Whether to have Canvas generate a student analysis report
+        for every quiz and parse its CSV instead of requesting the answers of
+        every submission, which takes far fewer requests for large quizzes.
+        `interval`, `max_interval`, `backoff` and `timeout` control how the
+        reports are polled, see :class:`canvasapi.poller.Poller`.
+    :type report: bool
+    :param retries: How many times a failed request may be repeated.
+    :type retries: int
+    :param retry_delay: Seconds to wait before the first retry.
+    :type retry_delay: float
+
+    :returns: The DataFrames `submissions`, one row per submission, and
+        when requested `answers`, one row per answered question, `events`,
+        one row per event, `statistics`, one row per question of every quiz,
+        and `report`, the rows of every student analysis report, as well as
+        `errors`, one row per submission or quiz whose answers, events,
+        statistics or report could not be fetched. Every DataFrame has a `quiz_id`
+        column, and answers, events and errors a `quiz_submission_id`
+        column.
+    :rtype: dict of :class:`pandas.DataFrame`
+    """
+    quizzes = list(quizzes)
+
+    def get_submissions(quiz):
+        submissions = PaginatedList(
+            QuizSubmission,
+            quiz._requester,
+            "GET",
+            "courses/{}/quizzes/{}/submissions".format(quiz.course_id, quiz.id),
+            _root="quiz_submissions",
+        ).to_dataframe()
+        submissions["quiz_id"] = quiz.id
+        submissions["course_id"] = quiz.course_id
+        return submissions
+
+    def get_statistics(quiz):
+        response = quiz._requester.request(
+            "GET",
+            "courses/{}/quizzes/{}/statistics".format(quiz.course_id, quiz.id),
+        )
+        rows = []
+        for quiz_statistics in response.json().get("quiz_statistics", []):
+            for question in quiz_statistics.get("question_statistics", []):
+                rows.append(
+                    dict(
+                        question,
+                        quiz_id=quiz.id,
+                        quiz_statistics_id=quiz_statistics.get("id"),
+                    )
+                )
+        return rows
+
+    def get_report(quiz):
+        return quiz.create_report("student_analysis", include=["file", "progress"])
+
+    def get_details(task):
+        kind, quiz, submission = task
+        if kind == "answers":
+            response = quiz._requester.request(
+                "GET", "quiz_submissions/{}/questions".format(submission["id"])
+            )
+            return response.json().get("quiz_submission_questions", [])
+
+        return (
+            PaginatedList(
+                QuizSubmissionEvent,
+                quiz._requester,
+                "GET",
+                "courses/{}/quizzes/{}/submissions/{}/events".format(
+                    quiz.course_id, quiz.id, submission["id"]
+                ),
+                _root="quiz_submission_events",
+                attempt=submission.get("attempt"),
+            )
+            .to_dataframe()
+            .to_dict("records")
+        )
+
+    def fetch(func, items, return_exceptions=False):
+        def call(item):
+            return call_with_retries(
+                lambda: func(item), retries=retries, delay=retry_delay
+            )
+
+        return run_concurrently(
+            call, items, max_workers, return_exceptions=return_exceptions
+        )
+
+    listings = fetch(get_submissions, quizzes)
+    result = {
+        "submissions": (
+            pd.concat(listings, ignore_index=True) if listings else pd.DataFrame()
+        )
+    }
+
+    kinds = []
+    if answers and not report:
+        kinds.append("answers")
+    if events:
+        kinds.append("events")
+
+    tasks = [
+        (kind, quiz, submission)
+        for quiz, listing in zip(quizzes, listings)
+        for submission in listing.to_dict("records")
+        for kind in kinds
+    ]
+    details = fetch(get_details, tasks, return_exceptions=True)
+
+    errors = []
+    for (kind, quiz, submission), records in zip(tasks, details):
+        if isinstance(records, Exception):
+            errors.append((kind, quiz.id, submission["id"], str(records)))
+
+    for kind in kinds:
+        rows = []
+        for (task_kind, quiz, submission), records in zip(tasks, details):
+            if task_kind != kind or isinstance(records, Exception):
+                continue
+            for record in records:
+                rows.append(
+                    dict(
+                        record,
+                        quiz_id=quiz.id,
+                        quiz_submission_id=submission["id"],
+                        user_id=submission.get("user_id"),
+                        attempt=submission.get("attempt"),
+                    )
+                )
+        result[kind] = pd.DataFrame(rows)
+
+    if statistics:
+        questions = fetch(get_statistics, quizzes, return_exceptions=True)
+        for quiz, rows in zip(quizzes, questions):
+            if isinstance(rows, Exception):
+                errors.append(("statistics", quiz.id, None, str(rows)))
+        result["statistics"] = pd.DataFrame(
+            [
+                question
+                for rows in questions
+                if not isinstance(rows, Exception)
+                for question in rows
+            ]
+        )
+
+    if report:
+        poller = Poller(
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+            max_workers=max_workers,
+        )
+        created = fetch(get_report, quizzes, return_exceptions=True)
+        for quiz, quiz_report in zip(quizzes, created):
+            if isinstance(quiz_report, Exception):
+                errors.append(("report", quiz.id, None, str(quiz_report)))
+                continue
+            poller.add(
+                quiz.id, quiz_report, QuizReport._refresh, QuizReport._is_finished
+            )
+        reports = list(poller.wait().items())
+
+        def get_report_rows(item):
+            quiz_id, quiz_report = item
+            if not isinstance(getattr(quiz_report, "file", None), dict):
+                raise CanvasException(
+                    "The student analysis report of quiz {} failed.".format(quiz_id)
+                )
+            frame = quiz_report.get_dataframe()
+            frame.insert(0, "quiz_id", quiz_id)
+            return frame
+
+        frames = fetch(get_report_rows, reports, return_exceptions=True)
+        for (quiz_id, _), frame in zip(reports, frames):
+            if isinstance(frame, Exception):
+                errors.append(("report", quiz_id, None, str(frame)))
+        frames = [frame for frame in frames if not isinstance(frame, Exception)]
+        result["report"] = (
+            pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        )
+
+    result["errors"] = pd.DataFrame(
+        errors, columns=["kind", "quiz_id", "quiz_submission_id", "error"]
+    )
+
+    return result
@@ -1,8 +1,13 @@
+import gzip
+import json as jsonlib
 import logging
+import sys
+import time
 from datetime import datetime
 from pprint import pformat
 
 import requests
+from urllib3.util.request import ACCEPT_ENCODING
 
 from canvasapi.exceptions import (
     BadRequest,
@@ -15,7 +20,9 @@ from canvasapi.exceptions import (
     Unauthorized,
     UnprocessableEntity,
 )
-from canvasapi.util import clean_headers
+from canvasapi.metrics import get_endpoint_template
+from canvasapi.tracing import get_tracer, is_tracing_enabled
+from canvasapi.util import clean_headers, get_retry_attempt, is_multivalued
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +32,53 @@ class Requester(object):
     Responsible for handling HTTP requests.
     """
 
-    def __init__(self, base_url, access_token):
+    HOOK_EVENTS = ("pre_request", "post_request")
+
+    def __init__(
+        self,
+        base_url,
+        access_token,
+        snapshot_store=None,
+        metrics=None,
+        gzip_min_size=None,
+        session=None,
+    ):
         """
         :param base_url: The base URL of the Canvas instance's API.
         :type base_url: str
         :param access_token: The API key to authenticate requests with.
         :type access_token: str
+        :param snapshot_store: Where paginated lists fetched through this
+            requester are saved to and restored from.
+        :type snapshot_store: :class:`canvasapi.snapshot.SnapshotStore`
+        :param metrics: Collects the timing, size and cost of every request
+            sent through this requester.
+        :type metrics: :class:`canvasapi.metrics.RequestMetrics`
+        :param gzip_min_size: Gzip the bodies of POST, PUT, PATCH and DELETE
+            requests of at least this many bytes. Off by default, as the
+            server has to accept `Content-Encoding: gzip` request bodies.
+        :type gzip_min_size: int
+        :param session: The session to send requests through, e.g. one
+            shared by the requesters of every token of an instance to reuse
+            its connections. The access token is sent with each request and
+            never stored on the session.
+        :type session: :class:`requests.Session`
         """
         # Preserve the original base url and add "/api/v1" to it
         self.original_url = base_url
         self.base_url = base_url + "/api/v1/"
         self.access_token = access_token
-        self._session = requests.Session()
+        self._session = session if session is not None else requests.Session()
+        self.gzip_min_size = gzip_min_size
         self._cache = []
+        self._hooks = {event: [] for event in self.HOOK_EVENTS}
+        self.snapshot_store = snapshot_store
+        self.metrics = metrics
+
+        if metrics is not None:
+            self.add_hook("post_request", metrics.record)
 
-    def _delete_request(self, url, headers, data=None, **kwargs):
+    def _delete_request(self, url, headers, data=None, json=False, **kwargs):
         """
         Issue a DELETE request to the specified endpoint with the data provided.
 
@@ -49,10 +88,17 @@ class Requester(object):
         :type headers: dict
         :param data: The data to send with this request.
         :type data: dict
+        :param json: Whether or not to send the data as json
+        :type json: bool
         """
+        if json:
+            return self._session.delete(url, headers=headers, json=dict(data))
+
         return self._session.delete(url, headers=headers, data=data)
 
-    def _get_request(self, url, headers, params=None, **kwargs):
+    def _get_request(
+        self, url, headers, params=None, stream=False, json=False, **kwargs
+    ):
         """
         Issue a GET request to the specified endpoint with the data provided.
 
@@ -62,10 +108,20 @@ class Requester(object):
         :type headers: dict
         :param params: The parameters to send with this request.
         :type params: dict
+        :param stream: Whether to defer downloading the response body.
+        :type stream: bool
+        :param json: Whether or not to send the parameters as a json body
+            instead of in the query string.
+        :type json: bool
         """
-        return self._session.get(url, headers=headers, params=params)
+        if json:
+            return self._session.get(
+                url, headers=headers, json=dict(params), stream=stream
+            )
 
-    def _patch_request(self, url, headers, data=None, **kwargs):
+        return self._session.get(url, headers=headers, params=params, stream=stream)
+
+    def _patch_request(self, url, headers, data=None, json=False, **kwargs):
         """
         Issue a PATCH request to the specified endpoint with the data provided.
 
@@ -75,10 +131,15 @@ class Requester(object):
         :type headers: dict
         :param data: The data to send with this request.
         :type data: dict
+        :param json: Whether or not to send the data as json
+        :type json: bool
         """
+        if json:
+            return self._session.patch(url, headers=headers, json=dict(data))
+
         return self._session.patch(url, headers=headers, data=data)
 
-    def _post_request(self, url, headers, data=None, json=False):
+    def _post_request(self, url, headers, data=None, json=False, **kwargs):
         """
         Issue a POST request to the specified endpoint with the data provided.
 
@@ -94,6 +155,10 @@ class Requester(object):
         if json:
             return self._session.post(url, headers=headers, json=dict(data))
 
+        # An already encoded, e.g. gzipped, body.
+        if isinstance(data, bytes):
+            return self._session.post(url, headers=headers, data=data)
+
         # Grab file from data.
         files = None
         for field, value in data:
@@ -109,7 +174,7 @@ class Requester(object):
 
         return self._session.post(url, headers=headers, data=data, files=files)
 
-    def _put_request(self, url, headers, data=None, **kwargs):
+    def _put_request(self, url, headers, data=None, json=False, **kwargs):
         """
         Issue a PUT request to the specified endpoint with the data provided.
 
@@ -119,9 +184,83 @@ class Requester(object):
         :type headers: dict
         :param data: The data to send with this request.
         :type data: dict
+        :param json: Whether or not to send the data as json
+        :type json: bool
         """
+        if json:
+            return self._session.put(url, headers=headers, json=dict(data))
+
         return self._session.put(url, headers=headers, data=data)
 
+    def _run_hooks(self, event, *args):
+        for callback in list(self._hooks[event]):
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("The {} hook {!r} failed".format(event, callback))
+
+    def _send(self, req_method, url, request_info, json, stream):
+        start = time.perf_counter()
+        try:
+            response = req_method(
+                url,
+                request_info["headers"],
+                request_info["data"],
+                json=json,
+                stream=stream,
+            )
+        except Exception:
+            self._run_hooks(
+                "post_request", request_info, None, time.perf_counter() - start
+            )
+            raise
+        self._run_hooks(
+            "post_request", request_info, response, time.perf_counter() - start
+        )
+        return response
+
+    def add_hook(self, event, callback):
+        """
+        Call a function around every request sent through this requester.
+
+        `pre_request` callbacks are called with a dict describing the
+        request (`method`, `url`, `headers`, `data`, `stream` and `attempt`,
+        the number of failed tries before this one under
+        :func:`canvasapi.util.call_with_retries`) before it is sent. They may
+        change its headers and data.
+
+        `post_request` callbacks are called with the same dict, the
+        :class:`requests.Response` (None if no response was received) and
+        the elapsed seconds, before errors are raised for the status code.
+
+        Exceptions raised by a callback are logged and otherwise ignored.
+
+        :param event: "pre_request" or "post_request".
+        :type event: str
+        :param callback: The function to call.
+        :type callback: callable
+        """
+        if event not in self._hooks:
+            raise ValueError(
+                "Parameter `event` must be one of {}.".format(
+                    ", ".join(self.HOOK_EVENTS)
+                )
+            )
+
+        self._hooks[event].append(callback)
+
+    def remove_hook(self, event, callback):
+        """
+        Stop calling a function added with :func:`add_hook`.
+
+        :param event: "pre_request" or "post_request".
+        :type event: str
+        :param callback: The function to remove.
+        :type callback: callable
+        """
+        if callback in self._hooks.get(event, []):
+            self._hooks[event].remove(callback)
+
     def request(
         self,
         method,
@@ -131,6 +270,7 @@ class Requester(object):
         _url=None,
         _kwargs=None,
         json=False,
+        stream=False,
         **kwargs
     ):
         """
@@ -153,10 +293,15 @@ class Requester(object):
         :param _kwargs: A list of 2-tuples representing processed
             keyword arguments to be sent to Canvas as params or data.
         :type _kwargs: `list`
-        :param json: Whether or not to treat the data as json instead of form data.
-            currently only the POST request of GraphQL is using this parameter.
-            For all other methods it's just passed and ignored.
+        :param json: Whether or not to send the data as a json body instead of
+            form data, for any method. Values are sent as they are rather than
+            flattened with :func:`canvasapi.util.combine_kwargs`, which keeps
+            large nested payloads much smaller.
         :type json: `bool`
+        :param stream: Whether to leave the body of a GET response unread so it
+            can be consumed incrementally through `response.raw` or
+            `response.iter_content`. The body is not logged in this case.
+        :type stream: `bool`
         :rtype: :class:`requests.Response`
         """
         full_url = _url if _url else "{}{}".format(self.base_url, endpoint)
@@ -168,6 +313,11 @@ class Requester(object):
             auth_header = {"Authorization": "Bearer {}".format(self.access_token)}
             headers.update(auth_header)
 
+        # Ask for every compression the installed urllib3 can decode, which
+        # includes brotli when the brotli package is installed. Set on the
+        # request, as the session may be shared with other code.
+        headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+
         # Convert kwargs into list of 2-tuples and combine with _kwargs.
         _kwargs = _kwargs or []
         _kwargs.extend(kwargs.items())
@@ -176,8 +326,13 @@ class Requester(object):
         for i, kwarg in enumerate(_kwargs):
             kw, arg = kwarg
 
+            # JSON has booleans and lists of its own; only datetimes, which
+            # may be nested anywhere in the value, need converting.
+            if json:
+                _kwargs[i] = (kw, _to_json(arg))
+
             # Convert boolean objects to a lowercase string.
-            if isinstance(arg, bool):
+            elif isinstance(arg, bool):
                 _kwargs[i] = (kw, str(arg).lower())
 
             # Convert any datetime objects into ISO 8601 formatted strings.
@@ -202,10 +357,48 @@ class Requester(object):
             "Headers: {headers}".format(headers=pformat(clean_headers(headers)))
         )
 
-        if _kwargs:
+        # Formatting a bulk payload takes longer than sending it.
+        if _kwargs and logger.isEnabledFor(logging.DEBUG):
             logger.debug("Data: {data}".format(data=pformat(_kwargs)))
 
-        response = req_method(full_url, headers, _kwargs, json=json)
+        if (
+            self.gzip_min_size is not None
+            and method != "GET"
+            and _kwargs
+            and all(kw != "file" for kw, _ in _kwargs)
+        ):
+            body = _encode_body(_kwargs, json)
+            if len(body) >= self.gzip_min_size:
+                headers["Content-Type"] = (
+                    "application/json" if json else "application/x-www-form-urlencoded"
+                )
+                headers["Content-Encoding"] = "gzip"
+                _kwargs = gzip.compress(body)
+                json = False
+
+        request_info = {
+            "method": method,
+            "url": full_url,
+            "headers": headers,
+            "data": _kwargs,
+            "stream": stream,
+            "attempt": get_retry_attempt(),
+        }
+        self._run_hooks("pre_request", request_info)
+
+        # Matching the endpoint template costs more than a no-op span saves.
+        if is_tracing_enabled():
+            with get_tracer().start_span(
+                "HTTP {}".format(method),
+                http_method=method,
+                url=full_url,
+                endpoint=get_endpoint_template(full_url),
+            ) as span:
+                response = self._send(req_method, full_url, request_info, json, stream)
+                span.set_attribute("status_code", response.status_code)
+        else:
+            response = self._send(req_method, full_url, request_info, json, stream)
+
         logger.info(
             "Response: {method} {url} {status}".format(
                 method=method, url=full_url, status=response.status_code
@@ -218,9 +411,14 @@ class Requester(object):
         )
 
         try:
-            logger.debug(
-                "Data: {data}".format(data=pformat(response.content.decode("utf-8")))
-            )
+            if stream and response.ok:
+                logger.debug("Data: <streamed>")
+            else:
+                logger.debug(
+                    "Data: {data}".format(
+                        data=pformat(response.content.decode("utf-8"))
+                    )
+                )
         except UnicodeDecodeError:
             logger.debug("Data: {data}".format(data=pformat(response.content)))
         except AttributeError:
@@ -264,3 +462,36 @@ class Requester(object):
             )
 
         return response
+
+
+def _to_json(value):
+    """
+    Convert the datetimes in `value` to ISO 8601 strings, its numpy scalars,
+    e.g. the values of a DataFrame, to Python ones and its other multivalued
+    objects, e.g. tuples and generators, to lists, so it can be sent as json.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, dict):
+        return {_to_json(k): _to_json(v) for k, v in value.items()}
+    elif is_multivalued(value):
+        return [_to_json(v) for v in value]
+
+    # A numpy scalar can only exist once numpy is imported, so there is no
+    # need to import it here.
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(value, numpy.generic):
+        return _to_json(value.item())
+    return value
+
+
+def _encode_body(data, as_json):
+    """
+    Encode a list of 2-tuples the way `requests` would send it, as json or
+    as form data.
+
+    :rtype: bytes
+    """
+    if as_json:
+        return jsonlib.dumps(dict(data), allow_nan=False).encode("utf-8")
+    return requests.models.RequestEncodingMixin._encode_params(data).encode("utf-8")
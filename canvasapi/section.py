@@ -1,8 +1,8 @@
 from canvasapi.canvas_object import CanvasObject
-from canvasapi.enrollment import Enrollment
+from canvasapi.enrollment import Enrollment, bulk_enroll_users
 from canvasapi.paginated_list import PaginatedList
 from canvasapi.progress import Progress
-from canvasapi.submission import GroupedSubmission, Submission
+from canvasapi.submission import GroupedSubmission, Submission, bulk_update_grades
 from canvasapi.user import User
 from canvasapi.util import combine_kwargs, normalize_bool, obj_or_id
 
@@ -11,6 +11,109 @@ class Section(CanvasObject):
     def __str__(self):
         return "{} - {} ({})".format(self.name, self.course_id, self.id)
 
+    def bulk_enroll_users(
+        self,
+        enrollments,
+        max_workers=4,
+        retries=3,
+        retry_delay=1,
+        sis_account=None,
+        sis_threshold=1000,
+        **kwargs
+    ):
+        """
+        Enroll many users in this section at once. Enrollments that already
+        exist are skipped, the others are created over a pool of threads,
+        retrying transient failures, or with one SIS import when there are
+        many of them.
+
+        See :func:`canvasapi.enrollment.bulk_enroll_users` for the columns
+        `enrollments` may have and the report returned.
+
+        :calls: `GET /api/v1/sections/:section_id/enrollments \
+        <https://canvas.instructure.com/doc/api/enrollments.html#method.enrollments_api.index>`_,
+            `POST /api/v1/sections/:section_id/enrollments \
+        <https://canvas.instructure.com/doc/api/enrollments.html#method.enrollments_api.create>`_
+
+        :param enrollments: One row per enrollment, with a `user_id` column.
+        :type enrollments: :class:`pandas.DataFrame`
+        :param max_workers: The maximum number of concurrent requests.
+        :type max_workers: int
+        :param retries: How many times a failed request may be repeated.
+        :type retries: int
+        :param retry_delay: Seconds to wait before the first retry.
+        :type retry_delay: float
+        :param sis_account: The account to send SIS imports to. The section
+            must have a `sis_section_id`.
+        :type sis_account: :class:`canvasapi.account.Account`
+        :param sis_threshold: The minimum number of new enrollments sent as a
+            SIS import rather than one request each.
+        :type sis_threshold: int
+
+        :returns: A copy of `enrollments` with `status`, `enrollment_id`,
+            `attempts` and `error` columns.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        return bulk_enroll_users(
+            self,
+            enrollments,
+            max_workers=max_workers,
+            retries=retries,
+            retry_delay=retry_delay,
+            sis_account=sis_account,
+            sis_threshold=sis_threshold,
+            sis_columns={"section_id": getattr(self, "sis_section_id", None)},
+            **kwargs
+        )
+
+    def bulk_update_grades(
+        self,
+        grades,
+        chunk_size=500,
+        max_workers=4,
+        interval=1,
+        max_interval=30,
+        backoff=2,
+        timeout=None,
+        **kwargs
+    ):
+        """
+        Update the grades and comments of many submissions in the section.
+        The rows are split into several :func:`submissions_bulk_update` jobs
+        that are posted concurrently and waited for together. `interval`,
+        `max_interval`, `backoff` and `timeout` are described in
+        :class:`canvasapi.poller.Poller`.
+
+        :calls: `POST /api/v1/sections/:section_id/submissions/update_grades \
+        <https://canvas.instructure.com/doc/api/submissions.html#method.submissions_api.bulk_update>`_,
+            `GET /api/v1/progress/:id \
+        <https://canvas.instructure.com/doc/api/progress.html#method.progress.show>`_
+
+        :param grades: One row per submission, with `user_id`, `assignment_id` and
+            `grade` and/or `comment` columns.
+        :type grades: :class:`pandas.DataFrame`
+        :param chunk_size: The maximum number of rows sent per job.
+        :type chunk_size: int
+        :param max_workers: The maximum number of jobs posted, and polled,
+            at the same time.
+        :type max_workers: int
+
+        :returns: A copy of `grades` with the `progress_id`,
+            `workflow_state` and `message` of the job each row was sent in.
+        :rtype: :class:`pandas.DataFrame`
+        """
+        return bulk_update_grades(
+            self.submissions_bulk_update,
+            grades,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            interval=interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            timeout=timeout,
+            **kwargs
+        )
+
     def cross_list_section(self, new_course, **kwargs):
         """
         Move the Section to another course.
@@ -188,6 +291,7 @@ class Section(CanvasObject):
         response = self._requester.request(
             "POST",
             "sections/{}/submissions/update_grades".format(self.id),
-            _kwargs=combine_kwargs(**kwargs),
+            _kwargs=list(kwargs.items()),
+            json=True,
         )
         return Progress(self._requester, response.json())
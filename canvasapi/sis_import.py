@@ -1,4 +1,8 @@
+import os
+import zipfile
+
 from canvasapi.canvas_object import CanvasObject
+from canvasapi.lazy import pandas as pd
 from canvasapi.progress import Progress
 from canvasapi.util import combine_kwargs
 
@@ -7,6 +11,17 @@ class SisImport(CanvasObject):
     def __str__(self):  # pragma: no cover
         return "{} ({})".format(self.workflow_state, self.id)
 
+    def _is_finished(self):
+        return self.workflow_state in (
+            "imported",
+            "imported_with_messages",
+            "failed",
+            "failed_with_messages",
+            "aborted",
+            "restored",
+            "partially_restored",
+        )
+
     def abort(self, **kwargs):
         """
         Abort this SIS import.
@@ -40,3 +55,148 @@ class SisImport(CanvasObject):
             _kwargs=combine_kwargs(**kwargs),
         )
         return Progress(self._requester, response.json())
+
+
+class SisImportBuilder(object):
+    """
+    Writes DataFrames of SIS data (users, courses, enrollments...) to zipped
+    CSV files ready to be sent with
+    :func:`canvasapi.account.Account.create_sis_import`, splitting them into
+    as many batches as needed to stay under the configured limits.
+
+    Rows are converted to CSV `chunksize` at a time and written straight
+    into the zip archive, so a batch is never held in memory as a whole.
+    """
+
+    # The order Canvas expects SIS CSV files to be processed in.
+    CSV_TYPES = (
+        "accounts",
+        "terms",
+        "users",
+        "logins",
+        "courses",
+        "sections",
+        "enrollments",
+        "group_categories",
+        "groups",
+        "group_memberships",
+        "xlists",
+        "user_observers",
+        "admins",
+        "change_sis_id",
+    )
+
+    def __init__(self, max_rows=100000, max_bytes=100 * 1024 * 1024, chunksize=10000):
+        """
+        :param max_rows: The maximum number of rows in a single batch.
+        :type max_rows: int
+        :param max_bytes: The maximum size of the uncompressed CSV in a single
+            batch.
+        :type max_bytes: int
+        :param chunksize: The number of rows converted to CSV at a time.
+        :type chunksize: int
+        """
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.chunksize = min(chunksize, max_rows)
+
+        self._frames = {}
+
+    def _encode_chunks(self, df):
+        """
+        Yield `(row_count, csv_bytes)` pairs covering every row of `df`. A
+        chunk larger than `max_bytes` is halved until it fits or holds a
+        single row.
+        """
+        stack = [
+            df.iloc[start : start + self.chunksize]
+            for start in reversed(range(0, len(df), self.chunksize))
+        ]
+        while stack:
+            chunk = stack.pop()
+            data = chunk.to_csv(index=False, header=False).encode("utf-8")
+            if len(data) > self.max_bytes and len(chunk) > 1:
+                middle = len(chunk) // 2
+                stack.append(chunk.iloc[middle:])
+                stack.append(chunk.iloc[:middle])
+                continue
+            yield len(chunk), data
+
+    def add(self, csv_type, df):
+        """
+        Queue a DataFrame to be written as `<csv_type>.csv`. The columns must
+        match the headers documented in the `SIS import format
+        <https://canvas.instructure.com/doc/api/file.sis_csv.html>`_.
+
+        :param csv_type: The kind of data, e.g. "users" or "enrollments".
+        :type csv_type: str
+        :param df: The rows to import.
+        :type df: :class:`pandas.DataFrame`
+
+        :returns: This builder, so calls can be chained.
+        :rtype: :class:`canvasapi.sis_import.SisImportBuilder`
+        """
+        if csv_type not in self.CSV_TYPES:
+            raise ValueError(
+                "Parameter `csv_type` must be one of: {}".format(
+                    ", ".join(self.CSV_TYPES)
+                )
+            )
+
+        if csv_type in self._frames:
+            self._frames[csv_type] = pd.concat(
+                [self._frames[csv_type], df], ignore_index=True
+            )
+        else:
+            self._frames[csv_type] = df
+
+        return self
+
+    def build(self, directory):
+        """
+        Write every queued DataFrame to zip files in `directory`, in the
+        order Canvas processes SIS data.
+
+        :param directory: The directory to write the zip files to.
+        :type directory: str
+
+        :returns: A generator of `(csv_type, path)` pairs, one per batch.
+        :rtype: generator of tuple
+        """
+        for csv_type in self.CSV_TYPES:
+            df = self._frames.get(csv_type)
+            if df is None or df.empty:
+                continue
+
+            header = df.iloc[:0].to_csv(index=False).encode("utf-8")
+            batch_number = 0
+            archive = csv_file = path = None
+            rows = size = 0
+
+            for row_count, data in self._encode_chunks(df):
+                if csv_file is not None and (
+                    rows + row_count > self.max_rows
+                    or size + len(data) > self.max_bytes
+                ):
+                    csv_file.close()
+                    archive.close()
+                    yield csv_type, path
+                    csv_file = None
+
+                if csv_file is None:
+                    batch_number += 1
+                    path = os.path.join(
+                        directory, "{}_{}.zip".format(csv_type, batch_number)
+                    )
+                    archive = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+                    csv_file = archive.open("{}.csv".format(csv_type), "w")
+                    csv_file.write(header)
+                    rows, size = 0, len(header)
+
+                csv_file.write(data)
+                rows += row_count
+                size += len(data)
+
+            csv_file.close()
+            archive.close()
+            yield csv_type, path
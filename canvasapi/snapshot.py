@@ -0,0 +1,297 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+from datetime import datetime, timezone
+
+from canvasapi.lazy import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotStore(object):
+    """
+    Persists the rows accumulated by :class:`canvasapi.paginated_list.PaginatedList`
+    objects to a local Arrow or Parquet dataset, and reloads them without
+    calling the API.
+
+    Each list is stored under a directory named after its endpoint, with one
+    partition per Canvas instance, access token and set of request
+    parameters, and one part file per fetched page. Pass the store to
+    :class:`canvasapi.canvas.Canvas` to have every GET listing use it:
+
+    >>> store = SnapshotStore("/data/canvas", max_age=timedelta(hours=12))
+    >>> canvas = Canvas(API_URL, API_KEY, snapshot_store=store)
+    >>> users = course.get_users()  # fetched from Canvas and saved
+    >>> users = course.get_users()  # memory-mapped from disk, no API call
+
+    Requires `pyarrow`.
+    """
+
+    def __init__(
+        self, directory, max_age=None, format="arrow", endpoints=None, namespace=None
+    ):
+        """
+        :param directory: The root directory of the dataset.
+        :type directory: str
+        :param max_age: How old a snapshot may be before it is discarded and
+            fetched again, or None to keep snapshots until :func:`clear` is
+            called.
+        :type max_age: :class:`datetime.timedelta`
+        :param format: "arrow" to store Arrow IPC files, which are read back
+            memory-mapped, or "parquet" for smaller files.
+        :type format: str
+        :param endpoints: Regular expressions matched against the endpoint
+            of a list. When given, only matching lists are stored.
+        :type endpoints: list of str
+        :param namespace: Shared by the clients allowed to read each other's
+            snapshots. By default every access token has its own snapshots,
+            as tokens may not see the same data. Give the tokens of a single
+            user, e.g. before and after it is rotated, the same namespace.
+        :type namespace: str
+        """
+        if pa is None:
+            raise ImportError(
+                "SnapshotStore requires pyarrow. Install it with `pip install pyarrow`."
+            )
+        if format not in ("arrow", "parquet"):
+            raise ValueError('Parameter `format` must be "arrow" or "parquet".')
+
+        self.directory = directory
+        self.max_age = max_age
+        self.format = format
+        self.endpoints = [re.compile(pattern) for pattern in endpoints or []]
+        self.namespace = namespace
+
+    def _get_path(self, paginated_list):
+        # Computed once, before the first request mutates the parameters.
+        if paginated_list._snapshot_path is not None:
+            return paginated_list._snapshot_path
+
+        requester = paginated_list._requester
+        namespace = self.namespace
+        if namespace is None:
+            namespace = hashlib.sha256(
+                requester.access_token.encode("utf-8")
+            ).hexdigest()
+
+        params = {
+            "base_url": requester.base_url,
+            "namespace": namespace,
+            "method": paginated_list._request_method,
+            "params": sorted(
+                (str(key), str(value))
+                for key, value in _iter_params(paginated_list._first_params)
+            ),
+            "filters": paginated_list._filters,
+            "root": paginated_list._root,
+            "url": paginated_list._url_override,
+        }
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+
+        endpoint = re.sub(r"[^\w/.-]", "_", paginated_list._first_url.strip("/"))
+        paginated_list._snapshot_path = os.path.join(
+            self.directory, endpoint, "params={}".format(digest)
+        )
+        return paginated_list._snapshot_path
+
+    def _is_fresh(self, metadata):
+        if self.max_age is None:
+            return True
+
+        fetched_at = datetime.fromisoformat(metadata["fetched_at"])
+        return datetime.now(timezone.utc) - fetched_at <= self.max_age
+
+    def _read_metadata(self, path):
+        try:
+            with open(os.path.join(path, "_metadata.json")) as metadata_file:
+                return json.load(metadata_file)
+        except FileNotFoundError:
+            return None
+
+    def _read_part(self, path, json_columns):
+        if self.format == "arrow":
+            table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        else:
+            table = pq.read_table(path, memory_map=True)
+
+        df = table.to_pandas()
+        for column in json_columns:
+            if column in df.columns:
+                df[column] = [
+                    json.loads(value) if isinstance(value, str) else value
+                    for value in df[column]
+                ]
+        return df
+
+    def _write_part(self, path, df):
+        # Nested values are stored as JSON strings, as are columns mixing
+        # types Arrow cannot reconcile. Arrow would otherwise turn dicts into
+        # structs, filling in the keys missing from some rows.
+        json_columns = [
+            column
+            for column in df.columns
+            if df[column].dtype == object and not _is_arrow_compatible(df[column])
+        ]
+
+        if json_columns:
+            df = df.copy()
+            for column in json_columns:
+                df[column] = [
+                    None if _is_missing(value) else json.dumps(value, default=str)
+                    for value in df[column]
+                ]
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self.format == "arrow":
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            pq.write_table(table, path)
+
+        return json_columns
+
+    def clear(self, paginated_list=None):
+        """
+        Delete the snapshot of a list, or every snapshot in the store.
+
+        :param paginated_list: The list whose snapshot should be deleted.
+            Deletes everything if omitted.
+        :type paginated_list: :class:`canvasapi.paginated_list.PaginatedList`
+        """
+        path = self.directory
+        if paginated_list is not None:
+            path = self._get_path(paginated_list)
+
+        shutil.rmtree(path, ignore_errors=True)
+
+    def is_stored(self, paginated_list):
+        """
+        Whether lists like this one are kept in the store.
+
+        :param paginated_list: The list to check.
+        :type paginated_list: :class:`canvasapi.paginated_list.PaginatedList`
+
+        :rtype: bool
+        """
+        if paginated_list._request_method != "GET":
+            return False
+        if not self.endpoints:
+            return True
+
+        return any(
+            pattern.search(paginated_list._first_url) for pattern in self.endpoints
+        )
+
+    def restore(self, paginated_list):
+        """
+        Load the stored rows and pagination state of a list into it.
+
+        :param paginated_list: The list to restore, before any page of it
+            has been fetched.
+        :type paginated_list: :class:`canvasapi.paginated_list.PaginatedList`
+
+        :returns: True if a fresh snapshot was found and loaded.
+        :rtype: bool
+        """
+        path = self._get_path(paginated_list)
+        metadata = self._read_metadata(path)
+        if metadata is None or metadata.get("format") != self.format:
+            return False
+
+        if not self._is_fresh(metadata):
+            logger.info("Discarding stale snapshot {}".format(path))
+            self.clear(paginated_list)
+            return False
+
+        frames = [
+            self._read_part(os.path.join(path, part["file"]), part["json_columns"])
+            for part in metadata["parts"]
+        ]
+        paginated_list._df = (
+            pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        )
+        paginated_list._next_url = metadata["next_url"]
+        paginated_list._next_params = {}
+        paginated_list._snapshot_rows = len(paginated_list._df)
+
+        logger.info(
+            "Restored {} rows from snapshot {}".format(len(paginated_list._df), path)
+        )
+        return True
+
+    def save(self, paginated_list):
+        """
+        Append the rows of a list that are not stored yet as a new part of
+        its snapshot, and record where pagination stopped.
+
+        :param paginated_list: The list to save.
+        :type paginated_list: :class:`canvasapi.paginated_list.PaginatedList`
+        """
+        path = self._get_path(paginated_list)
+        metadata = self._read_metadata(path)
+        stored_rows = paginated_list._snapshot_rows
+
+        if metadata is None or stored_rows == 0:
+            shutil.rmtree(path, ignore_errors=True)
+            metadata = {
+                "endpoint": paginated_list._first_url,
+                "format": self.format,
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
+                "parts": [],
+            }
+            stored_rows = 0
+
+        os.makedirs(path, exist_ok=True)
+
+        new_rows = paginated_list._df.iloc[stored_rows:]
+        if len(new_rows) or not metadata["parts"]:
+            part = "part-{:05d}.{}".format(len(metadata["parts"]), self.format)
+            json_columns = self._write_part(os.path.join(path, part), new_rows)
+            metadata["parts"].append(
+                {"file": part, "rows": len(new_rows), "json_columns": json_columns}
+            )
+
+        metadata["next_url"] = paginated_list._next_url
+        metadata["rows"] = len(paginated_list._df)
+
+        temp_path = os.path.join(path, "_metadata.json.tmp")
+        with open(temp_path, "w") as metadata_file:
+            json.dump(metadata, metadata_file, indent=2)
+        os.replace(temp_path, os.path.join(path, "_metadata.json"))
+
+        paginated_list._snapshot_rows = len(paginated_list._df)
+
+
+def _is_arrow_compatible(series):
+    if any(isinstance(value, (dict, list)) for value in series):
+        return False
+    try:
+        pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return False
+    return True
+
+
+def _is_missing(value):
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _iter_params(params):
+    for key, value in params.items():
+        if key == "_kwargs":
+            for pair in value:
+                yield pair
+        else:
+            yield key, value
@@ -1,9 +1,12 @@
 from canvasapi.canvas_object import CanvasObject
 from canvasapi.file import File
+from canvasapi.lazy import pandas as pd
 from canvasapi.paginated_list import PaginatedList
 from canvasapi.peer_review import PeerReview
+from canvasapi.poller import Poller
+from canvasapi.progress import Progress
 from canvasapi.upload import FileOrPathLike, Uploader
-from canvasapi.util import combine_kwargs, obj_or_id
+from canvasapi.util import combine_kwargs, obj_or_id, run_concurrently
 
 
 class Submission(CanvasObject):
@@ -197,3 +200,120 @@ class GroupedSubmission(CanvasObject):
         return "{} submission(s) for User #{}".format(
             len(self.submissions), self.user_id
         )
+
+
+def bulk_update_grades(
+    submissions_bulk_update,
+    grades,
+    by_assignment=True,
+    chunk_size=500,
+    max_workers=4,
+    interval=1,
+    max_interval=30,
+    backoff=2,
+    timeout=None,
+    **kwargs
+):
+    """
+    Split a DataFrame of grade changes into `grade_data` payloads, submit
+    them concurrently through a `submissions_bulk_update` method and wait for
+    every resulting :class:`canvasapi.progress.Progress` with one shared
+    :class:`canvasapi.poller.Poller`, which `interval`, `max_interval`,
+    `backoff` and `timeout` are passed on to. Keyword arguments are sent with
+    every payload.
+
+    :param submissions_bulk_update: The bound method the payloads are posted
+        with, e.g. `course.submissions_bulk_update`.
+    :type submissions_bulk_update: method
+    :param grades: One row per submission, with a `user_id` column, an
+        `assignment_id` column when `by_assignment` is True, and a `grade`
+        and/or `comment` column. Missing values are left out of the payload.
+    :type grades: :class:`pandas.DataFrame`
+    :param by_assignment: Whether `grade_data` is keyed by assignment id and
+        then user id, as the course and section endpoints expect, or by user
+        id only, as the assignment endpoint expects.
+    :type by_assignment: bool
+    :param chunk_size: The maximum number of rows per request. Canvas caps
+        the number of parameters a request may carry, and each row turns into
+        up to two of them.
+    :type chunk_size: int
+    :param max_workers: The maximum number of payloads posted, and of jobs
+        polled, at the same time.
+    :type max_workers: int
+
+    :returns: A copy of `grades` with the `progress_id`, `workflow_state` and
+        `message` of the job each row was sent in. Rows whose request failed
+        have the `workflow_state` "error" and the exception as `message`.
+    :rtype: :class:`pandas.DataFrame`
+    """
+    keys = ["assignment_id", "user_id"] if by_assignment else ["user_id"]
+    fields = {"grade": "posted_grade", "comment": "text_comment"}
+
+    missing = [column for column in keys if column not in grades.columns]
+    if missing:
+        raise ValueError("Missing column(s): {}".format(", ".join(missing)))
+    if not any(column in grades.columns for column in fields):
+        raise ValueError("A `grade` or `comment` column is required.")
+    if grades.duplicated(subset=keys).any():
+        raise ValueError("Each submission may only be updated once per call.")
+    if chunk_size < 1:
+        raise ValueError("Parameter `chunk_size` must be at least 1.")
+
+    chunks = [
+        grades.iloc[start : start + chunk_size]
+        for start in range(0, len(grades), chunk_size)
+    ]
+
+    def submit(chunk):
+        grade_data = {}
+        for row in chunk.to_dict("records"):
+            target = grade_data
+            if by_assignment:
+                target = grade_data.setdefault(row["assignment_id"], {})
+            target[row["user_id"]] = data = {}
+            for column, field in fields.items():
+                value = row.get(column)
+                if value is None or pd.isna(value):
+                    continue
+                # Columns with missing values hold floats; send 97 as "97".
+                if isinstance(value, float) and value.is_integer():
+                    value = int(value)
+                data[field] = value
+
+        return submissions_bulk_update(grade_data=grade_data, **kwargs)
+
+    progresses = run_concurrently(
+        submit, chunks, max_workers=max_workers, return_exceptions=True
+    )
+
+    poller = Poller(
+        interval=interval,
+        max_interval=max_interval,
+        backoff=backoff,
+        timeout=timeout,
+        max_workers=max_workers,
+    )
+    for number, progress in enumerate(progresses):
+        if isinstance(progress, Progress):
+            poller.add(number, progress, Progress.query, Progress._is_finished)
+    finished = poller.wait()
+
+    outcomes = []
+    for number, (chunk, progress) in enumerate(zip(chunks, progresses)):
+        progress = finished.get(number, progress)
+        if isinstance(progress, Exception):
+            outcome = (None, "error", str(progress))
+        else:
+            outcome = (
+                progress.id,
+                progress.workflow_state,
+                getattr(progress, "message", None),
+            )
+        outcomes.extend([outcome] * len(chunk))
+
+    result = grades.copy()
+    result["progress_id"] = [outcome[0] for outcome in outcomes]
+    result["workflow_state"] = [outcome[1] for outcome in outcomes]
+    result["message"] = [outcome[2] for outcome in outcomes]
+
+    return result
@@ -0,0 +1,298 @@
+import contextvars
+import functools
+import importlib
+import inspect
+import itertools
+import logging
+import pkgutil
+import time
+from contextlib import contextmanager
+
+from canvasapi.lazy import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# The span opened most recently in the current thread or task. Calls made
+# through :func:`canvasapi.util.run_concurrently` inherit it.
+_current_span = contextvars.ContextVar("canvasapi_current_span", default=None)
+
+_span_ids = itertools.count(1)
+
+# The original methods of the classes patched by :func:`enable_tracing`.
+_instrumented = {}
+
+
+class Span(object):
+    """
+    A timed operation, e.g. an API method call, a page fetch or an HTTP
+    request, nested under the span that was open when it started.
+    """
+
+    def __init__(self, name, parent=None, attributes=None):
+        """
+        :param name: What the span measures, e.g. `Course.get_users`.
+        :type name: str
+        :param parent: The span this one is nested under.
+        :type parent: :class:`canvasapi.tracing.Span`
+        :param attributes: Details of the operation, e.g. the endpoint.
+        :type attributes: dict
+        """
+        self.name = name
+        self.span_id = next(_span_ids)
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else self.span_id
+        self.attributes = dict(attributes or {})
+        self.status = "ok"
+        self.error = None
+        self.start_time = time.time()
+        self.end_time = None
+        self._start = time.perf_counter()
+        self.duration = None
+
+    def __repr__(self):
+        return "Span({}, duration={})".format(self.name, self.duration)
+
+    def end(self):
+        """
+        Record when the span finished.
+        """
+        self.duration = time.perf_counter() - self._start
+        self.end_time = self.start_time + self.duration
+
+    def set_attribute(self, key, value):
+        """
+        Add a detail of the operation to the span.
+
+        :param key: The name of the attribute.
+        :type key: str
+        :param value: The value of the attribute.
+        """
+        self.attributes[key] = value
+
+    def set_error(self, error):
+        """
+        Mark the operation as failed.
+
+        :param error: The exception that ended the operation.
+        :type error: Exception
+        """
+        self.status = "error"
+        self.error = "{}: {}".format(type(error).__name__, error)
+
+
+class NoOpSpan(object):
+    """
+    A span that records nothing, used while tracing is disabled.
+    """
+
+    def set_attribute(self, key, value):
+        pass
+
+    def set_error(self, error):
+        pass
+
+
+NO_OP_SPAN = NoOpSpan()
+
+
+class NoOpTracer(object):
+    """
+    The default tracer. Opening a span with it does nothing.
+    """
+
+    @contextmanager
+    def start_span(self, name, **attributes):
+        yield NO_OP_SPAN
+
+
+class Tracer(object):
+    """
+    Opens spans, nests them under the span open in the current context and
+    hands every finished span to an exporter.
+
+    Example Usage:
+
+    >>> exporter = InMemoryExporter()
+    >>> enable_tracing(Tracer(exporter))
+    >>> course.get_users().get_enrollments()
+    >>> exporter.get_dataframe()
+    """
+
+    def __init__(self, exporter):
+        """
+        :param exporter: Receives every finished span through its `export`
+            method, e.g. :class:`canvasapi.tracing.InMemoryExporter`.
+        """
+        self.exporter = exporter
+
+    @contextmanager
+    def start_span(self, name, **attributes):
+        """
+        Open a span for the duration of a `with` block.
+
+        :param name: What the span measures.
+        :type name: str
+
+        :rtype: :class:`canvasapi.tracing.Span`
+        """
+        span = Span(name, _current_span.get(), attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            try:
+                self.exporter.export(span)
+            except Exception:
+                logger.exception("Could not export span {}".format(span.name))
+
+
+class InMemoryExporter(object):
+    """
+    Keeps finished spans in a list, e.g. to inspect them in tests or a
+    notebook.
+    """
+
+    def __init__(self):
+        self.spans = []
+
+    def clear(self):
+        """
+        Discard the spans collected so far.
+        """
+        self.spans = []
+
+    def export(self, span):
+        """
+        Keep a finished span.
+
+        :param span: The span.
+        :type span: :class:`canvasapi.tracing.Span`
+        """
+        self.spans.append(span)
+
+    def get_dataframe(self):
+        """
+        Return the collected spans, one row per span in the order they
+        finished, with their attributes as columns.
+
+        :rtype: :class:`pandas.DataFrame`
+        """
+        return pd.DataFrame(
+            [
+                dict(
+                    span.attributes,
+                    name=span.name,
+                    span_id=span.span_id,
+                    parent_id=span.parent_id,
+                    trace_id=span.trace_id,
+                    start_time=span.start_time,
+                    duration=span.duration,
+                    status=span.status,
+                    error=span.error,
+                )
+                for span in self.spans
+            ]
+        )
+
+
+_tracer = NoOpTracer()
+
+
+def disable_tracing():
+    """
+    Stop recording spans and restore the methods patched by
+    :func:`enable_tracing`.
+    """
+    global _tracer
+
+    _tracer = NoOpTracer()
+    for (cls, name), method in _instrumented.items():
+        setattr(cls, name, method)
+    _instrumented.clear()
+
+
+def enable_tracing(tracer):
+    """
+    Record a span for every API method called on :class:`canvasapi.canvas.Canvas`
+    and the objects it returns, for every page fetched by a
+    :class:`canvasapi.paginated_list.PaginatedList` and for every HTTP
+    request, each nested under the span open when it started.
+
+    :param tracer: The tracer to open the spans with.
+    :type tracer: :class:`canvasapi.tracing.Tracer`
+    """
+    global _tracer
+
+    import canvasapi
+    from canvasapi.canvas import Canvas
+    from canvasapi.canvas_object import CanvasObject
+
+    # Resource modules are only imported once they are used, so import
+    # them all to find every subclass of CanvasObject.
+    for module in pkgutil.iter_modules(canvasapi.__path__):
+        importlib.import_module("canvasapi.{}".format(module.name))
+
+    _tracer = tracer
+    for cls in [Canvas] + _get_subclasses(CanvasObject):
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method):
+                continue
+            if (cls, name) not in _instrumented:
+                _instrumented[(cls, name)] = method
+                setattr(cls, name, _traced(cls.__name__, method))
+
+
+def get_current_span():
+    """
+    Return the span open in the current context, if any.
+
+    :rtype: :class:`canvasapi.tracing.Span`
+    """
+    return _current_span.get()
+
+
+def get_tracer():
+    """
+    Return the tracer spans are opened with, a
+    :class:`canvasapi.tracing.NoOpTracer` unless :func:`enable_tracing`
+    was called.
+    """
+    return _tracer
+
+
+def is_tracing_enabled():
+    """
+    Return whether :func:`enable_tracing` was called, so callers can skip
+    the work of describing a span when nothing would record it.
+
+    :rtype: bool
+    """
+    return not isinstance(_tracer, NoOpTracer)
+
+
+def _get_subclasses(cls):
+    subclasses = []
+    for subclass in cls.__subclasses__():
+        subclasses.append(subclass)
+        subclasses.extend(_get_subclasses(subclass))
+    return subclasses
+
+
+def _traced(class_name, method):
+    name = "{}.{}".format(class_name, method.__name__)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with _tracer.start_span(name, method=name) as span:
+            if type(self).__name__ != "Canvas":
+                object_id = getattr(self, "id", None)
+                if object_id is not None:
+                    span.set_attribute("object_id", object_id)
+            return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,4 +1,22 @@
+import contextvars
+import itertools
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from canvasapi.exceptions import CanvasException, RateLimitExceeded
+from canvasapi.lazy import pandas as pd
+
+# How many times the call running in this thread under
+# :func:`call_with_retries` has already failed.
+_retry_state = threading.local()
+
+# Values that are never flattened further, checked by exact type before
+# the slower :func:`is_multivalued`.
+_SCALAR_TYPES = frozenset([bool, bytes, float, int, str, type(None)])
 
 
 def is_multivalued(value):
@@ -47,13 +65,15 @@ def combine_kwargs(**kwargs):
     # Loop through all kwargs provided
     for kw, arg in kwargs.items():
         if isinstance(arg, dict):
-            for k, v in arg.items():
-                for tup in flatten_kwarg(k, v):
-                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
+            if all(type(v) in _SCALAR_TYPES for v in arg.values()):
+                # Fast path for the common flat dict, e.g. {"name": "x"}
+                combined_kwargs.extend(
+                    (kw + "[" + str(k) + "]", v) for k, v in arg.items()
+                )
+            else:
+                combined_kwargs.extend(_flatten(kw, arg.items()))
         elif is_multivalued(arg):
-            for i in arg:
-                for tup in flatten_kwarg("", i):
-                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
+            combined_kwargs.extend(_flatten(kw, (("", i) for i in arg)))
         else:
             combined_kwargs.append((str(kw), arg))
 
@@ -78,24 +98,41 @@ def flatten_kwarg(key, obj):
         element is the value.
     :rtype: `list` of `tuple`
     """
-    if isinstance(obj, dict):
-        # Add the word (e.g. "[key]")
-        new_list = []
-        for k, v in obj.items():
-            for tup in flatten_kwarg(k, v):
-                new_list.append(("[{}]{}".format(key, tup[0]), tup[1]))
-        return new_list
-
-    elif is_multivalued(obj):
-        # Add empty brackets (i.e. "[]")
-        new_list = []
-        for i in obj:
-            for tup in flatten_kwarg(key + "][", i):
-                new_list.append((tup[0], tup[1]))
-        return new_list
-    else:
-        # Base case. Return list with tuple containing the value
-        return [("[{}]".format(str(key)), obj)]
+    return list(_flatten("", [(key, obj)]))
+
+
+def _flatten(prefix, items):
+    """
+    Yield the flattened `(keyword, value)` tuples of `items`, pairs of
+    keys and objects as taken by :func:`flatten_kwarg`, each keyword
+    starting with `prefix`.
+
+    Walks the payload with a stack instead of recursing, so a keyword
+    prefix is built once per dict or list rather than once per value
+    below it.
+    """
+    stack = [(prefix, iter(items))]
+    while stack:
+        prefix, pairs = stack[-1]
+        for key, obj in pairs:
+            if type(obj) in _SCALAR_TYPES:
+                yield (prefix + "[" + str(key) + "]", obj)
+            elif isinstance(obj, dict):
+                # Add the word (e.g. "[key]")
+                stack.append((prefix + "[{}]".format(key), iter(obj.items())))
+                break
+            elif is_multivalued(obj):
+                # Add empty brackets (i.e. "[]") to the key of every item
+                if isinstance(key, str):
+                    pairs = zip(itertools.repeat(key + "]["), obj)
+                else:
+                    pairs = ((key + "][", i) for i in obj)
+                stack.append((prefix, pairs))
+                break
+            else:
+                yield (prefix + "[" + str(key) + "]", obj)
+        else:
+            stack.pop()
 
 
 def obj_or_id(parameter, param_name, object_types):
@@ -242,3 +279,139 @@ def clean_headers(headers):
         cleaned_headers["Authorization"] = sanitized
 
     return cleaned_headers
+
+
+def stream_csv(requester, url, chunksize=100000, **kwargs):
+    """
+    Download a CSV file without holding the whole body in memory and parse
+    it in chunks.
+
+    :param requester: The requester to download the file through.
+    :type requester: :class:`canvasapi.requester.Requester`
+    :param url: The absolute URL of the file.
+    :type url: str
+    :param chunksize: The number of rows in each yielded DataFrame.
+    :type chunksize: int
+    :param kwargs: Passed on to :func:`pandas.read_csv`, e.g. `dtype`,
+        `parse_dates` or `usecols`.
+
+    :returns: A generator of DataFrames holding consecutive rows of the file.
+    :rtype: generator of :class:`pandas.DataFrame`
+    """
+    response = requester.request("GET", _url=url, stream=True)
+    response.raw.decode_content = True
+
+    try:
+        reader = pd.read_csv(response.raw, chunksize=chunksize, **kwargs)
+    except pd.errors.EmptyDataError:
+        response.close()
+        return
+
+    try:
+        for chunk in reader:
+            yield chunk
+    finally:
+        reader.close()
+        response.close()
+
+
+def run_concurrently(func, items, max_workers=4, return_exceptions=False):
+    """
+    Call a function once for every item, running at most `max_workers`
+    calls at the same time on a pool of threads.
+
+    :param func: The function to call with each item.
+    :type func: callable
+    :param items: The items to call the function with.
+    :type items: iterable
+    :param max_workers: The maximum number of concurrent calls. With 1 or
+        less, the items are processed one after the other on the calling
+        thread.
+    :type max_workers: int
+    :param return_exceptions: If True, an exception raised for an item is
+        returned in place of its result instead of being raised.
+    :type return_exceptions: bool
+
+    :returns: The results, in the same order as `items`.
+    :rtype: list
+    """
+    items = list(items)
+
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            return e
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+
+    # Every call runs in a copy of the caller's context, so tracing spans
+    # opened by the calls nest under the caller's span.
+    contexts = [contextvars.copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(
+            executor.map(lambda context, item: context.run(call, item), contexts, items)
+        )
+
+
+def is_transient_error(error):
+    """
+    Whether a failed request is worth retrying: the rate limit was hit,
+    Canvas answered with a server error, or the connection failed.
+
+    :param error: The exception raised by the request.
+    :type error: Exception
+
+    :rtype: bool
+    """
+    if isinstance(error, (RateLimitExceeded, requests.ConnectionError)):
+        return True
+    if isinstance(error, requests.Timeout):
+        return True
+
+    # Client errors are raised as subclasses; the base class is only used
+    # for status codes without a dedicated exception, i.e. 5xx responses.
+    return type(error) is CanvasException
+
+
+def get_retry_attempt():
+    """
+    Return how many times the call currently running in this thread under
+    :func:`call_with_retries` has already failed, or 0 outside of it.
+
+    :rtype: int
+    """
+    return getattr(_retry_state, "attempt", 0)
+
+
+def call_with_retries(func, retries=3, delay=1, backoff=2):
+    """
+    Call a function, calling it again after a pause whenever it fails with a
+    transient error (see :func:`is_transient_error`).
+
+    :param func: The function to call, without arguments.
+    :type func: callable
+    :param retries: How many times the call may be repeated.
+    :type retries: int
+    :param delay: Seconds to wait before the first retry.
+    :type delay: float
+    :param backoff: Factor the wait is multiplied by after every retry.
+    :type backoff: float
+
+    :returns: What the function returned.
+    """
+    outer_attempt = get_retry_attempt()
+    try:
+        for attempt in range(retries + 1):
+            _retry_state.attempt = attempt
+            try:
+                return func()
+            except Exception as e:
+                if attempt == retries or not is_transient_error(e):
+                    raise
+            time.sleep(delay * backoff**attempt)
+    finally:
+        _retry_state.attempt = outer_attempt
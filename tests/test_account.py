@@ -1,6 +1,8 @@
 import datetime
+import os
 import unittest
 
+import pandas as pd
 import pytz
 import requests_mock
 
@@ -33,7 +35,7 @@ from canvasapi.outcome_import import OutcomeImport
 from canvasapi.paginated_list import PaginatedList
 from canvasapi.rubric import Rubric
 from canvasapi.scope import Scope
-from canvasapi.sis_import import SisImport
+from canvasapi.sis_import import SisImport, SisImportBuilder
 from canvasapi.user import User
 from tests import settings
 from tests.util import register_uris
@@ -86,6 +88,41 @@ class TestAccount(unittest.TestCase):
         self.assertIsInstance(course, Course)
         self.assertTrue(hasattr(course, "name"))
 
+    # create_sis_import_batches()
+    def test_create_sis_import_batches(self, m):
+        register_uris({"account": ["create_sis_import"]}, m)
+
+        builder = SisImportBuilder(max_rows=2)
+        builder.add(
+            "enrollments",
+            pd.DataFrame(
+                {"course_id": ["c1"] * 3, "user_id": ["u1", "u2", "u3"]}
+            ).assign(role="student", status="active"),
+        )
+        builder.add("users", pd.DataFrame({"user_id": ["u1"], "status": ["active"]}))
+
+        sis_imports = self.account.create_sis_import_batches(
+            builder, max_workers=2, diffing_data_set_identifier="nightly"
+        )
+
+        self.assertEqual(len(sis_imports), 3)
+        self.assertIsInstance(sis_imports[0], SisImport)
+
+        bodies = [request.body for request in m.request_history]
+        self.assertIn(b"nightly-users-1", bodies[0])
+        self.assertIn(b"nightly-enrollments-1", b"".join(bodies[1:]))
+        self.assertIn(b"nightly-enrollments-2", b"".join(bodies[1:]))
+        self.assertTrue(all(b"instructure_csv" in body for body in bodies))
+
+    def test_create_sis_import_batches_batch_mode(self, m):
+        builder = SisImportBuilder(max_rows=1)
+        builder.add("users", pd.DataFrame({"user_id": ["u1", "u2"]}))
+
+        with self.assertRaises(ValueError):
+            self.account.create_sis_import_batches(builder, batch_mode=True)
+
+        self.assertEqual(m.call_count, 0)
+
     # create_subaccount()
     def test_create_subaccount(self, m):
         register_uris({"account": ["create_subaccount"]}, m)
@@ -611,6 +648,60 @@ class TestAccount(unittest.TestCase):
 
         self.assertIsInstance(enrollment_terms_list[0], EnrollmentTerm)
 
+    # get_tree_courses()
+    def test_get_tree_courses(self, m):
+        register_uris(
+            {
+                "account": [
+                    "tree_sub_accounts_1",
+                    "tree_sub_accounts_2",
+                    "tree_sub_accounts_3",
+                    "tree_sub_accounts_4",
+                    "tree_courses_3",
+                    "tree_courses_4",
+                ]
+            },
+            m,
+        )
+
+        courses = self.account.get_tree_courses(enrollment_term_id=5)
+
+        self.assertEqual(sorted(courses["id"]), [30, 40])
+        self.assertEqual(
+            dict(zip(courses["id"], courses["account_path"])),
+            {30: "1/3", 40: "1/2/4"},
+        )
+        course_requests = [r for r in m.request_history if "courses" in r.path]
+        self.assertEqual(len(course_requests), 2)
+        self.assertTrue(
+            all(r.qs["enrollment_term_id"] == ["5"] for r in course_requests)
+        )
+
+    def test_get_tree_courses_include_parents(self, m):
+        register_uris(
+            {
+                "account": [
+                    "tree_sub_accounts_1",
+                    "tree_sub_accounts_2",
+                    "tree_sub_accounts_3",
+                    "tree_sub_accounts_4",
+                    "tree_courses_1",
+                    "tree_courses_2",
+                    "tree_courses_3",
+                    "tree_courses_4",
+                ]
+            },
+            m,
+        )
+
+        tree = self.account.get_account_tree()
+        courses = self.account.get_tree_courses(tree, include_parents=True)
+
+        self.assertEqual(sorted(courses["id"]), [10, 30, 40])
+        self.assertEqual(
+            dict(zip(courses["id"], courses["account_depth"])), {10: 0, 30: 1, 40: 2}
+        )
+
     # get_user_logins()
     def test_get_user_logins(self, m):
         requires = {"account": ["get_user_logins", "get_user_logins_2"]}
@@ -773,6 +864,24 @@ class TestAccount(unittest.TestCase):
         )
         self.assertIsInstance(authentication_provider_by_obj, AuthenticationProvider)
 
+    # run_report()
+    def test_run_report(self, m):
+        register_uris({"account": ["run_report_create", "run_report_complete"]}, m)
+
+        report = self.account.run_report(
+            "provisioning_csv", interval=0, parameters={"users": True}
+        )
+
+        self.assertIsInstance(report, AccountReport)
+        self.assertEqual(report.status, "complete")
+        self.assertEqual(report.account_id, 1)
+
+    def test_run_report_timeout(self, m):
+        register_uris({"account": ["run_report_create"]}, m)
+
+        with self.assertRaises(CanvasException):
+            self.account.run_report("provisioning_csv", interval=0, timeout=0)
+
     # show_account_auth_settings()
     def test_show_account_auth_settings(self, m):
         register_uris({"account": ["show_account_auth_settings"]}, m)
@@ -992,6 +1101,30 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(migration_systems[1].requires_file_upload, False)
         self.assertEqual(migration_systems[1].name, "Dummy Importer 02")
 
+    # get_account_tree()
+    def test_get_account_tree(self, m):
+        register_uris(
+            {
+                "account": [
+                    "tree_sub_accounts_1",
+                    "tree_sub_accounts_2",
+                    "tree_sub_accounts_3",
+                    "tree_sub_accounts_4",
+                ]
+            },
+            m,
+        )
+
+        tree = self.account.get_account_tree()
+
+        self.assertEqual(list(tree.index), [1, 2, 3, 4])
+        self.assertEqual(list(tree["depth"]), [0, 1, 1, 2])
+        self.assertEqual(list(tree["path"]), ["1", "1/2", "1/3", "1/2/4"])
+        self.assertEqual(list(tree["is_leaf"]), [False, False, True, True])
+        self.assertEqual(tree.loc[4, "parent_account_id"], 2)
+        self.assertEqual(tree.loc[4, "name"], "Music")
+        self.assertTrue(all(r.qs["recursive"] == ["false"] for r in m.request_history))
+
     # get_admins()
     def test_get_admins(self, m):
         register_uris({"account": ["get_admins", "get_admins_page_2"]}, m)
@@ -1342,6 +1475,22 @@ class TestAccount(unittest.TestCase):
         self.assertEqual(event_list[1].created_at, "2012-07-20T15:00:00-06:00")
         self.assertEqual(event_list[1].event_type, "logout")
 
+    # wait_for_sis_imports()
+    def test_wait_for_sis_imports(self, m):
+        register_uris({"account": ["create_sis_import", "get_sis_import"]}, m)
+
+        filepath = os.path.join("tests", "fixtures", "test_create_sis_import.csv")
+        sis_import = self.account.create_sis_import(filepath)
+
+        sis_imports = self.account.wait_for_sis_imports(
+            [sis_import, 2], interval=0, include=["errors"]
+        )
+
+        self.assertEqual(len(sis_imports), 2)
+        self.assertIsInstance(sis_imports[0], SisImport)
+        self.assertEqual(sis_imports[0].workflow_state, "imported")
+        self.assertEqual(m.last_request.qs, {"include[]": ["errors"]})
+
 
 @requests_mock.Mocker()
 class TestAccountNotification(unittest.TestCase):
@@ -1401,6 +1550,102 @@ class TestAccountReport(unittest.TestCase):
         string = str(self.AccountReport)
         self.assertIsInstance(string, str)
 
+    # get_csv_chunks()
+    def test_get_csv_chunks(self, m):
+        m.register_uri(
+            "GET",
+            "https://example.com/files/10/download",
+            text="user_id,login_id,status\n1,a,active\n2,b,deleted\n3,c,active\n",
+        )
+        report = AccountReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 2,
+                "account_id": 1,
+                "report": "provisioning_csv",
+                "status": "complete",
+                "attachment": {"url": "https://example.com/files/10/download"},
+            },
+        )
+
+        chunks = list(report.get_csv_chunks(chunksize=2, dtype={"login_id": str}))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(list(chunks[1]["login_id"]), ["c"])
+
+    def test_get_csv_chunks_no_attachment(self, m):
+        with self.assertRaises(CanvasException):
+            self.AccountReport.get_csv_chunks()
+
+    # get_dataframe()
+    def test_get_dataframe(self, m):
+        m.register_uri(
+            "GET",
+            "https://example.com/files/10/download",
+            text="user_id,created_at\n1,2024-01-01T00:00:00Z\n2,2024-01-02T00:00:00Z\n",
+        )
+        report = AccountReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 2,
+                "account_id": 1,
+                "report": "provisioning_csv",
+                "status": "complete",
+                "attachment": {"url": "https://example.com/files/10/download"},
+            },
+        )
+
+        df = report.get_dataframe(chunksize=1, parse_dates=["created_at"])
+
+        self.assertEqual(len(df), 2)
+        self.assertEqual(list(df["user_id"]), [1, 2])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["created_at"]))
+
+    def test_get_dataframe_empty(self, m):
+        m.register_uri("GET", "https://example.com/files/10/download", text="")
+        report = AccountReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 2,
+                "status": "complete",
+                "attachment": {"url": "https://example.com/files/10/download"},
+            },
+        )
+
+        self.assertTrue(report.get_dataframe().empty)
+
+    # wait()
+    def test_wait(self, m):
+        register_uris({"account": ["run_report_error"]}, m)
+        report = AccountReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 2,
+                "account_id": 1,
+                "report": "provisioning_csv",
+                "status": "running",
+            },
+        )
+
+        finished = report.wait(interval=0, include=["progress"])
+
+        self.assertIsInstance(finished, AccountReport)
+        self.assertEqual(finished.status, "error")
+        self.assertEqual(m.last_request.qs, {"include[]": ["progress"]})
+
+    def test_wait_already_finished(self, m):
+        report = AccountReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 2,
+                "account_id": 1,
+                "report": "sis_export_csv",
+                "status": "complete",
+            },
+        )
+
+        self.assertIs(report.wait(), report)
+
     # get_features()
     def test_get_features(self, m):
         register_uris({"account": ["get_features"]}, m)
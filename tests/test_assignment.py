@@ -2,6 +2,7 @@ import unittest
 import uuid
 from pathlib import Path
 
+import pandas as pd
 import requests_mock
 
 from canvasapi import Canvas
@@ -287,6 +288,26 @@ class TestAssignment(unittest.TestCase):
         string = str(self.assignment)
         self.assertIsInstance(string, str)
 
+    # bulk_update_grades()
+    def test_bulk_update_grades(self, m):
+        register_uris({"assignment": ["update_submissions"]}, m)
+        register_uris({"progress": ["course_progress"]}, m)
+
+        grades = pd.DataFrame({"user_id": [1, 2], "grade": [97, 98]})
+        result = self.assignment.bulk_update_grades(grades, interval=0)
+
+        self.assertEqual(
+            m.request_history[0].json(),
+            {"grade_data": {"1": {"posted_grade": 97}, "2": {"posted_grade": 98}}},
+        )
+        self.assertEqual(list(result["workflow_state"]), ["completed"] * 2)
+
+    def test_bulk_update_grades_other_assignment(self, m):
+        grades = pd.DataFrame({"user_id": [1], "assignment_id": [2], "grade": [97]})
+
+        with self.assertRaises(ValueError):
+            self.assignment.bulk_update_grades(grades)
+
     # submissions_bulk_update()
     def test_submissions_bulk_update(self, m):
         register_uris({"assignment": ["update_submissions"]}, m)
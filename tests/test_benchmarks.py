@@ -0,0 +1,69 @@
+import unittest
+
+from benchmarks import suite  # noqa: F401
+from benchmarks.harness import BENCHMARKS, compare, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    # run_benchmarks()
+    def test_run_benchmarks(self):
+        results = run_benchmarks(
+            names=["paginated_list_growth", "requester_request"], rounds=1, quick=True
+        )
+
+        self.assertEqual(
+            [result["name"] for result in results["benchmarks"]],
+            ["paginated_list_growth", "requester_request"],
+        )
+        self.assertEqual(results["benchmarks"][0]["params"], {"pages": 1})
+        self.assertGreater(results["benchmarks"][0]["median"], 0)
+        self.assertIn("pandas", results["environment"])
+
+    def test_run_benchmarks_info(self):
+        results = run_benchmarks(names=["bulk_update_payload"], rounds=1, quick=True)
+
+        self.assertEqual(results["benchmarks"][0]["params"]["encoding"], "form")
+        self.assertGreater(results["benchmarks"][0]["info"]["bytes"], 0)
+        self.assertNotIn(
+            "info",
+            run_benchmarks(names=["requester_request"], rounds=1)["benchmarks"][0],
+        )
+
+    def test_run_benchmarks_names(self):
+        names = {spec["name"] for spec in BENCHMARKS}
+
+        self.assertTrue(
+            {
+                "apply_filters",
+                "bulk_update_payload",
+                "canvas_object_attribute_access",
+                "canvas_object_construction",
+                "combine_kwargs",
+                "import_time",
+                "paginated_list_growth",
+                "requester_request",
+            }
+            <= names
+        )
+
+    # compare()
+    def test_compare(self):
+        previous = {
+            "benchmarks": [
+                {"name": "a", "params": {"n": 1}, "median": 1.0},
+                {"name": "b", "params": {}, "median": 1.0},
+            ]
+        }
+        current = {
+            "benchmarks": [
+                {"name": "a", "params": {"n": 1}, "median": 1.5},
+                {"name": "b", "params": {}, "median": 1.05},
+                {"name": "c", "params": {}, "median": 1.0},
+            ]
+        }
+
+        df = compare(previous, current, threshold=0.1)
+
+        self.assertEqual(list(df["name"]), ["a", "b"])
+        self.assertEqual(list(df["regression"]), [True, False])
+        self.assertEqual(df["ratio"][0], 1.5)
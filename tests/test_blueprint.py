@@ -95,6 +95,19 @@ class TestBlueprint(unittest.TestCase):
         self.assertEqual(blueprint_migration.workflow_state, "completed")
         self.assertEqual(blueprint_migration.template_id, 1)
 
+    # wait()
+    def test_wait(self, m):
+        register_uris({"blueprint": ["sync_show_1"]}, m)
+        migration = BlueprintMigration(
+            self.canvas._Canvas__requester,
+            {"id": 7, "template_id": 1, "course_id": 1, "workflow_state": "queued"},
+        )
+
+        migration = migration.wait(interval=0)
+
+        self.assertEqual(migration.workflow_state, "completed")
+        self.assertEqual(migration.course_id, 1)
+
 
 @requests_mock.Mocker()
 class TestBlueprintSubscription(unittest.TestCase):
@@ -1,6 +1,7 @@
 import unittest
 import warnings
 from datetime import datetime
+from unittest.mock import patch
 
 import pytz
 import requests_mock
@@ -427,6 +428,21 @@ class TestCanvas(unittest.TestCase):
         self.assertTrue(hasattr(group, "name"))
         self.assertTrue(hasattr(group, "description"))
 
+    # get_graphql_connection()
+    def test_get_graphql_connection(self, m):
+        register_uris(
+            {"graphql": ["connection_page_2"]}, m, base_url=settings.BASE_URL_GRAPHQL
+        )
+
+        df = self.canvas.get_graphql_connection(
+            "query ($cursor: String) { course(id: 1) { submissionsConnection"
+            "(after: $cursor) { edges { node { _id } } pageInfo { hasNextPage"
+            " endCursor } } } }",
+            "course.submissionsConnection",
+        )
+
+        self.assertEqual(list(df["_id"]), ["3"])
+
     # get_group()
     def test_get_group(self, m):
         register_uris({"group": ["get_by_id"]}, m)
@@ -741,6 +757,95 @@ class TestCanvas(unittest.TestCase):
         self.assertIsInstance(courses, list)
         self.assertEqual(len(courses), 2)
 
+    # get_blueprint_changes()
+    def test_get_blueprint_changes(self, m):
+        register_uris(
+            {
+                "blueprint": [
+                    "changes_unsynced_1",
+                    "changes_unsynced_2",
+                    "changes_associated_1",
+                    "changes_associated_2",
+                ]
+            },
+            m,
+        )
+
+        changes = self.canvas.get_blueprint_changes([1, 2])
+
+        unsynced = changes["unsynced_changes"]
+        self.assertEqual(
+            list(unsynced.columns[:2]), ["blueprint_course_id", "template_id"]
+        )
+        self.assertEqual(list(unsynced["blueprint_course_id"]), [1])
+        self.assertEqual(list(unsynced["asset_name"]), ["test quiz"])
+
+        associated = changes["associated_courses"]
+        self.assertEqual(list(associated["blueprint_course_id"]), [1, 1, 2])
+        self.assertEqual(list(associated["id"]), [10, 11, 12])
+
+    # graphql_batch()
+    def test_graphql_batch(self, m):
+        register_uris({"graphql": ["batch"]}, m, base_url=settings.BASE_URL_GRAPHQL)
+
+        results = self.canvas.graphql_batch({"course_1": 'course(id: "1") { name }'})
+
+        self.assertEqual(results, {"course_1": {"name": "Course 1"}})
+
+    # sync_blueprints()
+    @patch("canvasapi.poller.time.sleep")
+    def test_sync_blueprints(self, m, sleep):
+        register_uris(
+            {
+                "blueprint": [
+                    "sync_start_1",
+                    "sync_start_2",
+                    "sync_show_1",
+                    "sync_show_2",
+                    "sync_details_1",
+                ]
+            },
+            m,
+        )
+
+        result = self.canvas.sync_blueprints(
+            [1, 2], details=True, comment="Nightly sync"
+        )
+
+        migrations = result["migrations"]
+        self.assertEqual(list(migrations["blueprint_course_id"]), [1, 2])
+        self.assertEqual(list(migrations["id"]), [7, 8])
+        self.assertEqual(
+            list(migrations["workflow_state"]), ["completed", "imports_failed"]
+        )
+        sleep.assert_called_once()
+
+        details = result["details"]
+        self.assertEqual(list(details["migration_id"]), [7, 7])
+        self.assertEqual(list(details["asset_id"]), [1, 2])
+
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertTrue(all("comment=Nightly+sync" in r.body for r in posts))
+
+    # get_module_structures()
+    def test_get_module_structures(self, m):
+        register_uris(
+            {
+                "course": [
+                    "get_module_structure",
+                    "get_module_structure_items",
+                    "get_module_structure_course_2",
+                ]
+            },
+            m,
+        )
+
+        structures = self.canvas.get_module_structures([1, 2])
+
+        self.assertEqual(structures.columns[0], "course_id")
+        self.assertEqual(list(structures["course_id"]), [1] * 6 + [2])
+        self.assertEqual(structures["title"].iloc[-1], "Welcome")
+
     # get_outcome()
     def test_get_outcome(self, m):
         register_uris({"outcome": ["canvas_get_outcome"]}, m)
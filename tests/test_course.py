@@ -2,12 +2,16 @@ import os
 import unittest
 import uuid
 import warnings
+from unittest.mock import patch
 from urllib.parse import quote
 
+import numpy as np
+import pandas as pd
 import requests
 import requests_mock
 
 from canvasapi import Canvas
+from canvasapi.account import Account
 from canvasapi.assignment import Assignment, AssignmentGroup, AssignmentOverride
 from canvasapi.blueprint import BlueprintSubscription, BlueprintTemplate
 from canvasapi.content_export import ContentExport
@@ -83,17 +87,39 @@ class TestCourse(unittest.TestCase):
             {"course": ["column_data_bulk_update"], "progress": ["course_progress"]},
             m,
         )
-        progress = self.course.column_data_bulk_update(
-            column_data=[
-                {"column_id": 1, "user_id": 1, "content": "Test Content One"},
-                {"column_id": 2, "user_id": 2, "content": "Test Content Two"},
-            ]
-        )
+        column_data = [
+            {"column_id": 1, "user_id": 1, "content": "Test Content One"},
+            {"column_id": 2, "user_id": 2, "content": "Test Content Two"},
+        ]
+        progress = self.course.column_data_bulk_update(column_data=column_data)
+        self.assertEqual(m.request_history[0].json(), {"column_data": column_data})
         self.assertIsInstance(progress, Progress)
         self.assertTrue(progress.context_type == "Course")
         progress = progress.query()
         self.assertTrue(progress.context_type == "Course")
 
+    def test_column_data_bulk_update_numpy(self, m):
+        register_uris({"course": ["column_data_bulk_update"]}, m)
+        columns = pd.DataFrame({"column_id": [1, 2], "user_id": [1, 2]})
+
+        # Values read from a DataFrame are numpy scalars.
+        column_data = [
+            {"column_id": column_id, "user_id": user_id, "content": "Test"}
+            for column_id, user_id in columns.to_numpy()
+        ]
+        self.assertIsInstance(column_data[0]["column_id"], np.int64)
+        self.course.column_data_bulk_update(column_data=column_data)
+
+        self.assertEqual(
+            m.last_request.json(),
+            {
+                "column_data": [
+                    {"column_id": 1, "user_id": 1, "content": "Test"},
+                    {"column_id": 2, "user_id": 2, "content": "Test"},
+                ]
+            },
+        )
+
     # conclude()
     def test_conclude(self, m):
         register_uris({"course": ["conclude"]}, m)
@@ -158,6 +184,11 @@ class TestCourse(unittest.TestCase):
         updated_overrides = self.course.update_assignment_overrides(override_list)
         updated_list = [updated for updated in updated_overrides]
 
+        self.assertEqual(
+            m.last_request.json(),
+            {"assignment_overrides": override_list, "per_page": 100},
+        )
+
         self.assertEqual(len(updated_list), 2)
         self.assertIsInstance(updated_list[0], AssignmentOverride)
         self.assertIsInstance(updated_list[1], AssignmentOverride)
@@ -441,6 +472,33 @@ class TestCourse(unittest.TestCase):
         self.assertTrue(hasattr(new_quiz_list[0], "title"))
         self.assertEqual(new_quiz_list[0].title, "New Quiz One")
 
+    # get_module_structure()
+    def test_get_module_structure(self, m):
+        register_uris(
+            {"course": ["get_module_structure", "get_module_structure_items"]}, m
+        )
+
+        structure = self.course.get_module_structure()
+
+        self.assertEqual(
+            list(structure["module_name"]), ["Week 1"] * 3 + ["Week 2"] * 2 + ["Week 3"]
+        )
+        self.assertEqual(list(structure["id"][:5]), [21, 22, 23, 11, 12])
+        self.assertTrue(pd.isna(structure["id"][5]))
+        self.assertNotIn("module_items", structure.columns)
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.request_history[0].qs["include[]"], ["items"])
+
+    def test_get_module_structure_empty(self, m):
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "courses/1/modules", json=[]
+        )
+
+        structure = self.course.get_module_structure()
+
+        self.assertTrue(structure.empty)
+        self.assertIn("module_id", structure.columns)
+
     # get_modules()
     def test_get_modules(self, m):
         register_uris({"course": ["list_modules", "list_modules2"]}, m)
@@ -1392,6 +1450,84 @@ class TestCourse(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertIsInstance(result["rollups"], list)
 
+    def test_get_outcome_result_rollups_response(self, m):
+        register_uris({"outcome": ["course_outcome_rollups_table_p1"]}, m)
+
+        result = self.course.get_outcome_result_rollups(include=["users"])
+
+        # The response is returned as it is; get_outcome_rollups_table
+        # follows the other pages.
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(result["rollups"]), 1)
+        self.assertEqual(result["rollups"][0]["links"], {"user": "1", "section": "1"})
+        self.assertEqual(len(result["linked"]["users"]), 1)
+
+    # get_outcome_results_table()
+    def test_get_outcome_results_table(self, m):
+        register_uris(
+            {
+                "outcome": [
+                    "course_outcome_results_table_p1",
+                    "course_outcome_results_table_p2",
+                ]
+            },
+            m,
+        )
+
+        table = self.course.get_outcome_results_table()
+
+        self.assertEqual(list(table["id"]), [10, 11, 12])
+        self.assertEqual(str(table["user_id"].dtype), "Int64")
+        self.assertEqual(list(table["outcome_id"]), [97, 97, 98])
+        self.assertEqual(
+            list(table["alignment_id"]),
+            ["assignment_53", "assignment_53", "assignment_54"],
+        )
+        self.assertEqual(table["score"].dtype, "float64")
+        self.assertTrue(pd.isna(table["score"][2]))
+        self.assertEqual(
+            str(table["submitted_or_assessed_at"].dtype), "datetime64[ns, UTC]"
+        )
+        self.assertEqual(
+            list(table["user_name"]), ["Student 3", "Student 4", "Student 3"]
+        )
+        self.assertEqual(list(table["outcome_mastery_points"]), [3, 3, 2])
+        self.assertEqual(
+            list(table["alignment_name"]),
+            ["Assignment 53", "Assignment 53", "Assignment 54"],
+        )
+        self.assertNotIn("links", table.columns)
+        self.assertEqual(
+            m.request_history[0].qs["include[]"], ["alignments", "outcomes", "users"]
+        )
+
+    # get_outcome_rollups_table()
+    def test_get_outcome_rollups_table(self, m):
+        register_uris(
+            {
+                "outcome": [
+                    "course_outcome_rollups_table_p1",
+                    "course_outcome_rollups_table_p2",
+                ]
+            },
+            m,
+        )
+
+        table = self.course.get_outcome_rollups_table()
+
+        self.assertEqual(list(table["user_id"]), [1, 1, 2])
+        self.assertEqual(list(table["outcome_id"]), [1, 2, 1])
+        self.assertEqual(list(table["section_id"]), [1, 1, 1])
+        self.assertEqual(list(table["score"]), [3.0, 2.5, 4.0])
+        self.assertEqual(str(table["count"].dtype), "Int64")
+        self.assertEqual(
+            list(table["outcome_title"]), ["Outcome 1", "Outcome 2", "Outcome 1"]
+        )
+        self.assertEqual(
+            list(table["user_name"]), ["Student 1", "Student 1", "Student 2"]
+        )
+        self.assertNotIn("scores", table.columns)
+
     # add_grading_standards()
     def test_add_grading_standards(self, m):
         register_uris({"course": ["add_grading_standards"]}, m)
@@ -1562,13 +1698,222 @@ class TestCourse(unittest.TestCase):
         with self.assertRaises(RequiredFieldMissing):
             self.course.set_quiz_extensions([{"extra_time": 60, "extra_attempts": 3}])
 
+    # bulk_enroll_users()
+    def test_bulk_enroll_users(self, m):
+        register_uris(
+            {"course": ["list_enrollments", "list_enrollments_2", "enroll_user"]}, m
+        )
+
+        enrollments = pd.DataFrame(
+            {
+                "user_id": [1, 3, 3, 2],
+                "type": ["StudentEnrollment"] * 3 + [None],
+            }
+        )
+        report = self.course.bulk_enroll_users(enrollments)
+
+        self.assertEqual(
+            list(report["status"]), ["exists", "enrolled", "duplicate", "enrolled"]
+        )
+        self.assertEqual(list(report["attempts"]), [0, 1, 0, 1])
+        self.assertEqual(report["enrollment_id"][1], 1)
+
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertEqual(len(posts), 2)
+        self.assertTrue(
+            all("enrollment%5Btype%5D=StudentEnrollment" in r.body for r in posts)
+        )
+
+    def test_bulk_enroll_users_retries(self, m):
+        register_uris({"course": ["list_enrollments", "list_enrollments_2"]}, m)
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "courses/1/enrollments",
+            [
+                {"status_code": 503},
+                {"json": {"id": 5, "user_id": 3}},
+                {"status_code": 404},
+            ],
+        )
+
+        enrollments = pd.DataFrame({"user_id": [3, 4]})
+        report = self.course.bulk_enroll_users(
+            enrollments, max_workers=1, retry_delay=0
+        )
+
+        self.assertEqual(list(report["status"]), ["enrolled", "failed"])
+        self.assertEqual(list(report["attempts"]), [2, 1])
+        self.assertEqual(report["error"][1], "Not Found")
+
+    @patch("canvasapi.poller.time.sleep")
+    def test_bulk_enroll_users_sis_import(self, m, sleep):
+        register_uris(
+            {
+                "course": ["list_enrollments", "list_enrollments_2"],
+                "account": ["create_sis_import", "get_sis_import"],
+            },
+            m,
+        )
+
+        requester = self.canvas._Canvas__requester
+        course = Course(requester, {"id": 1, "sis_course_id": "CS101"})
+        account = Account(requester, {"id": 1})
+
+        enrollments = pd.DataFrame(
+            {"user_id": [1, 3, 4], "sis_user_id": ["s1", "s3", "s4"]}
+        )
+        report = course.bulk_enroll_users(
+            enrollments, sis_account=account, sis_threshold=2
+        )
+
+        self.assertEqual(list(report["status"]), ["exists", "imported", "imported"])
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertEqual(len(posts), 1)
+        self.assertIn(b"enrollments.csv", posts[0].body)
+
+    # bulk_set_extensions()
+    def test_bulk_set_extensions(self, m):
+        register_uris(
+            {
+                "course": [
+                    "bulk_extensions_quiz_submissions",
+                    "bulk_extensions_assignment_submissions",
+                    "bulk_extensions_quiz",
+                    "bulk_extensions_assignment",
+                ]
+            },
+            m,
+        )
+        extensions = pd.DataFrame(
+            {
+                "user_id": [11, 12, 13, 12, 11],
+                "quiz_id": [1, 1, 1, 1, None],
+                "assignment_id": [None, None, None, None, 5],
+                "extra_attempts": [1, 2, 2, 2, 3],
+                "extra_time": [None, None, 30, None, None],
+            }
+        )
+
+        report = self.course.bulk_set_extensions(extensions, chunk_size=1)
+
+        self.assertEqual(
+            list(report["status"]),
+            ["unchanged", "extended", "extended", "duplicate", "extended"],
+        )
+        self.assertEqual(list(report["attempts"]), [0, 1, 1, 0, 1])
+
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertEqual(len(posts), 3)
+        bodies = sorted(r.body for r in posts)
+        self.assertIn("assignment_extensions%5B%5D%5Bextra_attempts%5D=3", bodies[0])
+        self.assertIn("quiz_extensions%5B%5D%5Buser_id%5D=12", bodies[1])
+        self.assertNotIn("extra_time", bodies[1])
+        self.assertIn("quiz_extensions%5B%5D%5Bextra_time%5D=30", bodies[2])
+
+    def test_bulk_set_extensions_failed(self, m):
+        register_uris(
+            {
+                "course": [
+                    "bulk_extensions_assignment_submissions",
+                    "bulk_extensions_assignment_error",
+                ]
+            },
+            m,
+        )
+        extensions = pd.DataFrame(
+            {"user_id": [11, 12], "assignment_id": [5, 5], "extra_attempts": [3, 3]}
+        )
+
+        report = self.course.bulk_set_extensions(extensions, retries=2, retry_delay=0)
+
+        self.assertEqual(list(report["status"]), ["failed", "failed"])
+        self.assertEqual(list(report["attempts"]), [3, 3])
+        self.assertIn("500", report["error"][0])
+
+    def test_bulk_set_extensions_no_target(self, m):
+        with self.assertRaises(ValueError):
+            self.course.bulk_set_extensions(pd.DataFrame({"user_id": [1]}))
+
+    # bulk_update_grades()
+    def test_bulk_update_grades(self, m):
+        register_uris({"course": ["update_submissions"]}, m)
+        register_uris({"progress": ["course_progress"]}, m)
+
+        grades = pd.DataFrame(
+            {
+                "user_id": [1, 2, 1],
+                "assignment_id": [1, 1, 2],
+                "grade": [97, 98, None],
+                "comment": [None, "Nice", "Late"],
+            }
+        )
+        result = self.course.bulk_update_grades(grades, chunk_size=2, interval=0)
+
+        bodies = [r.json() for r in m.request_history if r.method == "POST"]
+        self.assertCountEqual(
+            bodies,
+            [
+                {
+                    "grade_data": {
+                        "1": {
+                            "1": {"posted_grade": 97},
+                            "2": {"posted_grade": 98, "text_comment": "Nice"},
+                        }
+                    }
+                },
+                {"grade_data": {"2": {"1": {"text_comment": "Late"}}}},
+            ],
+        )
+
+        self.assertEqual(list(result["progress_id"]), [3, 3, 3])
+        self.assertEqual(list(result["workflow_state"]), ["completed"] * 3)
+        self.assertEqual(list(result["comment"]), [None, "Nice", "Late"])
+
+    def test_bulk_update_grades_failed_request(self, m):
+        register_uris({"progress": ["course_progress"]}, m)
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "courses/1/submissions/update_grades",
+            [
+                {"json": {"id": 3, "workflow_state": "queued"}},
+                {"json": {"errors": "boom"}, "status_code": 500},
+            ],
+        )
+
+        grades = pd.DataFrame(
+            {"user_id": [1, 2], "assignment_id": [1, 1], "grade": ["A", "B"]}
+        )
+        result = self.course.bulk_update_grades(
+            grades, chunk_size=1, max_workers=1, interval=0
+        )
+
+        self.assertEqual(list(result["workflow_state"]), ["completed", "error"])
+        self.assertTrue(pd.isna(result["progress_id"][1]))
+        self.assertIn("500", result["message"][1])
+
+    def test_bulk_update_grades_invalid(self, m):
+        with self.assertRaises(ValueError):
+            self.course.bulk_update_grades(pd.DataFrame({"user_id": [1], "grade": [1]}))
+
+        with self.assertRaises(ValueError):
+            self.course.bulk_update_grades(
+                pd.DataFrame({"user_id": [1], "assignment_id": [1]})
+            )
+
+        with self.assertRaises(ValueError):
+            self.course.bulk_update_grades(
+                pd.DataFrame(
+                    {"user_id": [1, 1], "assignment_id": [1, 1], "grade": [1, 2]}
+                )
+            )
+
     # submissions_bulk_update()
     def test_submissions_bulk_update(self, m):
         register_uris({"course": ["update_submissions"]}, m)
         register_uris({"progress": ["course_progress"]}, m)
-        progress = self.course.submissions_bulk_update(
-            grade_data={"1": {"1": {"posted_grade": 97}, "2": {"posted_grade": 98}}}
-        )
+        grade_data = {"1": {"1": {"posted_grade": 97}, "2": {"posted_grade": 98}}}
+        progress = self.course.submissions_bulk_update(grade_data=grade_data)
+        self.assertEqual(m.request_history[0].json(), {"grade_data": grade_data})
         self.assertIsInstance(progress, Progress)
         self.assertTrue(progress.context_type == "Course")
         progress = progress.query()
@@ -1721,6 +2066,28 @@ class TestCourse(unittest.TestCase):
             self.assertIsInstance(event, GradeChangeEvent)
             self.assertEqual(event.event_type, "grade_change")
 
+    # get_gradebook()
+    def test_get_gradebook(self, m):
+        register_uris(
+            {"course": ["get_gradebook", "get_gradebook_p2", "get_gradebook_p3"]}, m
+        )
+
+        gradebook = self.course.get_gradebook()
+
+        self.assertIsInstance(gradebook, pd.DataFrame)
+        self.assertEqual(list(gradebook.index), [1, 2, 3])
+        self.assertEqual(gradebook["score"].dtypes.tolist(), ["float64"] * 2)
+        self.assertEqual(str(gradebook["late"][1].dtype), "boolean")
+        self.assertEqual(gradebook["score"].loc[1, 1], 9.5)
+        self.assertTrue(pd.isna(gradebook["score"].loc[1, 2]))
+        self.assertTrue(gradebook["missing"].loc[1, 2])
+        self.assertTrue(gradebook["late"].loc[2, 1])
+        self.assertTrue(pd.isna(gradebook["late"].loc[2, 2]))
+        self.assertEqual(gradebook["score"].loc[3, 2], 4)
+
+        self.assertEqual(m.request_history[0].qs["student_ids[]"], ["all"])
+        self.assertEqual(len(m.request_history), 3)
+
     # get_grading_period()
     def test_get_grading_period(self, m):
         register_uris({"course": ["get_grading_period"]}, m)
@@ -1762,6 +2129,39 @@ class TestCourse(unittest.TestCase):
         self.assertIsInstance(content_export, ContentExport)
         self.assertTrue(hasattr(content_export, "export_type"))
 
+    # export_quizzes()
+    def test_export_quizzes(self, m):
+        register_uris(
+            {
+                "quiz": [
+                    "export_submissions",
+                    "export_questions_1",
+                    "export_questions_2",
+                ]
+            },
+            m,
+        )
+
+        export = self.course.export_quizzes([1], events=False, statistics=False)
+
+        self.assertEqual(set(export), {"submissions", "answers", "errors"})
+        self.assertTrue(export["errors"].empty)
+        self.assertEqual(list(export["answers"]["quiz_id"]), [1, 1, 1])
+        self.assertEqual(list(export["answers"]["quiz_submission_id"]), [1, 1, 2])
+
+    def test_export_quizzes_no_quizzes(self, m):
+        m.register_uri(
+            "GET", settings.BASE_URL_WITH_VERSION + "courses/1/quizzes", json=[]
+        )
+
+        export = self.course.export_quizzes()
+
+        self.assertEqual(
+            set(export), {"submissions", "answers", "events", "statistics", "errors"}
+        )
+        for frame in export.values():
+            self.assertTrue(frame.empty)
+
     # get_enabled_features()
     def test_get__enabled_features(self, m):
         register_uris({"course": ["get_enabled_features"]}, m)
@@ -1,5 +1,6 @@
 import unittest
 
+import pandas as pd
 import requests_mock
 
 from canvasapi import Canvas
@@ -203,6 +204,55 @@ class TestDiscussionTopic(unittest.TestCase):
         with self.assertRaises(ValueError):
             discussion._parent_type
 
+    # get_thread()
+    def test_get_thread(self, m):
+        register_uris({"discussion_topic": ["get_thread_view"]}, m)
+
+        thread = self.discussion_topic.get_thread()
+
+        self.assertIsInstance(thread, pd.DataFrame)
+        self.assertEqual(list(thread["id"]), [1, 3, 4, 2, 5])
+        self.assertEqual(list(thread["depth"]), [0, 1, 2, 0, 1])
+        self.assertEqual(list(thread["path"]), ["1", "1/3", "1/3/4", "2", "2/5"])
+        self.assertEqual(thread["parent_id"].tolist(), [pd.NA, 1, 3, pd.NA, 2])
+        self.assertEqual(
+            list(thread["user_display_name"]), ["Ann", "Bob", "Ann", "Bob", "Bob"]
+        )
+        self.assertNotIn("replies", thread.columns)
+        self.assertEqual(m.call_count, 1)
+
+    def test_get_thread_view_unavailable(self, m):
+        register_uris(
+            {
+                "discussion_topic": [
+                    "get_thread_view_unavailable",
+                    "get_thread_entries",
+                    "get_thread_replies_1",
+                    "get_thread_replies_2",
+                    "get_thread_replies_3",
+                    "get_thread_replies_4",
+                ]
+            },
+            m,
+        )
+
+        thread = self.discussion_topic.get_thread()
+
+        self.assertEqual(list(thread["id"]), [1, 3, 4, 2])
+        self.assertEqual(list(thread["path"]), ["1", "1/3", "1/3/4", "2"])
+        self.assertNotIn("recent_replies", thread.columns)
+        self.assertNotIn("user_display_name", thread.columns)
+
+    def test_get_thread_forbidden(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1/discussion_topics/1/view",
+            status_code=403,
+        )
+
+        with self.assertRaises(Forbidden):
+            self.discussion_topic.get_thread()
+
     # get_parent()
     def test_get_parent_course(self, m):
         register_uris({"course": ["get_by_id"]}, m)
@@ -0,0 +1,175 @@
+import unittest
+from email.message import Message
+from unittest.mock import Mock, patch
+
+import requests
+import requests_mock
+from requests.cookies import MockRequest, MockResponse
+
+from canvasapi import CanvasFactory
+from canvasapi.factory import RateLimitBudget
+from canvasapi.metrics import RequestMetrics
+from tests import settings
+
+OTHER_URL = "https://other.example.com"
+
+
+@requests_mock.Mocker()
+class TestCanvasFactory(unittest.TestCase):
+    def setUp(self):
+        self.factory = CanvasFactory(min_remaining=100, refill_rate=10)
+        self.addCleanup(self.factory.close)
+
+    # get_canvas()
+    def test_get_canvas_shares_session(self, m):
+        canvas_a = self.factory.get_canvas(settings.BASE_URL, "token-a")
+        canvas_b = self.factory.get_canvas(settings.BASE_URL + "/", "token-b")
+        canvas_c = self.factory.get_canvas(OTHER_URL, "token-a")
+
+        session = canvas_a._Canvas__requester._session
+        self.assertIs(canvas_b._Canvas__requester._session, session)
+        self.assertIsNot(canvas_c._Canvas__requester._session, session)
+        self.assertNotIn("Authorization", session.headers)
+
+    def test_get_canvas_authorization(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1",
+            json={"id": 1, "name": "Course 1"},
+        )
+
+        self.factory.get_canvas(settings.BASE_URL, "token-a").get_course(1)
+        self.factory.get_canvas(settings.BASE_URL, "token-b").get_course(1)
+
+        first, second = m.request_history
+        self.assertEqual(first.headers["Authorization"], "Bearer token-a")
+        self.assertEqual(second.headers["Authorization"], "Bearer token-b")
+
+    def test_get_canvas_metrics(self, m):
+        metrics = RequestMetrics()
+        factory = CanvasFactory(metrics=metrics)
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1",
+            json={"id": 1, "name": "Course 1"},
+        )
+
+        factory.get_canvas(settings.BASE_URL, "token-a").get_course(1)
+        factory.get_canvas(settings.BASE_URL, "token-b").get_course(1)
+
+        self.assertEqual(metrics.get_dataframe().iloc[0]["requests"], 2)
+
+    @patch("canvasapi.factory.time.sleep")
+    def test_get_canvas_budget(self, m, sleep):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1",
+            json={"id": 1, "name": "Course 1"},
+            headers={"X-Rate-Limit-Remaining": "50", "X-Request-Cost": "1"},
+        )
+        canvas_a = self.factory.get_canvas(settings.BASE_URL, "token-a")
+        canvas_b = self.factory.get_canvas(settings.BASE_URL, "token-b")
+
+        canvas_a.get_course(1)
+        sleep.assert_not_called()
+        canvas_b.get_course(1)
+        sleep.assert_not_called()
+
+        canvas_a.get_course(1)
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], 5, places=1)
+        self.assertIs(
+            self.factory.get_budget(settings.BASE_URL, "token-a"),
+            self.factory.get_budget(settings.BASE_URL, " token-a "),
+        )
+
+    # get_session()
+    def test_get_session_cookies(self, m):
+        session = self.factory.get_session(settings.BASE_URL)
+        headers = Message()
+        headers["Set-Cookie"] = "canvas_session=secret; path=/"
+        request = requests.Request("GET", settings.BASE_URL_WITH_VERSION).prepare()
+
+        session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+        self.assertEqual(len(session.cookies), 0)
+
+    # close()
+    def test_close(self, m):
+        session = self.factory.get_session(settings.BASE_URL)
+
+        with self.factory:
+            pass
+
+        self.assertIsNot(self.factory.get_session(settings.BASE_URL), session)
+
+
+class TestRateLimitBudget(unittest.TestCase):
+    def setUp(self):
+        self.budget = RateLimitBudget(min_remaining=100, refill_rate=10, max_wait=60)
+
+    def record(self, remaining, cost=1, request_info=None):
+        response = Mock(
+            headers={
+                "X-Rate-Limit-Remaining": str(remaining),
+                "X-Request-Cost": str(cost),
+            }
+        )
+        if request_info is None:
+            request_info = {}
+        self.budget.record(request_info, response, 0.1)
+
+    # acquire()
+    @patch("canvasapi.factory.time.sleep")
+    def test_acquire_unknown(self, sleep):
+        self.budget.acquire({})
+
+        sleep.assert_not_called()
+        self.assertIsNone(self.budget.get_remaining())
+
+    @patch("canvasapi.factory.time.sleep")
+    def test_acquire_queues(self, sleep):
+        self.record(90, cost=10)
+
+        self.budget.acquire({})
+        self.budget.acquire({})
+
+        first, second = [call[0][0] for call in sleep.call_args_list]
+        self.assertAlmostEqual(first, 1, places=1)
+        self.assertAlmostEqual(second, 2, places=1)
+
+    @patch("canvasapi.factory.time.sleep")
+    def test_acquire_max_wait(self, sleep):
+        self.record(-10000)
+
+        self.budget.acquire({})
+
+        sleep.assert_called_once_with(60)
+
+    # record()
+    @patch("canvasapi.factory.time.sleep")
+    def test_record_in_flight(self, sleep):
+        self.record(200, cost=10)
+        first, second = {}, {}
+        self.budget.acquire(first)
+        self.budget.acquire(second)
+
+        # Canvas has not counted the second request yet.
+        self.record(190, cost=10, request_info=first)
+        self.assertAlmostEqual(self.budget.get_remaining(), 180, places=0)
+
+        self.record(180, cost=10, request_info=second)
+        self.assertAlmostEqual(self.budget.get_remaining(), 180, places=0)
+
+        # A request without a response releases its reservation too.
+        self.budget.acquire(first)
+        self.budget.record(first, None, 0.1)
+        self.record(180, cost=10)
+        self.assertAlmostEqual(self.budget.get_remaining(), 180, places=0)
+        sleep.assert_not_called()
+
+    def test_record_no_header(self):
+        self.budget.record({}, Mock(headers={}), 0.1)
+        self.budget.record({}, None, 0.1)
+
+        self.assertIsNone(self.budget.get_remaining())
@@ -0,0 +1,108 @@
+import json
+import unittest
+
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.exceptions import CanvasException
+from canvasapi.graphql import GraphQL
+from tests import settings
+from tests.util import register_uris
+
+CONNECTION_QUERY = """
+query ($courseId: ID!, $cursor: String) {
+  course(id: $courseId) {
+    submissionsConnection(first: 2, after: $cursor) {
+      nodes { _id score }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+
+@requests_mock.Mocker()
+class TestGraphQL(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.graphql = GraphQL(self.canvas._Canvas__requester)
+
+    # batch()
+    def test_batch(self, m):
+        register_uris({"graphql": ["batch"]}, m, base_url=settings.BASE_URL_GRAPHQL)
+
+        results = self.graphql.batch(
+            {
+                "course_1": 'course(id: "1") { name }',
+                "course_2": 'course(id: "2") { name }',
+            }
+        )
+
+        self.assertEqual(results["course_1"], {"name": "Course 1"})
+        self.assertEqual(results["course_2"], {"name": "Course 2"})
+        self.assertEqual(m.call_count, 1)
+
+        body = m.last_request.json()
+        self.assertIn('course_1: course(id: "1") { name }', body["query"])
+        self.assertIn('course_2: course(id: "2") { name }', body["query"])
+
+    def test_batch_size(self, m):
+        register_uris({"graphql": ["batch"]}, m, base_url=settings.BASE_URL_GRAPHQL)
+
+        results = self.graphql.batch(
+            {
+                "course_1": 'course(id: "1") { name }',
+                "course_2": 'course(id: "2") { name }',
+            },
+            batch_size=1,
+            max_workers=1,
+        )
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(list(results), ["course_1", "course_2"])
+
+    # execute()
+    def test_execute(self, m):
+        register_uris({"graphql": ["batch"]}, m, base_url=settings.BASE_URL_GRAPHQL)
+
+        data = self.graphql.execute(
+            "query Courses { course_1: course(id: 1) { name } }",
+            operation_name="Courses",
+            as_user_id=5,
+        )
+
+        self.assertEqual(data["course_1"], {"name": "Course 1"})
+        body = m.last_request.json()
+        self.assertEqual(body["operationName"], "Courses")
+        self.assertEqual(body["as_user_id"], 5)
+
+    def test_execute_error(self, m):
+        register_uris({"graphql": ["error"]}, m, base_url=settings.BASE_URL_GRAPHQL)
+
+        with self.assertRaises(CanvasException) as context:
+            self.graphql.execute("query { bogus }")
+
+        self.assertIn("Field 'bogus' doesn't exist", str(context.exception))
+
+    # get_connection()
+    def test_get_connection(self, m):
+        with open("tests/fixtures/graphql.json") as file:
+            fixtures = json.load(file)
+        m.post(
+            settings.BASE_URL_GRAPHQL + "graphql",
+            [
+                {"json": fixtures["connection_page_1"]["data"]},
+                {"json": fixtures["connection_page_2"]["data"]},
+            ],
+        )
+
+        df = self.graphql.get_connection(
+            CONNECTION_QUERY, "course.submissionsConnection", variables={"courseId": 1}
+        )
+
+        self.assertEqual(list(df["_id"]), ["1", "2", "3"])
+        self.assertEqual(list(df["score"]), [8.0, 9.5, 7.0])
+
+        first, second = [request.json() for request in m.request_history]
+        self.assertEqual(first["variables"], {"courseId": 1, "cursor": None})
+        self.assertEqual(second["variables"], {"courseId": 1, "cursor": "Mg"})
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+import unittest
+
+import canvasapi
+from canvasapi.lazy import LazyModule
+
+
+class TestLazyModule(unittest.TestCase):
+    def setUp(self):
+        self.module = LazyModule("json")
+
+    # __getattr__()
+    def test_getattr(self):
+        import json
+
+        self.assertIn("not loaded", repr(self.module))
+        self.assertIs(self.module.dumps, json.dumps)
+        self.assertIn("dumps", self.module.__dict__)
+        self.assertIn("(loaded)", repr(self.module))
+
+    def test_getattr_missing(self):
+        with self.assertRaises(AttributeError):
+            self.module.not_an_attribute
+
+    def test_getattr_missing_module(self):
+        with self.assertRaises(ImportError):
+            LazyModule("not_a_module").attribute
+
+    # __dir__()
+    def test_dir(self):
+        self.assertIn("loads", dir(self.module))
+
+
+class TestCanvasAPIModule(unittest.TestCase):
+    # __getattr__()
+    def test_getattr(self):
+        from canvasapi.canvas import Canvas
+        from canvasapi.course import Course
+
+        self.assertIs(canvasapi.Canvas, Canvas)
+        self.assertIs(canvasapi.course.Course, Course)
+
+    def test_getattr_missing(self):
+        with self.assertRaises(AttributeError):
+            canvasapi.not_an_attribute
+
+    # __dir__()
+    def test_dir(self):
+        self.assertTrue(
+            {"Canvas", "SnapshotStore", "course", "util"} <= set(dir(canvasapi))
+        )
+
+    # import canvasapi
+    def test_import_is_lazy(self):
+        code = (
+            "import sys\n"
+            "from canvasapi import Canvas\n"
+            "assert 'pandas' not in sys.modules\n"
+            "assert 'canvasapi.course' not in sys.modules\n"
+            "canvas = Canvas('https://example.com', 'key')\n"
+            "assert 'canvasapi.course' not in sys.modules\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
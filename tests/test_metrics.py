@@ -0,0 +1,157 @@
+import gzip
+import json
+import unittest
+from unittest.mock import patch
+
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.exceptions import CanvasException
+from canvasapi.metrics import RequestMetrics, get_endpoint_template
+from canvasapi.util import call_with_retries
+from tests import settings
+from tests.util import register_uris
+
+
+@requests_mock.Mocker()
+class TestRequestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = RequestMetrics(buckets=(1, 60))
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY, metrics=self.metrics)
+
+    # get_dataframe()
+    def test_get_dataframe(self, m):
+        register_uris({"course": ["get_by_id", "get_by_id_2"]}, m)
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1",
+            json={"id": 1, "name": "Course 1"},
+            headers={"X-Request-Cost": "0.5", "X-Rate-Limit-Remaining": "699.5"},
+        )
+
+        self.canvas.get_course(1)
+        self.canvas.get_course(1)
+        self.canvas.get_course(2)
+
+        df = self.metrics.get_dataframe()
+
+        self.assertEqual(len(df), 1)
+        row = df.iloc[0]
+        self.assertEqual(row["method"], "GET")
+        self.assertEqual(row["endpoint"], "courses/:id")
+        self.assertEqual(row["requests"], 3)
+        self.assertEqual(row["errors"], 0)
+        self.assertEqual(row["request_cost"], 1.0)
+        self.assertEqual(row["rate_limit_remaining"], 699.5)
+        self.assertGreater(row["bytes_received"], 0)
+        self.assertEqual(row["latency_le_60"], 3)
+
+    def test_get_dataframe_empty(self, m):
+        df = self.metrics.get_dataframe()
+
+        self.assertTrue(df.empty)
+        self.assertIn("latency_mean", df.columns)
+
+    # record()
+    @patch("canvasapi.util.time.sleep")
+    def test_record_retries(self, m, sleep):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1",
+            [
+                {"status_code": 503, "json": {}},
+                {"status_code": 200, "json": {"id": 1, "name": "Course 1"}},
+            ],
+        )
+
+        call_with_retries(lambda: self.canvas.get_course(1))
+
+        row = self.metrics.get_dataframe().iloc[0]
+        self.assertEqual(row["requests"], 2)
+        self.assertEqual(row["errors"], 1)
+        self.assertEqual(row["retries"], 1)
+
+    def test_record_compression(self, m):
+        canvas = Canvas(
+            settings.BASE_URL, settings.API_KEY, metrics=self.metrics, gzip_min_size=1
+        )
+        submissions = [{"id": i, "workflow_state": "graded"} for i in range(100)]
+        m.register_uri(
+            "PUT",
+            settings.BASE_URL_WITH_VERSION + "courses/1/submissions",
+            content=gzip.compress(json.dumps(submissions).encode()),
+            headers={"Content-Encoding": "gzip"},
+        )
+
+        response = canvas._Canvas__requester.request(
+            "PUT", "courses/1/submissions", json=True, submissions=submissions
+        )
+
+        self.assertEqual(response.json(), submissions)
+        self.assertEqual(m.last_request.headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            json.loads(gzip.decompress(m.last_request.body)),
+            {"submissions": submissions},
+        )
+        row = self.metrics.get_dataframe().iloc[0]
+        self.assertEqual(
+            row["bytes_sent"], len(json.dumps({"submissions": submissions}))
+        )
+        self.assertEqual(row["wire_bytes_sent"], len(m.last_request.body))
+        self.assertEqual(row["bytes_received"], len(json.dumps(submissions)))
+        self.assertLess(row["wire_bytes_received"] * 5, row["bytes_received"])
+        self.assertLess(row["wire_bytes_sent"] * 5, row["bytes_sent"])
+
+    def test_record_error(self, m):
+        register_uris({"requests": ["500"]}, m)
+
+        with self.assertRaises(CanvasException):
+            self.canvas._Canvas__requester.request("GET", "500")
+
+        row = self.metrics.get_dataframe().iloc[0]
+        self.assertEqual(row["errors"], 1)
+
+    # reset()
+    def test_reset(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+
+        self.canvas.get_course(1)
+        self.metrics.reset()
+
+        self.assertTrue(self.metrics.get_dataframe().empty)
+
+    # to_prometheus()
+    def test_to_prometheus(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+
+        self.canvas.get_course(1)
+        text = self.metrics.to_prometheus()
+
+        self.assertIn(
+            'canvasapi_requests_total{method="GET",endpoint="courses/:id"} 1', text
+        )
+        self.assertIn(
+            'canvasapi_request_duration_seconds_bucket{method="GET",endpoint="courses/:id",le="+Inf"} 1',
+            text,
+        )
+        self.assertIn("# TYPE canvasapi_request_duration_seconds histogram", text)
+        self.assertNotIn("canvasapi_rate_limit_remaining{", text)
+
+
+class TestGetEndpointTemplate(unittest.TestCase):
+    def test_get_endpoint_template(self):
+        self.assertEqual(
+            get_endpoint_template(
+                "https://example.com/api/v1/courses/1/assignments/22?include[]=rubric"
+            ),
+            "courses/:id/assignments/:id",
+        )
+        self.assertEqual(
+            get_endpoint_template(
+                "https://example.com/api/v1/courses/sis_course_id:A1/users/self"
+            ),
+            "courses/:id/users/self",
+        )
+        self.assertEqual(
+            get_endpoint_template("https://example.com/api/graphql"), "graphql"
+        )
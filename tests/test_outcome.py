@@ -1,5 +1,6 @@
 import unittest
 
+import pandas as pd
 import requests_mock
 
 from canvasapi import Canvas
@@ -483,6 +484,65 @@ class TestOutcomeGroup(unittest.TestCase):
         )
 
 
+@requests_mock.Mocker()
+class TestOutcomeGroupTree(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+
+        with requests_mock.Mocker() as m:
+            register_uris(
+                {
+                    "account": ["get_by_id"],
+                    "outcome": ["account_root_outcome_group"],
+                },
+                m,
+            )
+
+            self.account = self.canvas.get_account(1)
+            self.outcome_group = self.account.get_root_outcome_group()
+
+    # get_tree()
+    def test_get_tree(self, m):
+        register_uris(
+            {
+                "outcome": [
+                    "tree_subgroups_1",
+                    "tree_subgroups_2",
+                    "tree_subgroups_3",
+                    "tree_subgroups_4",
+                    "tree_outcomes_1",
+                    "tree_outcomes_2",
+                    "tree_outcomes_3",
+                    "tree_outcomes_4",
+                    "tree_outcome_10",
+                    "tree_outcome_11",
+                ]
+            },
+            m,
+        )
+
+        groups, links, outcomes = self.outcome_group.get_tree(max_workers=4)
+
+        self.assertEqual(list(groups.index), [1, 2, 3, 4])
+        self.assertEqual(list(groups["depth"]), [0, 1, 1, 2])
+        self.assertEqual(list(groups["path"]), ["1", "1/2", "1/3", "1/2/4"])
+        self.assertTrue(pd.isna(groups.loc[1, "parent_outcome_group_id"]))
+        self.assertEqual(groups.loc[4, "parent_outcome_group_id"], 2)
+
+        self.assertEqual(list(links["outcome_group_id"]), [2, 2, 3, 4])
+        self.assertEqual(list(links["outcome_id"]), [10, 11, 10, 11])
+        self.assertNotIn("outcome", links.columns)
+
+        self.assertEqual(list(outcomes.index), [10, 11])
+        self.assertEqual(list(outcomes["mastery_points"]), [3, 2])
+        outcome_requests = [
+            request
+            for request in m.request_history
+            if "/outcomes/" in request.path and "outcome_groups" not in request.path
+        ]
+        self.assertEqual(len(outcome_requests), 2)
+
+
 @requests_mock.Mocker()
 class TestOutcomeResult(unittest.TestCase):
     def setUp(self):
@@ -233,3 +233,55 @@ class TestPaginatedList(unittest.TestCase):
         self.assertIsInstance(pag_list, PaginatedList)
         self.assertEqual(len(list(pag_list)), 2)
         self.assertIsInstance(pag_list[0], User)
+
+    # to_dataframe()
+    def test_to_dataframe(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+
+        pag_list = PaginatedList(User, self.requester, "GET", "four_objects_two_pages")
+        df = pag_list.to_dataframe()
+
+        self.assertEqual(list(df["id"]), ["1", "2", "3", "4"])
+        self.assertFalse(pag_list._has_next())
+        self.assertEqual(m.call_count, 2)
+
+    def test_to_dataframe_concurrent(self, m):
+        register_uris(
+            {
+                "paginated_list": [
+                    "6_3_pages_last_p1",
+                    "6_3_pages_last_p2",
+                    "6_3_pages_last_p3",
+                ]
+            },
+            m,
+        )
+
+        pag_list = PaginatedList(
+            User, self.requester, "GET", "six_objects_three_pages_last"
+        )
+        df = pag_list.to_dataframe(max_workers=4)
+
+        self.assertEqual(list(df["id"]), ["1", "2", "3", "4", "5", "6"])
+        self.assertFalse(pag_list._has_next())
+        self.assertEqual(m.call_count, 3)
+
+    def test_to_dataframe_concurrent_without_last_link(self, m):
+        register_uris(
+            {"paginated_list": ["6_3_pages_p1", "6_3_pages_p2", "6_3_pages_p3"]}, m
+        )
+
+        pag_list = PaginatedList(User, self.requester, "GET", "six_objects_three_pages")
+        df = pag_list.to_dataframe(max_workers=4)
+
+        self.assertEqual(list(df["id"]), ["1", "2", "3", "4", "5", "6"])
+        self.assertEqual(m.call_count, 3)
+
+    def test_to_dataframe_concurrent_bookmarks(self, m):
+        register_uris({"paginated_list": ["empty"]}, m)
+
+        pag_list = PaginatedList(User, self.requester, "GET", "empty_list")
+        pag_list._next_url = "things?page=bookmark:abc&per_page=2"
+        pag_list._last_url = "things?page=bookmark:xyz&per_page=2"
+
+        self.assertEqual(pag_list._get_remaining_page_urls(), [])
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+from canvasapi.exceptions import CanvasException
+from canvasapi.poller import Poller
+
+
+class TestPoller(unittest.TestCase):
+    def setUp(self):
+        self.poller = Poller(interval=0)
+
+    # __init__()
+    def test_init_invalid_backoff(self):
+        with self.assertRaises(ValueError):
+            Poller(backoff=0.5)
+
+    # add()
+    def test_add(self):
+        self.poller.add("a", 0, lambda job: job + 1, lambda job: job >= 1)
+        self.poller.add("b", 0, lambda job: job + 1, lambda job: job >= 1)
+
+        self.assertEqual(len(self.poller), 2)
+
+    # wait()
+    def test_wait(self):
+        calls = []
+
+        def refresh(job):
+            calls.append(job)
+            return job + 1
+
+        self.poller.add("fast", 0, refresh, lambda job: job >= 1)
+        self.poller.add("slow", 0, refresh, lambda job: job >= 3)
+        self.poller.add("done", 5, refresh, lambda job: job >= 1)
+
+        results = self.poller.wait()
+
+        self.assertEqual(results, {"fast": 1, "slow": 3, "done": 5})
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(len(self.poller), 0)
+
+    def test_wait_backoff(self):
+        poller = Poller(interval=1, max_interval=4, backoff=2)
+        poller.add(1, 0, lambda job: job + 1, lambda job: job >= 5)
+
+        with patch("canvasapi.poller.time.sleep") as sleep:
+            poller.wait()
+
+        intervals = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(intervals, [1, 2, 4, 4, 4])
+
+    def test_wait_timeout(self):
+        poller = Poller(interval=0, timeout=0)
+        poller.add(1, 0, lambda job: job, lambda job: False)
+
+        with self.assertRaises(CanvasException):
+            poller.wait()
+
+    # wait_for()
+    def test_wait_for(self):
+        self.poller.add("other", 0, lambda job: job + 1, lambda job: job >= 1)
+
+        result = self.poller.wait_for(0, lambda job: job + 1, lambda job: job >= 2)
+
+        self.assertEqual(result, 2)
+        self.assertEqual(len(self.poller), 1)
@@ -36,3 +36,17 @@ class TestProgress(unittest.TestCase):
 
         response = self.progress.query()
         self.assertIsInstance(response, Progress)
+
+    # wait()
+    def test_wait(self, m):
+        register_uris({"progress": ["course_progress"]}, m)
+
+        progress = Progress(
+            self.canvas._Canvas__requester, {"id": 3, "workflow_state": "queued"}
+        )
+        progress = progress.wait(interval=0, include=["results"])
+
+        self.assertIsInstance(progress, Progress)
+        self.assertEqual(progress.workflow_state, "completed")
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(m.last_request.qs, {"include[]": ["results"]})
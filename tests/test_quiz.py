@@ -3,7 +3,7 @@ import unittest
 import requests_mock
 
 from canvasapi import Canvas
-from canvasapi.exceptions import RequiredFieldMissing
+from canvasapi.exceptions import CanvasException, RequiredFieldMissing
 from canvasapi.paginated_list import PaginatedList
 from canvasapi.quiz import (
     Quiz,
@@ -15,6 +15,7 @@ from canvasapi.quiz import (
     QuizSubmission,
     QuizSubmissionEvent,
     QuizSubmissionQuestion,
+    export_quizzes,
 )
 from canvasapi.quiz_group import QuizGroup
 from canvasapi.submission import Submission
@@ -230,6 +231,157 @@ class TestQuiz(unittest.TestCase):
         with self.assertRaises(RequiredFieldMissing):
             self.quiz.set_extensions([{"extra_time": 60, "extra_attempts": 3}])
 
+    # export()
+    def test_export(self, m):
+        register_uris(
+            {
+                "quiz": [
+                    "export_submissions",
+                    "export_questions_1",
+                    "export_questions_2",
+                    "export_events_1",
+                    "export_events_2",
+                    "export_statistics",
+                ]
+            },
+            m,
+        )
+
+        export = self.quiz.export(max_workers=4)
+
+        self.assertEqual(list(export["submissions"]["id"]), [1, 2])
+        self.assertEqual(list(export["submissions"]["course_id"]), [1, 1])
+
+        answers = export["answers"]
+        self.assertEqual(list(answers["quiz_submission_id"]), [1, 1, 2])
+        self.assertEqual(list(answers["id"]), [101, 102, 101])
+        self.assertEqual(list(answers["answer"]), [1001, 1004, 1002])
+        self.assertEqual(list(answers["user_id"]), [11, 11, 12])
+
+        events = export["events"]
+        self.assertEqual(list(events["quiz_submission_id"]), [1, 2, 2])
+        self.assertEqual(list(events["id"]), [201, 202, 203])
+        event_requests = [r for r in m.request_history if r.path.endswith("/events")]
+        self.assertEqual(sorted(r.qs["attempt"][0] for r in event_requests), ["1", "2"])
+
+        statistics = export["statistics"]
+        self.assertEqual(list(statistics["id"]), [101, 102])
+        self.assertEqual(list(statistics["quiz_id"]), [1, 1])
+        self.assertEqual(list(statistics["quiz_statistics_id"]), [31, 31])
+
+    def test_export_failed_request(self, m):
+        register_uris({"quiz": ["export_submissions"]}, m)
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "quiz_submissions/1/questions",
+            status_code=404,
+            json={"errors": "Not Found"},
+        )
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "quiz_submissions/2/questions",
+            [
+                {"status_code": 503, "json": {}},
+                {"json": {"quiz_submission_questions": [{"id": 101}]}},
+            ],
+        )
+
+        export = self.quiz.export(events=False, statistics=False, retry_delay=0)
+
+        self.assertEqual(list(export["answers"]["quiz_submission_id"]), [2])
+        errors = export["errors"]
+        self.assertEqual(list(errors["kind"]), ["answers"])
+        self.assertEqual(list(errors["quiz_submission_id"]), [1])
+        self.assertIn("Not Found", errors["error"][0])
+
+    def test_export_report(self, m):
+        register_uris(
+            {
+                "quiz": [
+                    "export_submissions",
+                    "export_create_report",
+                    "export_get_report",
+                ]
+            },
+            m,
+        )
+        m.register_uri(
+            "GET",
+            "https://example.com/files/50/download",
+            text="name,id,101: Question,101: Score\nA,11,B,1\nC,12,D,0\n",
+        )
+
+        export = self.quiz.export(
+            events=False, statistics=False, report=True, interval=0
+        )
+
+        self.assertNotIn("answers", export)
+        self.assertNotIn("events", export)
+        self.assertEqual(list(export["report"]["quiz_id"]), [1, 1])
+        self.assertEqual(list(export["report"]["id"]), [11, 12])
+        self.assertFalse(any("quiz_submissions/" in r.path for r in m.request_history))
+        create_request = [r for r in m.request_history if r.method == "POST"][0]
+        self.assertIn(
+            "quiz_report%5Breport_type%5D=student_analysis", create_request.body
+        )
+
+    def test_export_report_failed(self, m):
+        register_uris(
+            {
+                "quiz": [
+                    "export_submissions",
+                    "export_create_report",
+                    "export_get_report",
+                ]
+            },
+            m,
+        )
+        m.register_uri(
+            "GET",
+            "https://example.com/files/50/download",
+            text="name,id,101: Question,101: Score\nA,11,B,1\n",
+        )
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "courses/1/quizzes/2/submissions",
+            json={"quiz_submissions": []},
+        )
+        m.register_uri(
+            "POST",
+            settings.BASE_URL_WITH_VERSION + "courses/1/quizzes/2/reports",
+            [
+                {"status_code": 503, "json": {}},
+                {
+                    "json": {
+                        "id": 6,
+                        "quiz_id": 2,
+                        "file": None,
+                        "progress": {"workflow_state": "failed"},
+                    }
+                },
+            ],
+        )
+        quiz = Quiz(self.quiz._requester, {"id": 2, "course_id": 1})
+
+        export = export_quizzes(
+            [self.quiz, quiz],
+            events=False,
+            statistics=False,
+            report=True,
+            interval=0,
+            retry_delay=0,
+        )
+
+        self.assertEqual(list(export["report"]["quiz_id"]), [1])
+        errors = export["errors"]
+        self.assertEqual(list(errors["kind"]), ["report"])
+        self.assertEqual(list(errors["quiz_id"]), [2])
+        self.assertIn("quiz 2 failed", errors["error"][0])
+        create_requests = [
+            r for r in m.request_history if r.path.endswith("/quizzes/2/reports")
+        ]
+        self.assertEqual(len(create_requests), 2)
+
     # get_all_quiz_reports
     def test_get_all_quiz_reports(self, m):
         register_uris({"quiz": ["get_all_quiz_reports"]}, m)
@@ -359,6 +511,43 @@ class TestQuizReport(unittest.TestCase):
         string = str(self.quiz_report)
         self.assertIsInstance(string, str)
 
+    # get_dataframe()
+    def test_get_dataframe(self, m):
+        m.register_uri(
+            "GET",
+            "https://example.com/files/50/download",
+            text="name,id,score\nA,11,4\nB,12,5\n",
+        )
+        report = QuizReport(
+            self.canvas._Canvas__requester,
+            {
+                "id": 5,
+                "quiz_id": 1,
+                "course_id": 1,
+                "file": {"url": "https://example.com/files/50/download"},
+            },
+        )
+
+        df = report.get_dataframe(chunksize=1)
+
+        self.assertEqual(list(df["score"]), [4, 5])
+
+    def test_get_dataframe_no_file(self, m):
+        with self.assertRaises(CanvasException):
+            self.quiz_report.get_dataframe()
+
+    # wait()
+    def test_wait(self, m):
+        register_uris({"quiz": ["export_create_report", "export_get_report"]}, m)
+
+        report = self.quiz.create_report("student_analysis")
+        self.assertFalse(report._is_finished())
+
+        report = report.wait(interval=0)
+
+        self.assertEqual(report.file["url"], "https://example.com/files/50/download")
+        self.assertEqual(m.last_request.qs["include[]"], ["file", "progress"])
+
     # abort_or_delete
     def test_abort_or_delete(self, m):
         register_uris({"quiz": ["abort_or_delete_report"]}, m)
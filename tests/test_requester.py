@@ -1,7 +1,9 @@
+import gzip
 import unittest
 from datetime import datetime
-from urllib.parse import quote
+from urllib.parse import parse_qsl, quote
 
+import numpy as np
 import requests
 import requests_mock
 
@@ -27,6 +29,83 @@ class TestRequester(unittest.TestCase):
         self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
         self.requester = self.canvas._Canvas__requester
 
+    # add_hook()
+    def test_add_hook(self, m):
+        register_uris({"requests": ["get", "500"]}, m)
+        calls = []
+
+        def pre_request(request_info):
+            request_info["headers"]["X-Test"] = "1"
+            calls.append(("pre", request_info["method"], request_info["attempt"]))
+
+        def post_request(request_info, response, elapsed):
+            calls.append(("post", response.status_code, elapsed >= 0))
+
+        self.requester.add_hook("pre_request", pre_request)
+        self.requester.add_hook("post_request", post_request)
+
+        self.requester.request("GET", "fake_get_request")
+        self.assertEqual(m.last_request.headers["X-Test"], "1")
+
+        with self.assertRaises(CanvasException):
+            self.requester.request("GET", "500")
+
+        self.assertEqual(
+            calls,
+            [
+                ("pre", "GET", 0),
+                ("post", 200, True),
+                ("pre", "GET", 0),
+                ("post", 500, True),
+            ],
+        )
+
+    def test_add_hook_connection_error(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "offline",
+            exc=requests.ConnectionError,
+        )
+        responses = []
+        self.requester.add_hook(
+            "post_request",
+            lambda request_info, response, elapsed: responses.append(response),
+        )
+
+        with self.assertRaises(requests.ConnectionError):
+            self.requester.request("GET", "offline")
+
+        self.assertEqual(responses, [None])
+
+    def test_add_hook_failing_callback(self, m):
+        register_uris({"requests": ["get"]}, m)
+
+        def post_request(request_info, response, elapsed):
+            raise ValueError("broken hook")
+
+        self.requester.add_hook("post_request", post_request)
+
+        response = self.requester.request("GET", "fake_get_request")
+        self.assertEqual(response.status_code, 200)
+
+    def test_add_hook_invalid_event(self, m):
+        with self.assertRaises(ValueError):
+            self.requester.add_hook("on_request", print)
+
+    # remove_hook()
+    def test_remove_hook(self, m):
+        register_uris({"requests": ["get"]}, m)
+        calls = []
+
+        def pre_request(request_info):
+            calls.append(request_info["url"])
+
+        self.requester.add_hook("pre_request", pre_request)
+        self.requester.remove_hook("pre_request", pre_request)
+        self.requester.request("GET", "fake_get_request")
+
+        self.assertEqual(calls, [])
+
     # request()
     def test_request_get(self, m):
         register_uris({"requests": ["get"]}, m)
@@ -46,6 +125,18 @@ class TestRequester(unittest.TestCase):
         response = self.requester.request("GET", "get_binary_data")
         self.assertEqual(response.content, b"\xff\xff\xff")
 
+    def test_request_get_stream(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "get_binary_data",
+            content=b"a,b\n1,2\n",
+            status_code=200,
+            headers={},
+        )
+
+        response = self.requester.request("GET", "get_binary_data", stream=True)
+        self.assertEqual(b"".join(response.iter_content(2)), b"a,b\n1,2\n")
+
     def test_request_get_datetime(self, m):
         date = datetime.today()
 
@@ -100,6 +191,99 @@ class TestRequester(unittest.TestCase):
         response = self.requester.request("PUT", "fake_put_request")
         self.assertEqual(response.status_code, 200)
 
+    def test_request_accept_encoding(self, m):
+        register_uris({"requests": ["get"]}, m)
+
+        session = requests.Session()
+        requester = Canvas(
+            settings.BASE_URL, settings.API_KEY, session=session
+        )._Canvas__requester
+
+        requester.request("GET", "fake_get_request")
+
+        self.assertIn("gzip", m.last_request.headers["Accept-Encoding"])
+        self.assertEqual(
+            session.headers["Accept-Encoding"],
+            requests.utils.default_headers()["Accept-Encoding"],
+        )
+
+    def test_request_gzip(self, m):
+        register_uris({"requests": ["post", "put"]}, m)
+        self.requester.gzip_min_size = 100
+
+        self.requester.request("PUT", "fake_put_request", name="small")
+        self.assertNotIn("Content-Encoding", m.last_request.headers)
+
+        grade_data = [
+            ("grade_data[{}][posted_grade]".format(i), "A") for i in range(20)
+        ]
+        self.requester.request("POST", "fake_post_request", _kwargs=list(grade_data))
+
+        self.assertEqual(m.last_request.headers["Content-Encoding"], "gzip")
+        self.assertEqual(
+            m.last_request.headers["Content-Type"],
+            "application/x-www-form-urlencoded",
+        )
+        self.assertEqual(
+            parse_qsl(gzip.decompress(m.last_request.body).decode()), grade_data
+        )
+
+    def test_request_gzip_file(self, m):
+        register_uris({"requests": ["post"]}, m)
+        self.requester.gzip_min_size = 1
+
+        self.requester.request("POST", "fake_post_request", file=b"a" * 100)
+
+        self.assertNotIn("Content-Encoding", m.last_request.headers)
+
+    def test_request_json(self, m):
+        register_uris(
+            {"requests": ["get", "post", "delete", "patch", "put"]},
+            m,
+        )
+        date = datetime(2024, 1, 2, 3, 4, 5)
+
+        for method in ["GET", "POST", "DELETE", "PATCH", "PUT"]:
+            self.requester.request(
+                method,
+                "fake_{}_request".format(method.lower()),
+                json=True,
+                published=True,
+                overrides=[{"due_at": date, "student_ids": (1, 2)}],
+            )
+
+            self.assertEqual(m.last_request.headers["Content-Type"], "application/json")
+            self.assertEqual(
+                m.last_request.json(),
+                {
+                    "published": True,
+                    "overrides": [
+                        {"due_at": "2024-01-02T03:04:05", "student_ids": [1, 2]}
+                    ],
+                },
+            )
+
+    def test_request_json_numpy(self, m):
+        register_uris({"requests": ["post"]}, m)
+
+        self.requester.request(
+            "POST",
+            "fake_post_request",
+            json=True,
+            grade_data={np.int64(1): {np.int64(2): {"posted_grade": np.float64(9.5)}}},
+            ids=np.array([1, 2]),
+            published=np.bool_(True),
+        )
+
+        self.assertEqual(
+            m.last_request.json(),
+            {
+                "grade_data": {"1": {"2": {"posted_grade": 9.5}}},
+                "ids": [1, 2],
+                "published": True,
+            },
+        )
+
     def test_request_cache(self, m):
         register_uris({"requests": ["get"]}, m)
 
@@ -1,5 +1,6 @@
 import unittest
 
+import pandas as pd
 import requests_mock
 
 from canvasapi import Canvas
@@ -116,6 +117,52 @@ class TestSection(unittest.TestCase):
 
         self.assertIn("Parameter `grouped` must", cm.exception.args[0])
 
+    # bulk_enroll_users()
+    def test_bulk_enroll_users(self, m):
+        register_uris(
+            {"section": ["list_enrollments", "list_enrollments_2", "enroll_user"]}, m
+        )
+
+        enrollments = pd.DataFrame(
+            {"user_id": [1, 2], "type": "TeacherEnrollment", "notify": False}
+        )
+        report = self.section.bulk_enroll_users(enrollments)
+
+        self.assertEqual(list(report["status"]), ["enrolled", "enrolled"])
+        posts = [r for r in m.request_history if r.method == "POST"]
+        self.assertEqual(len(posts), 2)
+        self.assertTrue(all("enrollment%5Bnotify%5D=false" in r.body for r in posts))
+
+    def test_bulk_enroll_users_sis_import_without_sis_id(self, m):
+        register_uris({"section": ["list_enrollments", "list_enrollments_2"]}, m)
+
+        enrollments = pd.DataFrame({"user_id": [1], "sis_user_id": ["s1"]})
+
+        with self.assertRaises(ValueError):
+            self.section.bulk_enroll_users(
+                enrollments, sis_account=object(), sis_threshold=1
+            )
+
+    # bulk_update_grades()
+    def test_bulk_update_grades(self, m):
+        register_uris({"section": ["update_submissions"]}, m)
+        register_uris({"progress": ["course_progress"]}, m)
+
+        grades = pd.DataFrame(
+            {"user_id": [1, 2], "assignment_id": [1, 1], "grade": [97, 98]}
+        )
+        result = self.section.bulk_update_grades(grades, interval=0)
+
+        self.assertEqual(
+            m.request_history[0].json(),
+            {
+                "grade_data": {
+                    "1": {"1": {"posted_grade": 97}, "2": {"posted_grade": 98}}
+                }
+            },
+        )
+        self.assertEqual(list(result["workflow_state"]), ["completed"] * 2)
+
     def test_submissions_bulk_update(self, m):
         register_uris({"section": ["update_submissions"]}, m)
         register_uris({"progress": ["course_progress"]}, m)
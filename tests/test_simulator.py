@@ -0,0 +1,114 @@
+import unittest
+import warnings
+from unittest.mock import patch
+
+from benchmarks.simulator import CanvasSimulator, RateLimiter
+from canvasapi import Canvas
+from canvasapi.exceptions import (
+    CanvasException,
+    InvalidAccessToken,
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+)
+from canvasapi.util import call_with_retries
+
+
+class TestCanvasSimulator(unittest.TestCase):
+    def setUp(self):
+        self.simulator = CanvasSimulator(
+            courses=2, users=300, students_per_course=250, assignments_per_course=3
+        ).start()
+        self.addCleanup(self.simulator.stop)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.canvas = Canvas(self.simulator.url, "token")
+
+    # dispatch()
+    def test_dispatch_pages(self):
+        course = self.canvas.get_course(1)
+        users = course.get_users(per_page=100)
+
+        self.assertEqual(course.name, "Course 1")
+        self.assertEqual(users._last_url, "courses/1/search_users?page=3&per_page=100")
+        self.assertEqual(len(users.to_dataframe()), 250)
+
+    def test_dispatch_pages_concurrently(self):
+        self.simulator.latency = 0.02
+
+        df = (
+            self.canvas.get_course(2)
+            .get_assignment(5)
+            .get_submissions(per_page=10)
+            .to_dataframe(max_workers=4)
+        )
+
+        self.assertEqual(len(df), 250)
+        self.assertEqual(df["id"].nunique(), 250)
+        self.assertGreater(self.simulator.stats["max_concurrency"], 1)
+
+    def test_dispatch_not_found(self):
+        with self.assertRaises(ResourceDoesNotExist):
+            self.canvas.get_course(3)
+
+    def test_dispatch_no_token(self):
+        requester = self.canvas._Canvas__requester
+
+        with self.assertRaises(InvalidAccessToken):
+            requester.request("GET", "courses/1", use_auth=False)
+
+    # inject_errors()
+    @patch("canvasapi.util.time.sleep")
+    def test_inject_errors(self, sleep):
+        self.simulator.inject_errors(503, 502)
+
+        course = call_with_retries(lambda: self.canvas.get_course(1))
+
+        self.assertEqual(course.id, 1)
+        self.assertEqual(self.simulator.stats["errors"], 2)
+        self.assertEqual(self.simulator.stats["requests"], 3)
+
+    def test_error_rate(self):
+        self.simulator.error_rate = 1
+
+        with self.assertRaises(CanvasException):
+            self.canvas.get_course(1)
+
+    # reset_stats()
+    def test_reset_stats(self):
+        self.canvas.get_course(1)
+        self.simulator.reset_stats()
+
+        self.assertEqual(self.simulator.stats["requests"], 0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_rate_limit(self):
+        rate_limiter = RateLimiter(capacity=100, leak_rate=0, penalty=50)
+
+        self.assertEqual(rate_limiter.acquire("a"), 50)
+        self.assertEqual(rate_limiter.release("a", 30), 70)
+        self.assertEqual(rate_limiter.acquire("a"), 20)
+        self.assertLess(rate_limiter.acquire("a"), 0)
+        self.assertEqual(rate_limiter.acquire("b"), 50)
+
+    def test_rate_limit_exceeded(self):
+        with CanvasSimulator(
+            rate_limiter=RateLimiter(capacity=60, leak_rate=0)
+        ) as simulator:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                canvas = Canvas(simulator.url, "token")
+
+            canvas.get_course(1)
+            response = canvas._Canvas__requester._cache[0]
+            self.assertEqual(response.headers["X-Request-Cost"], "1.000")
+            self.assertEqual(response.headers["X-Rate-Limit-Remaining"], "59.000")
+
+            # Every request costs 1 and needs 50 free while in flight.
+            for _ in range(10):
+                canvas.get_course(1)
+            with self.assertRaises(RateLimitExceeded):
+                canvas.get_course(1)
+
+            self.assertEqual(simulator.stats["throttled"], 1)
@@ -1,10 +1,14 @@
+import shutil
+import tempfile
 import unittest
+import zipfile
 
+import pandas as pd
 import requests_mock
 
 from canvasapi import Canvas
 from canvasapi.progress import Progress
-from canvasapi.sis_import import SisImport
+from canvasapi.sis_import import SisImport, SisImportBuilder
 from tests import settings
 from tests.util import register_uris
 
@@ -48,3 +52,78 @@ class TestSisImportGroup(unittest.TestCase):
         self.assertEqual(restore_state_progress.context_id, self.sis_import.id)
         self.assertEqual(restore_state_progress.context_type, "SisBatch")
         self.assertEqual(restore_state_progress.tag, "sis_batch_state_restore")
+
+
+class TestSisImportBuilder(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_batches(self, builder):
+        batches = []
+        for csv_type, path in builder.build(self.directory):
+            with zipfile.ZipFile(path) as archive:
+                self.assertEqual(archive.namelist(), ["{}.csv".format(csv_type)])
+                with archive.open(archive.namelist()[0]) as csv_file:
+                    batches.append((csv_type, pd.read_csv(csv_file, dtype=str)))
+        return batches
+
+    # add()
+    def test_add_invalid_type(self):
+        with self.assertRaises(ValueError):
+            SisImportBuilder().add("students", pd.DataFrame())
+
+    def test_add_appends(self):
+        builder = SisImportBuilder()
+        builder.add("users", pd.DataFrame({"user_id": ["u1"]}))
+        builder.add("users", pd.DataFrame({"user_id": ["u2"]}))
+
+        batches = self.read_batches(builder)
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(list(batches[0][1]["user_id"]), ["u1", "u2"])
+
+    # build()
+    def test_build_orders_types(self):
+        builder = SisImportBuilder()
+        builder.add("enrollments", pd.DataFrame({"user_id": ["u1"]}))
+        builder.add("courses", pd.DataFrame({"course_id": ["c1"]}))
+        builder.add("users", pd.DataFrame({"user_id": ["u1"]}))
+        builder.add("sections", pd.DataFrame())
+
+        batches = self.read_batches(builder)
+
+        self.assertEqual(
+            [csv_type for csv_type, _ in batches], ["users", "courses", "enrollments"]
+        )
+
+    def test_build_max_rows(self):
+        builder = SisImportBuilder(max_rows=4, chunksize=3)
+        builder.add(
+            "users", pd.DataFrame({"user_id": ["u{}".format(i) for i in range(10)]})
+        )
+
+        batches = self.read_batches(builder)
+
+        self.assertEqual([len(df) for _, df in batches], [3, 3, 4])
+        combined = pd.concat([df for _, df in batches], ignore_index=True)
+        self.assertEqual(
+            list(combined["user_id"]), ["u{}".format(i) for i in range(10)]
+        )
+
+    def test_build_max_bytes(self):
+        builder = SisImportBuilder(max_bytes=40, chunksize=100)
+        builder.add(
+            "users",
+            pd.DataFrame({"user_id": ["user{:04d}".format(i) for i in range(12)]}),
+        )
+
+        batches = self.read_batches(builder)
+
+        self.assertGreater(len(batches), 1)
+        for _, df in batches:
+            self.assertLessEqual(len(df.to_csv(index=False).encode("utf-8")), 40)
+        combined = pd.concat([df for _, df in batches], ignore_index=True)
+        self.assertEqual(len(combined), 12)
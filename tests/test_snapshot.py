@@ -0,0 +1,192 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.paginated_list import PaginatedList
+from canvasapi.snapshot import SnapshotStore, pa
+from canvasapi.user import User
+from tests import settings
+from tests.util import register_uris
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+@requests_mock.Mocker()
+class TestSnapshotStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = SnapshotStore(self.directory)
+        self.canvas = Canvas(
+            settings.BASE_URL, settings.API_KEY, snapshot_store=self.store
+        )
+        self.requester = self.canvas._Canvas__requester
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get_list(self, endpoint="four_objects_two_pages", **kwargs):
+        return PaginatedList(User, self.requester, "GET", endpoint, **kwargs)
+
+    def read_metadata(self, pag_list):
+        with open(os.path.join(pag_list._snapshot_path, "_metadata.json")) as f:
+            return json.load(f)
+
+    # __init__()
+    def test_init_invalid_format(self, m):
+        with self.assertRaises(ValueError):
+            SnapshotStore(self.directory, format="csv")
+
+    # restore()
+    def test_restore(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        fetched = self.get_list().to_dataframe()
+        self.assertEqual(m.call_count, 2)
+
+        pag_list = self.get_list()
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(list(pag_list._df["id"]), list(fetched["id"]))
+        self.assertFalse(pag_list._has_next())
+
+    def test_restore_appends_pages(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        self.get_list()
+        self.assertEqual(m.call_count, 1)
+
+        pag_list = self.get_list()
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(pag_list._df), 2)
+        self.assertTrue(pag_list._has_next())
+
+        pag_list.to_dataframe()
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(len(self.read_metadata(pag_list)["parts"]), 2)
+
+        pag_list = self.get_list()
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(list(pag_list._df["name"])[-1], "object 4")
+
+    def test_restore_keyed_by_params(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        self.get_list(search_term="a")
+        self.get_list(search_term="b")
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_restore_keyed_by_client(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        other_instance = Canvas(
+            "https://other.example.com", settings.API_KEY, snapshot_store=self.store
+        )
+        other_token = Canvas(settings.BASE_URL, "other-key", snapshot_store=self.store)
+
+        self.get_list()
+        PaginatedList(
+            User, other_token._Canvas__requester, "GET", "four_objects_two_pages"
+        )
+        self.assertEqual(m.call_count, 2)
+
+        m.register_uri(
+            "GET",
+            "https://other.example.com/api/v1/four_objects_two_pages",
+            json=[{"id": 5}],
+        )
+        pag_list = PaginatedList(
+            User, other_instance._Canvas__requester, "GET", "four_objects_two_pages"
+        )
+        self.assertEqual(m.call_count, 3)
+        self.assertEqual(list(pag_list._df["id"]), [5])
+
+    def test_restore_namespace(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        store = SnapshotStore(self.directory, namespace="sync-user")
+        self.requester.snapshot_store = store
+        self.get_list()
+
+        rotated = Canvas(settings.BASE_URL, "rotated-key", snapshot_store=store)
+        pag_list = PaginatedList(
+            User, rotated._Canvas__requester, "GET", "four_objects_two_pages"
+        )
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(len(pag_list._df), 2)
+
+    def test_restore_stale(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        self.requester.snapshot_store = SnapshotStore(
+            self.directory, max_age=timedelta(0)
+        )
+        self.get_list()
+        self.get_list()
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_restore_parquet(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+        self.requester.snapshot_store = SnapshotStore(self.directory, format="parquet")
+        self.get_list().to_dataframe()
+
+        pag_list = self.get_list()
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(len(pag_list._df), 4)
+
+    def test_restore_nested_columns(self, m):
+        m.register_uri(
+            "GET",
+            settings.BASE_URL_WITH_VERSION + "nested",
+            json=[
+                {"id": 1, "user": {"id": 1, "name": "a"}, "grade": 5},
+                {
+                    "id": 2,
+                    "user": {"id": 2, "sortable_name": "b"},
+                    "tags": [1, 2],
+                    "grade": "A",
+                },
+            ],
+        )
+        fetched = self.get_list("nested")._df
+
+        pag_list = self.get_list("nested")
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(pag_list._df["user"][1], fetched["user"][1])
+        self.assertEqual(list(pag_list._df["tags"][1]), [1, 2])
+        self.assertEqual(list(pag_list._df["grade"]), [5, "A"])
+
+    # is_stored()
+    def test_is_stored(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1"]}, m)
+        self.requester.snapshot_store = SnapshotStore(
+            self.directory, endpoints=[r"^courses/\d+/users"]
+        )
+
+        self.get_list()
+        self.get_list()
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_is_stored_not_get(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1"]}, m)
+        PaginatedList(User, self.requester, "PUT", "four_objects_two_pages")
+
+        self.assertEqual(os.listdir(self.directory), [])
+
+    # clear()
+    def test_clear(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1"]}, m)
+        pag_list = self.get_list()
+
+        self.store.clear(pag_list)
+        self.get_list()
+
+        self.assertEqual(m.call_count, 2)
+
+        self.store.clear()
+        self.assertFalse(os.path.exists(self.directory))
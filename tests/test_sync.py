@@ -0,0 +1,175 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import timedelta
+
+import pandas as pd
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.course import Course
+from canvasapi.sync import DeltaSync
+from tests import settings
+from tests.util import register_uris
+
+
+@requests_mock.Mocker()
+class TestDeltaSync(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.directory = tempfile.mkdtemp()
+        self.sync = DeltaSync(self.directory, overlap=timedelta(0))
+
+        with requests_mock.Mocker() as m:
+            register_uris({"course": ["get_by_id"]}, m)
+            self.course = self.canvas.get_course(1)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    # get_key()
+    def test_get_key(self, m):
+        key = self.sync.get_key(self.course.get_enrollments)
+        client, key = key.split("/", 1)
+        self.assertEqual(len(client), 16)
+        self.assertEqual(key, "Course/1/get_enrollments")
+
+        key = self.sync.get_key(self.course.get_enrollments, type=["StudentEnrollment"])
+        self.assertEqual(
+            key.split("/", 1)[1],
+            'Course/1/get_enrollments/{"type": ["StudentEnrollment"]}',
+        )
+
+    def test_get_key_by_client(self, m):
+        key = self.sync.get_key(self.course.get_enrollments)
+
+        # Another token on the same instance.
+        canvas = Canvas(settings.BASE_URL, "other-token")
+        course = Course(canvas._Canvas__requester, {"id": 1})
+        self.assertNotEqual(self.sync.get_key(course.get_enrollments), key)
+
+        # The same token on another instance.
+        canvas = Canvas("https://other.example.com", settings.API_KEY)
+        course = Course(canvas._Canvas__requester, {"id": 1})
+        self.assertNotEqual(self.sync.get_key(course.get_enrollments), key)
+
+    def test_get_key_namespace(self, m):
+        sync = DeltaSync(self.directory, namespace="warehouse")
+        key = sync.get_key(self.course.get_enrollments)
+
+        canvas = Canvas(settings.BASE_URL, "rotated-token")
+        course = Course(canvas._Canvas__requester, {"id": 1})
+        self.assertEqual(sync.get_key(course.get_enrollments), key)
+
+    # load()
+    def test_load_never_synced(self, m):
+        self.assertTrue(self.sync.load(self.course.get_grade_change_events).empty)
+
+    # reset()
+    def test_reset(self, m):
+        register_uris({"sync": ["grade_change_events_initial"]}, m)
+        self.sync.sync(self.course.get_grade_change_events)
+
+        self.sync.reset(self.course.get_grade_change_events)
+
+        self.assertTrue(self.sync.load(self.course.get_grade_change_events).empty)
+        self.assertEqual(self.sync.state, {})
+
+    # sync()
+    def test_sync_start_time(self, m):
+        register_uris({"sync": ["grade_change_events_initial"]}, m)
+
+        df = self.sync.sync(self.course.get_grade_change_events)
+
+        self.assertEqual(list(df["id"]), ["a1", "a2"])
+        self.assertNotIn("start_time", m.last_request.qs)
+
+        register_uris({"sync": ["grade_change_events_delta"]}, m)
+
+        df = self.sync.sync(self.course.get_grade_change_events)
+
+        self.assertEqual(m.last_request.qs["start_time"], ["2024-01-02t10:00:00+00:00"])
+        self.assertEqual(list(df["id"]), ["a1", "a2", "a3"])
+
+        with open(os.path.join(self.directory, "state.json")) as state_file:
+            state = json.load(state_file)
+        self.assertEqual(
+            state[self.sync.get_key(self.course.get_grade_change_events)],
+            {"start_time": "2024-01-03T10:00:00+00:00"},
+        )
+
+    def test_sync_persists_between_instances(self, m):
+        register_uris({"sync": ["grade_change_events_initial"]}, m)
+        self.sync.sync(self.course.get_grade_change_events)
+
+        sync = DeltaSync(self.directory)
+
+        self.assertEqual(len(sync.load(self.course.get_grade_change_events)), 2)
+        self.assertIn(
+            self.sync.get_key(self.course.get_grade_change_events), sync.state
+        )
+
+    def test_sync_multiple_since_params(self, m):
+        register_uris({"sync": ["submissions_initial"]}, m)
+        before = pd.Timestamp.now(tz="UTC")
+
+        df = self.sync.sync(self.course.get_multiple_submissions, student_ids=["all"])
+
+        self.assertEqual(len(df), 2)
+        key = self.sync.get_key(
+            self.course.get_multiple_submissions, student_ids=["all"]
+        )
+        marks = self.sync.state[key]
+        self.assertEqual(marks["submitted_since"], "2024-01-02T10:00:00+00:00")
+        # No submission is graded yet, so grading is tracked from this sync.
+        graded_since = marks["graded_since"]
+        self.assertGreaterEqual(pd.Timestamp(graded_since), before)
+
+        register_uris({"sync": ["submissions_delta"]}, m)
+
+        df = self.sync.sync(self.course.get_multiple_submissions, student_ids=["all"])
+
+        queries = [request.qs for request in m.request_history[-2:]]
+        self.assertEqual(queries[0]["submitted_since"], ["2024-01-02t10:00:00+00:00"])
+        self.assertIn("graded_since", queries[1])
+        self.assertEqual(list(df["id"]), [1, 2])
+        self.assertEqual(list(df["score"])[1], 8)
+        self.assertEqual(
+            self.sync.state[key],
+            {
+                "submitted_since": "2024-01-02T10:00:00+00:00",
+                "graded_since": graded_since,
+            },
+        )
+
+    def test_sync_request_count(self, m):
+        register_uris({"sync": ["submissions_initial"]}, m)
+
+        self.sync.sync(self.course.get_multiple_submissions, student_ids=["all"])
+
+        self.assertEqual(m.call_count, 1)
+        self.assertNotIn("submitted_since", m.last_request.qs)
+        self.assertNotIn("graded_since", m.last_request.qs)
+
+        self.sync.sync(self.course.get_multiple_submissions, student_ids=["all"])
+
+        self.assertEqual(m.call_count, 3)
+        for request in m.request_history[1:]:
+            self.assertEqual(
+                len({"submitted_since", "graded_since"} & set(request.qs)), 1
+            )
+
+    def test_sync_custom_since(self, m):
+        register_uris({"sync": ["grade_change_events_initial"]}, m)
+
+        self.sync.sync(
+            self.course.get_grade_change_events,
+            since={"start_time": "created_at"},
+            primary_key=["id"],
+        )
+
+        self.assertIn(
+            self.sync.get_key(self.course.get_grade_change_events), self.sync.state
+        )
@@ -0,0 +1,171 @@
+import unittest
+from unittest.mock import patch
+
+import requests_mock
+
+from canvasapi import Canvas
+from canvasapi.exceptions import ResourceDoesNotExist
+from canvasapi.paginated_list import PaginatedList
+from canvasapi.tracing import (
+    NO_OP_SPAN,
+    InMemoryExporter,
+    NoOpTracer,
+    Tracer,
+    disable_tracing,
+    enable_tracing,
+    get_current_span,
+    get_tracer,
+    is_tracing_enabled,
+)
+from canvasapi.user import User
+from tests import settings
+from tests.util import register_uris
+
+
+class TestNoOpTracer(unittest.TestCase):
+    def test_start_span(self):
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+
+        with get_tracer().start_span("noop", key="value") as span:
+            self.assertIs(span, NO_OP_SPAN)
+            span.set_attribute("rows", 1)
+
+        self.assertIsNone(get_current_span())
+
+    @requests_mock.Mocker()
+    def test_request_untraced(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+        canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+
+        self.assertFalse(is_tracing_enabled())
+        with patch("canvasapi.requester.get_endpoint_template") as template:
+            canvas.get_course(1)
+
+        template.assert_not_called()
+
+
+@requests_mock.Mocker()
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Canvas(settings.BASE_URL, settings.API_KEY)
+        self.requester = self.canvas._Canvas__requester
+        self.exporter = InMemoryExporter()
+        enable_tracing(Tracer(self.exporter))
+
+    def tearDown(self):
+        disable_tracing()
+
+    # disable_tracing()
+    def test_disable_tracing(self, m):
+        register_uris({"course": ["get_by_id"]}, m)
+        self.assertTrue(is_tracing_enabled())
+
+        disable_tracing()
+        self.canvas.get_course(1)
+
+        self.assertEqual(self.exporter.spans, [])
+        self.assertIsInstance(get_tracer(), NoOpTracer)
+
+    # enable_tracing()
+    def test_enable_tracing_method(self, m):
+        register_uris({"course": ["get_by_id", "get_assignment_by_id"]}, m)
+
+        course = self.canvas.get_course(1)
+        course.get_assignment(1)
+
+        spans = {span.name: span for span in self.exporter.spans}
+        self.assertEqual(len(self.exporter.spans), 4)
+
+        get_course = spans["Canvas.get_course"]
+        get_assignment = spans["Course.get_assignment"]
+        self.assertIsNone(get_course.parent_id)
+        self.assertEqual(get_assignment.attributes["object_id"], 1)
+
+        http_spans = [span for span in self.exporter.spans if span.name == "HTTP GET"]
+        self.assertEqual(http_spans[0].parent_id, get_course.span_id)
+        self.assertEqual(http_spans[0].attributes["endpoint"], "courses/:id")
+        self.assertEqual(http_spans[0].attributes["status_code"], 200)
+        self.assertEqual(http_spans[1].parent_id, get_assignment.span_id)
+        self.assertEqual(
+            http_spans[1].attributes["endpoint"], "courses/:id/assignments/:id"
+        )
+
+    def test_enable_tracing_error(self, m):
+        register_uris({"generic": ["not_found"]}, m)
+
+        with self.assertRaises(ResourceDoesNotExist):
+            self.canvas.get_course(1)
+
+        span = self.exporter.spans[-1]
+        self.assertEqual(span.name, "Canvas.get_course")
+        self.assertEqual(span.status, "error")
+        self.assertIn("ResourceDoesNotExist", span.error)
+
+    def test_enable_tracing_pages(self, m):
+        register_uris({"paginated_list": ["4_2_pages_p1", "4_2_pages_p2"]}, m)
+
+        PaginatedList(
+            User, self.requester, "GET", "four_objects_two_pages"
+        ).to_dataframe()
+
+        pages = [
+            span for span in self.exporter.spans if span.name == "PaginatedList page"
+        ]
+        self.assertEqual([span.attributes["page"] for span in pages], [1, 2])
+        self.assertEqual([span.attributes["rows"] for span in pages], [2, 2])
+        self.assertEqual(pages[0].attributes["endpoint"], "four_objects_two_pages")
+        self.assertGreaterEqual(pages[0].attributes["dataframe_seconds"], 0)
+
+        http_parents = [
+            span.parent_id for span in self.exporter.spans if span.name == "HTTP GET"
+        ]
+        self.assertEqual(http_parents, [span.span_id for span in pages])
+
+    def test_enable_tracing_pages_concurrently(self, m):
+        register_uris(
+            {
+                "paginated_list": [
+                    "6_3_pages_last_p1",
+                    "6_3_pages_last_p2",
+                    "6_3_pages_last_p3",
+                ]
+            },
+            m,
+        )
+
+        with get_tracer().start_span("export") as export:
+            PaginatedList(
+                User, self.requester, "GET", "six_objects_three_pages_last"
+            ).to_dataframe(max_workers=2)
+
+        pages = [
+            span for span in self.exporter.spans if span.name == "PaginatedList page"
+        ]
+        self.assertEqual(sorted(span.attributes["page"] for span in pages), [1, 2, 3])
+        self.assertTrue(all(span.parent_id == export.span_id for span in pages))
+
+        page_ids = {span.span_id for span in pages}
+        http_spans = [span for span in self.exporter.spans if span.name == "HTTP GET"]
+        self.assertEqual(len(http_spans), 3)
+        self.assertTrue(all(span.parent_id in page_ids for span in http_spans))
+
+
+class TestInMemoryExporter(unittest.TestCase):
+    def test_get_dataframe(self):
+        exporter = InMemoryExporter()
+        tracer = Tracer(exporter)
+
+        with tracer.start_span("outer", endpoint="courses/:id"):
+            with tracer.start_span("inner", page=1):
+                pass
+
+        df = exporter.get_dataframe()
+
+        self.assertEqual(list(df["name"]), ["inner", "outer"])
+        self.assertEqual(df["parent_id"][0], df["span_id"][1])
+        self.assertEqual(df["trace_id"][0], df["trace_id"][1])
+        self.assertEqual(df["endpoint"][1], "courses/:id")
+        self.assertTrue((df["duration"] >= 0).all())
+
+        exporter.clear()
+        self.assertEqual(exporter.spans, [])
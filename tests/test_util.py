@@ -1,26 +1,108 @@
+import datetime
+import random
 import unittest
 import uuid
 from itertools import chain
+from unittest.mock import patch
 
+import requests
 import requests_mock
 
 from canvasapi import Canvas
 from canvasapi.course import CourseNickname
+from canvasapi.exceptions import (
+    BadRequest,
+    CanvasException,
+    RateLimitExceeded,
+    ResourceDoesNotExist,
+)
 from canvasapi.user import User
 from canvasapi.util import (
+    call_with_retries,
     clean_headers,
     combine_kwargs,
     file_or_path,
+    flatten_kwarg,
     get_institution_url,
     is_multivalued,
+    is_transient_error,
     normalize_bool,
     obj_or_id,
     obj_or_str,
+    run_concurrently,
+    stream_csv,
 )
 from tests import settings
 from tests.util import cleanup_file, register_uris
 
 
+def reference_combine_kwargs(**kwargs):
+    """
+    The recursive implementation of :func:`canvasapi.util.combine_kwargs`
+    the optimized one has to match.
+    """
+    combined_kwargs = []
+    for kw, arg in kwargs.items():
+        if isinstance(arg, dict):
+            for k, v in arg.items():
+                for tup in reference_flatten_kwarg(k, v):
+                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
+        elif is_multivalued(arg):
+            for i in arg:
+                for tup in reference_flatten_kwarg("", i):
+                    combined_kwargs.append(("{}{}".format(kw, tup[0]), tup[1]))
+        else:
+            combined_kwargs.append((str(kw), arg))
+    return combined_kwargs
+
+
+def reference_flatten_kwarg(key, obj):
+    if isinstance(obj, dict):
+        new_list = []
+        for k, v in obj.items():
+            for tup in reference_flatten_kwarg(k, v):
+                new_list.append(("[{}]{}".format(key, tup[0]), tup[1]))
+        return new_list
+    elif is_multivalued(obj):
+        new_list = []
+        for i in obj:
+            for tup in reference_flatten_kwarg(key + "][", i):
+                new_list.append((tup[0], tup[1]))
+        return new_list
+    else:
+        return [("[{}]".format(str(key)), obj)]
+
+
+def random_payload(rng, depth=0):
+    """
+    Build a random mix of dicts, lists, tuples, generators and scalars.
+    Call it again with a generator seeded the same to get an equal
+    payload, as generators can only be consumed once.
+    """
+    kind = rng.choice(["scalar", "scalar", "dict", "list", "tuple", "generator"])
+    if depth >= 4 or kind == "scalar":
+        return rng.choice(
+            [
+                rng.randint(-5, 5),
+                rng.random(),
+                True,
+                None,
+                "text",
+                b"bytes",
+                datetime.date(2024, 1, rng.randint(1, 28)),
+            ]
+        )
+
+    items = [random_payload(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    if kind == "dict":
+        return {"key{}".format(i): item for i, item in enumerate(items)}
+    elif kind == "list":
+        return items
+    elif kind == "tuple":
+        return tuple(items)
+    return (item for item in items)
+
+
 @requests_mock.Mocker()
 class TestUtil(unittest.TestCase):
     def setUp(self):
@@ -375,6 +457,51 @@ class TestUtil(unittest.TestCase):
             < result.index(("dict_list[key][]", "item2"))
         )
 
+    def test_combine_kwargs_matches_reference(self, m):
+        for seed in range(500):
+            rng = random.Random(seed)
+            kwargs = {"kwarg{}".format(i): random_payload(rng) for i in range(3)}
+            rng = random.Random(seed)
+            expected = {"kwarg{}".format(i): random_payload(rng) for i in range(3)}
+
+            self.assertEqual(
+                combine_kwargs(**kwargs),
+                reference_combine_kwargs(**expected),
+                "seed {}".format(seed),
+            )
+
+    def test_combine_kwargs_dict_of_scalars(self, m):
+        grade_data = {user_id: "A" for user_id in range(100)}
+        grade_data["comment"] = None
+
+        self.assertEqual(
+            combine_kwargs(grade_data=grade_data),
+            reference_combine_kwargs(grade_data=grade_data),
+        )
+
+    def test_combine_kwargs_int_keys(self, m):
+        grade_data = {1: {"posted_grade": 10}, 2: {"excuse": True}, 3: []}
+
+        self.assertEqual(
+            combine_kwargs(grade_data=grade_data),
+            [
+                ("grade_data[1][posted_grade]", 10),
+                ("grade_data[2][excuse]", True),
+            ],
+        )
+
+        with self.assertRaises(TypeError):
+            combine_kwargs(grade_data={1: [10]})
+
+    # flatten_kwarg()
+    def test_flatten_kwarg_matches_reference(self, m):
+        for seed in range(500):
+            self.assertEqual(
+                flatten_kwarg("key", random_payload(random.Random(seed))),
+                reference_flatten_kwarg("key", random_payload(random.Random(seed))),
+                "seed {}".format(seed),
+            )
+
     # obj_or_id()
     def test_obj_or_id_int(self, m):
         user_id = obj_or_id(1, "user_id", (User,))
@@ -572,3 +699,99 @@ class TestUtil(unittest.TestCase):
 
         cleaned_headers = clean_headers(headers)
         self.assertEqual(cleaned_headers["Authorization"], "****3,45")
+
+    # stream_csv()
+    def test_stream_csv(self, m):
+        m.register_uri(
+            "GET", "https://example.com/report.csv", text="id,name\n1,a\n2,b\n3,c\n"
+        )
+
+        requester = self.canvas._Canvas__requester
+        chunks = list(stream_csv(requester, "https://example.com/report.csv", 2))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(list(chunks[0].columns), ["id", "name"])
+
+    def test_stream_csv_empty(self, m):
+        m.register_uri("GET", "https://example.com/report.csv", text="")
+
+        requester = self.canvas._Canvas__requester
+        chunks = list(stream_csv(requester, "https://example.com/report.csv"))
+
+        self.assertEqual(chunks, [])
+
+    # call_with_retries()
+    @patch("canvasapi.util.time.sleep")
+    def test_call_with_retries(self, m, sleep):
+        results = [CanvasException("Encountered an error: status code 502"), "done"]
+
+        def func():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        self.assertEqual(call_with_retries(func, delay=2), "done")
+        sleep.assert_called_once_with(2)
+
+    @patch("canvasapi.util.time.sleep")
+    def test_call_with_retries_gives_up(self, m, sleep):
+        def func():
+            raise RateLimitExceeded("Rate Limit Exceeded")
+
+        with self.assertRaises(RateLimitExceeded):
+            call_with_retries(func, retries=2, delay=1, backoff=3)
+
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1, 3])
+
+    @patch("canvasapi.util.time.sleep")
+    def test_call_with_retries_client_error(self, m, sleep):
+        def func():
+            raise ResourceDoesNotExist("Not Found")
+
+        with self.assertRaises(ResourceDoesNotExist):
+            call_with_retries(func)
+
+        sleep.assert_not_called()
+
+    # is_transient_error()
+    def test_is_transient_error(self, m):
+        self.assertTrue(is_transient_error(RateLimitExceeded("")))
+        self.assertTrue(is_transient_error(CanvasException("")))
+        self.assertTrue(is_transient_error(requests.ConnectionError()))
+        self.assertFalse(is_transient_error(BadRequest("")))
+        self.assertFalse(is_transient_error(ValueError()))
+
+    # run_concurrently()
+    def test_run_concurrently(self, m):
+        results = run_concurrently(lambda x: x * 2, range(10), max_workers=3)
+
+        self.assertEqual(results, [x * 2 for x in range(10)])
+
+    def test_run_concurrently_serial(self, m):
+        results = run_concurrently(lambda x: x + 1, [1, 2], max_workers=1)
+
+        self.assertEqual(results, [2, 3])
+
+    def test_run_concurrently_raises(self, m):
+        def func(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+
+        with self.assertRaises(ValueError):
+            run_concurrently(func, [1, 2, 3], max_workers=2)
+
+    def test_run_concurrently_return_exceptions(self, m):
+        def func(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+
+        results = run_concurrently(
+            func, [1, 2, 3], max_workers=2, return_exceptions=True
+        )
+
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 3)